@@ -0,0 +1 @@
+"""포켓몬 지뢰찾기 보조 모듈 모음 (자원 로딩 등)."""
@@ -0,0 +1,191 @@
+"""1세대 포켓몬 스프라이트 전부를 묶은 아틀라스 파일.
+
+네트워크가 없는 키오스크용. 스프라이트 151장과 깃발(master-ball) 아이콘을
+PNG 한 장에 격자로 붙이고, 앞부분에 작은 인덱스(번호, 위치, 이름)를 둔다.
+실행 시에는 파일을 mmap으로 열어 PNG를 한 번만 디코딩하고 필요한
+칸만 잘라 쓴다.
+
+파일 구조 (little-endian):
+    헤더     MAGIC, 버전, 항목 수, 이름 영역 길이, PNG 길이
+    항목     (번호, x, y, 가로, 세로, 이름 위치, 이름 길이) × 항목 수
+    이름     UTF-8 이름(한글, 없으면 영문)을 이어 붙인 것
+    PNG      격자 이미지
+
+만들기 (설치할 때 한 번, PokeAPI에 약 300번 요청):
+    python -m line530.atlas build [-o 경로] [--api-base URL --sprite-base URL]
+
+아틀라스는 저장소에 넣지 않는다. 찾는 순서는 LINE530_ATLAS가 있으면 그 경로만,
+없으면 패키지 data -> 사용자 캐시($XDG_CACHE_HOME/line530/gen1.atlas, 패키지
+폴더에 쓸 수 없을 때 ``-o``로 여기에 만든다).
+"""
+import mmap
+import os
+import struct
+from io import BytesIO
+
+from line530.cache import user_cache_dir
+
+MAGIC = b'L530ATL\x00'
+VERSION = 1
+HEADER = struct.Struct('<8sHHII')
+ENTRY = struct.Struct('<HHHHHHH')
+FLAG_ID = 0  # 깃발 아이콘은 0번 항목
+
+PACKAGED_ATLAS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'gen1.atlas')
+USER_ATLAS_PATH = os.path.join(user_cache_dir(), 'gen1.atlas')
+_ENV_ATLAS_PATH = os.environ.get('LINE530_ATLAS')
+DEFAULT_ATLAS_PATH = _ENV_ATLAS_PATH or PACKAGED_ATLAS_PATH          # build 명령의 기본 출력
+ATLAS_SEARCH_PATHS = (_ENV_ATLAS_PATH,) if _ENV_ATLAS_PATH else (PACKAGED_ATLAS_PATH, USER_ATLAS_PATH)
+
+
+class AtlasError(Exception):
+    """아틀라스 파일 형식이 맞지 않음."""
+
+
+class SpriteAtlas:
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, names_size, png_size = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise AtlasError(f"{path}: 아틀라스 파일이 아닙니다")
+
+        entries_at = HEADER.size
+        names_at = entries_at + ENTRY.size * count
+        self._png_at = names_at + names_size
+        self._png_size = png_size
+        names = self._mm[names_at:self._png_at]
+
+        # 번호 -> (x, y, 가로, 세로, 이름)
+        self._entries = {}
+        for i in range(count):
+            poke_id, x, y, w, h, name_at, name_len = ENTRY.unpack_from(self._mm, entries_at + i * ENTRY.size)
+            name = names[name_at:name_at + name_len].decode('utf-8')
+            self._entries[poke_id] = (x, y, w, h, name)
+        self._sheet = None
+
+    @classmethod
+    def open_default(cls):
+        """ATLAS_SEARCH_PATHS에서 처음 열리는 아틀라스. 없거나 모두 깨졌으면 None."""
+        for path in ATLAS_SEARCH_PATHS:
+            if not os.path.exists(path):
+                continue
+            try:
+                return cls(path)
+            except (OSError, ValueError, struct.error, AtlasError) as e:
+                print(f"Warning: Could not open sprite atlas: {e}")
+        return None
+
+    def close(self):
+        self._mm.close()
+
+    # ---------------- 조회 -----------------
+    def pokemon_ids(self):
+        return [poke_id for poke_id in self._entries if poke_id != FLAG_ID]
+
+    def has_flag(self):
+        return FLAG_ID in self._entries
+
+    def name(self, poke_id):
+        return self._entries[poke_id][4]
+
+    def _decode_sheet(self):
+        if self._sheet is None:
+            from PIL import Image
+            self._sheet = Image.open(BytesIO(self._mm[self._png_at:self._png_at + self._png_size]))
+            self._sheet.load()
+        return self._sheet
+
+    def image(self, poke_id):
+        """poke_id 칸을 잘라낸 Pillow 이미지. 전체 PNG는 처음 한 번만 디코딩한다."""
+        x, y, w, h = self._entries[poke_id][:4]
+        return self._decode_sheet().crop((x, y, x + w, y + h))
+
+
+# ---------------- 빌드 -----------------
+def pack(entries, flag=None, columns=16):
+    """[(번호, 이름, Pillow 이미지), ...] 를 아틀라스 bytes로 묶는다."""
+    from PIL import Image
+
+    items = list(entries)
+    if flag is not None:
+        items.insert(0, (FLAG_ID, 'master-ball', flag))
+    if not items:
+        raise AtlasError("묶을 스프라이트가 없습니다")
+
+    cell_w = max(img.width for *_, img in items)
+    cell_h = max(img.height for *_, img in items)
+    rows = (len(items) + columns - 1) // columns
+    sheet = Image.new('RGBA', (cell_w * min(columns, len(items)), cell_h * rows), (0, 0, 0, 0))
+
+    records = []
+    names = bytearray()
+    for i, (poke_id, name, img) in enumerate(items):
+        x, y = (i % columns) * cell_w, (i // columns) * cell_h
+        sheet.paste(img.convert('RGBA'), (x, y))
+        label = name.encode('utf-8')
+        records.append(ENTRY.pack(int(poke_id), x, y, img.width, img.height, len(names), len(label)))
+        names += label
+
+    png = BytesIO()
+    sheet.save(png, 'PNG', optimize=True)
+    png = png.getvalue()
+    return HEADER.pack(MAGIC, VERSION, len(items), len(names), len(png)) + b''.join(records) + bytes(names) + png
+
+
+def build(path=DEFAULT_ATLAS_PATH, fetcher=None):
+    """PokeAPI(또는 LINE530_API_BASE)에서 1세대 전부를 받아 아틀라스를 만든다."""
+    from PIL import Image
+
+    from line530.cache import SpriteCache
+    from line530.fetch import AssetFetcher
+
+    if fetcher is None:
+        with AssetFetcher(cache=SpriteCache()) as fetcher:
+            flag_data, roster = fetcher.fetch_all()
+    else:
+        flag_data, roster = fetcher.fetch_all()
+    print(f"[아틀라스] {fetcher.stats.summary()}")
+
+    entries = []
+    for poke_id, kor_name, sprite in sorted(roster, key=lambda item: int(item[0])):
+        entries.append((int(poke_id), kor_name, Image.open(BytesIO(sprite))))
+    flag = Image.open(BytesIO(flag_data)) if flag_data is not None else None
+
+    data = pack(entries, flag)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    print(f"[아틀라스] {path}: 포켓몬 {len(entries)}마리, {len(data) / 1024:.1f} KiB")
+    return path
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m line530.atlas", description="스프라이트 아틀라스 도구")
+    sub = parser.add_subparsers(dest='command', required=True)
+    build_parser = sub.add_parser('build', help="PokeAPI에서 받아 아틀라스 파일 만들기")
+    build_parser.add_argument('-o', '--output', default=DEFAULT_ATLAS_PATH,
+                              help=f"출력 경로 (패키지 폴더에 쓸 수 없으면 {USER_ATLAS_PATH})")
+    build_parser.add_argument('--api-base', help="PokeAPI 주소 (로컬 미러 서버 등, 기본: LINE530_API_BASE)")
+    build_parser.add_argument('--sprite-base', help="스프라이트 주소 (기본: LINE530_SPRITE_BASE)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        if args.api_base or args.sprite_base:
+            from line530.cache import SpriteCache
+            from line530.fetch import API_BASE, SPRITE_BASE, AssetFetcher
+            with AssetFetcher(args.api_base or API_BASE, args.sprite_base or SPRITE_BASE,
+                              cache=SpriteCache()) as fetcher:
+                build(args.output, fetcher=fetcher)
+        else:
+            build(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""NumPy로 보드 여러 개를 한 번에 만드는 배치 생성기 (시뮬레이션, 벤치마크용).
+
+K개의 보드를 (K, N, N) 배열로 만든다.
+    mines   uint8, 1이면 지뢰
+    counts  int8, 주변 지뢰 수 (지뢰 칸 자신은 -1, board.neighbour_counts와 같음)
+
+지뢰 자리는 보드마다 후보 칸(첫 클릭 3x3 제외)에 난수 키를 하나씩 주고
+키가 가장 작은 칸들을 고른다. 같은 seed면 reference_board()로 한 판씩
+파이썬으로 만든 결과와 똑같다.
+
+numpy가 필요하다 (pip install 'line530[batch]' 또는 pip install numpy).
+게임 자체는 numpy 없이 동작한다.
+"""
+import time
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "line530.batch에는 numpy가 필요합니다: pip install 'line530[batch]' (또는 pip install numpy)"
+    ) from e
+
+from line530 import board
+
+CHUNK_BOARDS = 1024   # 한 번에 난수를 뽑는 보드 수 (메모리 제한)
+
+
+def safe_zone_mask(board_size, safe_row, safe_col):
+    """첫 클릭 주변 3x3이 True인 (N, N) bool 배열."""
+    mask = np.zeros((board_size, board_size), dtype=bool)
+    mask[max(safe_row - 1, 0):safe_row + 2, max(safe_col - 1, 0):safe_col + 2] = True
+    return mask
+
+
+def neighbour_counts(mines):
+    """(K, N, N) 지뢰 배열 -> 주변 지뢰 수 (지뢰 칸은 -1). 3x3 합을 9번의 밀기로 계산."""
+    k, n, _ = mines.shape
+    padded = np.zeros((k, n + 2, n + 2), dtype=np.int8)
+    padded[:, 1:-1, 1:-1] = mines
+    counts = np.zeros((k, n, n), dtype=np.int8)
+    for dr in range(3):
+        for dc in range(3):
+            if dr != 1 or dc != 1:
+                counts += padded[:, dr:dr + n, dc:dc + n]
+    counts[mines.astype(bool)] = -1
+    return counts
+
+
+def generate_boards(count, board_size, num_mines, safe_row, safe_col, seed=None):
+    """count개의 보드를 만든다. (mines, counts) 를 돌려준다 (모양은 위 설명 참고).
+
+    놓을 자리가 모자라면 board.place_mines처럼 가능한 만큼만 놓는다.
+    """
+    rng = np.random.default_rng(seed)
+    candidates = np.flatnonzero(~safe_zone_mask(board_size, safe_row, safe_col))
+    num_mines = min(num_mines, len(candidates))
+    cells = board_size * board_size
+
+    mines = np.zeros((count, cells), dtype=np.uint8)
+    for start in range(0, count, CHUNK_BOARDS):
+        stop = min(start + CHUNK_BOARDS, count)
+        keys = rng.random((stop - start, len(candidates)))
+        if num_mines == 0:
+            continue
+        if num_mines < len(candidates):
+            chosen = np.argpartition(keys, num_mines - 1, axis=1)[:, :num_mines]
+        else:
+            chosen = np.broadcast_to(np.arange(len(candidates)), keys.shape)
+        rows = np.arange(start, stop)[:, None]
+        mines[rows, candidates[chosen]] = 1
+
+    mines = mines.reshape(count, board_size, board_size)
+    return mines, neighbour_counts(mines)
+
+
+def mine_cells(mines_2d):
+    """보드 하나의 지뢰 배열 -> 칸 번호 목록 (GameEngine.load_mines에 바로 넘길 수 있음)."""
+    return np.flatnonzero(mines_2d).tolist()
+
+
+# ---------------- 비교용 파이썬 구현 -----------------
+def reference_board(keys, board_size, num_mines, safe_row, safe_col):
+    """난수 키 한 줄로 보드 하나를 파이썬으로 만든다. (지뢰 칸 번호 목록, counts 2차원 리스트)"""
+    candidates = [r * board_size + c for r, c in board.mine_candidates(board_size, safe_row, safe_col)]
+    num_mines = min(num_mines, len(candidates))
+    order = sorted(range(len(candidates)), key=lambda i: keys[i])
+    cells = sorted(candidates[i] for i in order[:num_mines])
+    counts = board.neighbour_counts(board_size, [divmod(i, board_size) for i in cells])
+    return cells, counts
+
+
+def reference_boards(count, board_size, num_mines, safe_row, safe_col, seed=None):
+    """generate_boards와 같은 난수 순서로 한 판씩 만든 결과 목록."""
+    rng = np.random.default_rng(seed)
+    n_candidates = len(board.mine_candidates(board_size, safe_row, safe_col))
+    return [
+        reference_board(rng.random(n_candidates).tolist(), board_size, num_mines, safe_row, safe_col)
+        for _ in range(count)
+    ]
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m line530.batch", description="보드 배치 생성 속도 측정")
+    parser.add_argument('-n', '--count', type=int, default=10_000, help="보드 수")
+    parser.add_argument('--size', type=int, default=30, help="보드 크기 (NxN)")
+    parser.add_argument('--mines', type=int, default=150, help="지뢰 수")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--check', type=int, default=100, metavar='K',
+                        help="앞 K개를 파이썬 구현과 비교 (0이면 안 함)")
+    args = parser.parse_args(argv)
+
+    safe = args.size // 2
+    started = time.perf_counter()
+    mines, counts = generate_boards(args.count, args.size, args.mines, safe, safe, seed=args.seed)
+    elapsed = time.perf_counter() - started
+    print(f"[배치] {args.size}x{args.size} 보드 {args.count}개 (지뢰 {args.mines}): {elapsed * 1000:.1f} ms, "
+          f"{(mines.nbytes + counts.nbytes) / 1024 / 1024:.1f} MiB")
+
+    if args.check:
+        k = min(args.check, args.count)
+        started = time.perf_counter()
+        expected = reference_boards(k, args.size, args.mines, safe, safe, seed=args.seed)
+        elapsed = time.perf_counter() - started
+        mismatches = sum(
+            1 for i, (cells, ref_counts) in enumerate(expected)
+            if cells != mine_cells(mines[i]) or counts[i].tolist() != ref_counts
+        )
+        print(f"[배치] 파이썬 구현 {k}개: {elapsed * 1000:.1f} ms, 다른 보드 {mismatches}개")
+        return 1 if mismatches else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
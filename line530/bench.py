@@ -0,0 +1,416 @@
+"""게임 로직, 보드 그리기, 자원 로딩 벤치마크.
+
+    python -m line530.bench                          결과 표 출력
+    python -m line530.bench -o result.json           결과를 JSON으로 저장
+    python -m line530.bench --baseline base.json     기준과 비교 (느려진 항목이 있으면 종료 코드 1)
+    python -m line530.bench --baseline               저장소에 들어 있는 기준(bench-baseline.json)과 비교
+    python -m line530.bench --save-baseline base.json --note "조용한 노트북, 전원 연결"
+
+항목 이름은 '분류/설정' 꼴이고 --only로 일부만 돌릴 수 있다. 각 항목은 여러 번
+재서 중앙값을 비교한다 (기준보다 --threshold 비율 이상 느리면 '느려짐').
+
+보드 그리기는 Tk 화면이 필요하다. 서버에서는 ``xvfb-run python -m line530.bench``로
+돌리고, 화면이 없으면 그 항목만 건너뛴다. 자원 로딩은 fakeapi의 로컬 서버에
+응답 지연(--latency)을 줘서 디스크 캐시가 빈 경우(cold)와 찬 경우(warm)를 재고,
+같은 서버로 만든 아틀라스에서 고르는 경우(atlas)와 비교한다.
+
+결과 JSON의 meta에는 잰 기계(CPU, 코어 수, 플랫폼)와 --note 메모가 들어간다.
+저장소의 bench-baseline.json은 참고용 기준이므로, 다른 기계에서는 먼저 그 기계의
+기준을 --save-baseline으로 만들어 비교하는 편이 정확하다.
+"""
+import json
+import os
+import platform
+import queue
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from line530.engine import GameEngine
+from line530.solver import MineSolver
+
+DEFAULT_THRESHOLD = 0.20
+DEFAULT_LATENCY = 0.02
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench-baseline.json')
+
+BENCHMARKS = {}    # 이름 -> 함수(설정) -> [초, ...]
+
+
+class BenchmarkSkipped(Exception):
+    """이 환경에서 돌릴 수 없는 항목 (화면 없음, 패키지 없음 등)."""
+
+
+def benchmark(name):
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+def _repeat(options, n):
+    return max(1, n // 5) if options.get('quick') else n
+
+
+def _time_runs(run, setup, repeat):
+    """setup()의 결과를 run에 넘겨 repeat번 잰다 (setup 시간은 빼고)."""
+    times = []
+    for index in range(repeat):
+        arg = setup(index)
+        started = time.perf_counter()
+        run(arg)
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def _started_engine(board_size, num_mines, seed):
+    engine = GameEngine(board_size, num_mines, rng=random.Random(seed))
+    engine.start(board_size // 2, board_size // 2)
+    return engine
+
+
+# ---------------- 게임 로직 -----------------
+@benchmark('engine.start/30x30')
+def bench_start_30(options):
+    return _time_runs(
+        lambda e: e.start(15, 15),
+        lambda i: GameEngine(30, 180, rng=random.Random(i)),
+        _repeat(options, 50),
+    )
+
+
+@benchmark('engine.start/100x100')
+def bench_start_100(options):
+    return _time_runs(
+        lambda e: e.start(50, 50),
+        lambda i: GameEngine(100, 1500, rng=random.Random(i)),
+        _repeat(options, 10),
+    )
+
+
+@benchmark('engine.reveal/cascade-100x100')
+def bench_cascade(options):
+    # 지뢰가 적어 첫 클릭에서 보드 대부분이 열리는 경우
+    return _time_runs(
+        lambda e: e.reveal(e.index(50, 50)),
+        lambda i: _started_engine(100, 300, i),
+        _repeat(options, 10),
+    )
+
+
+@benchmark('engine.has_won/x10000')
+def bench_has_won(options):
+    def run(engine):
+        for _ in range(10_000):
+            engine.has_won()
+    return _time_runs(run, lambda i: _started_engine(30, 180, i), _repeat(options, 20))
+
+
+@benchmark('solver.hint/30x30')
+def bench_hint(options):
+    # 한 판을 힌트만으로 두면서 힌트 한 번씩을 잰다
+    times = []
+    for seed in range(_repeat(options, 10)):
+        engine = _started_engine(30, 180, seed)
+        solver = MineSolver(engine)
+        engine.reveal(engine.index(15, 15))
+        rng = random.Random(seed)
+        while not engine.over and len(times) < 2000:
+            started = time.perf_counter()
+            i, _ = solver.hint(rng)
+            times.append(time.perf_counter() - started)
+            engine.reveal(i)
+    return times
+
+
+def _worst_hints(board_size, num_mines, games, topology=None):
+    """판마다 힌트만으로 끝까지 두고, 그 판에서 가장 오래 걸린 힌트 한 번의 시간을 모은다.
+
+    힌트는 대부분 아주 빠르고 막혔을 때(확률 계산)만 느리므로, 중앙값 대신 판마다의
+    최악값으로 느려짐을 잡는다. 이웃이 많은 모양(knight)에서 특히 중요하다.
+    """
+    worst = []
+    for seed in range(games):
+        engine = GameEngine(board_size, num_mines, rng=random.Random(seed), topology=topology)
+        middle = board_size // 2
+        engine.start(middle, middle)
+        solver = MineSolver(engine)
+        engine.reveal(engine.index(middle, middle))
+        rng = random.Random(seed)
+        slowest = 0.0
+        while not engine.over:
+            started = time.perf_counter()
+            i, _ = solver.hint(rng)
+            slowest = max(slowest, time.perf_counter() - started)
+            if i is None:
+                break
+            engine.reveal(i)
+        worst.append(slowest)
+    return worst
+
+
+@benchmark('solver.hint-worst/30x30')
+def bench_hint_worst(options):
+    return _worst_hints(30, 180, _repeat(options, 10))
+
+
+@benchmark('solver.hint-worst/knight-12x12')
+def bench_hint_worst_knight(options):
+    return _worst_hints(12, 30, _repeat(options, 20), topology='knight')
+
+
+# ---------------- 보드 그리기 (Tk) -----------------
+def _render_bench(renderer_name, board_size, repeat):
+    import tkinter as tk
+
+    from line530.images import ImageRegistry
+    from line530.render import RENDERERS, measure_build
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        raise BenchmarkSkipped(f"Tk 화면 없음 (xvfb-run으로 실행): {e}")
+    try:
+        root.withdraw()
+        tile = 24
+        registry = ImageRegistry()
+        registry.add_solid('bush', (34, 177, 76, 255))
+        registry.add_solid('blank', (0, 0, 0, 0))
+        registry.add_solid('flag', (220, 40, 40, 255))
+        images = {key: registry.photo(key, tile) for key in ('bush', 'blank', 'flag')}
+        frame = tk.Frame(root)
+        frame.pack()
+        renderer = RENDERERS[renderer_name](frame, images, registry, lambda r, c: None, lambda r, c: None)
+        times = []
+        for _ in range(repeat):
+            elapsed, _ = measure_build(renderer, board_size, tile)
+            root.update_idletasks()
+            times.append(elapsed)
+        renderer.destroy()
+        return times
+    finally:
+        root.destroy()
+
+
+@benchmark('render.build/button-20x20')
+def bench_render_button(options):
+    return _render_bench('button', 20, _repeat(options, 5))
+
+
+@benchmark('render.build/canvas-40x40')
+def bench_render_canvas(options):
+    return _render_bench('canvas', 40, _repeat(options, 5))
+
+
+@benchmark('render.build/viewport-300x300')
+def bench_render_viewport(options):
+    return _render_bench('viewport', 300, _repeat(options, 5))
+
+
+# ---------------- 자원 로딩 (로컬 PokeAPI 대역) -----------------
+def _load_assets(api, cache_root, count=15, atlas=None):
+    """AssetLoader 한 번을 끝까지 돌린 시간 (초). atlas가 있으면 네트워크 대신 아틀라스에서."""
+    from line530.cache import SpriteCache
+    from line530.loader import AssetLoader
+
+    results = queue.Queue()
+    loader = AssetLoader(
+        1, count, results, random.Random(0), atlas=atlas, cache=SpriteCache(root=cache_root),
+        fetcher_options={'api_base': api.api_base, 'sprite_base': api.sprite_base} if api else None,
+    )
+    started = time.perf_counter()
+    loader.start()
+    while True:
+        message = results.get(timeout=60)
+        if message[1] == 'done':
+            elapsed = time.perf_counter() - started
+            if message[2] < message[3] or message[3] == 0:
+                raise RuntimeError(f"자원 로딩 실패: {message[2]}/{message[3]}")
+            return elapsed
+
+
+def _assets_bench(options, warm):
+    try:
+        import PIL  # noqa: F401
+        import requests  # noqa: F401
+    except ImportError as e:
+        raise BenchmarkSkipped(f"Pillow/requests 필요: {e}")
+    from line530.fakeapi import FakePokeAPI
+
+    times = []
+    with FakePokeAPI(latency=options.get('latency', DEFAULT_LATENCY)) as api:
+        for _ in range(_repeat(options, 3)):
+            cache_root = tempfile.mkdtemp(prefix="line530-bench-")
+            try:
+                if warm:
+                    _load_assets(api, cache_root)
+                times.append(_load_assets(api, cache_root))
+            finally:
+                shutil.rmtree(cache_root, ignore_errors=True)
+    return times
+
+
+@benchmark('assets.load/cold')
+def bench_assets_cold(options):
+    return _assets_bench(options, warm=False)
+
+
+@benchmark('assets.load/warm')
+def bench_assets_warm(options):
+    return _assets_bench(options, warm=True)
+
+
+@benchmark('assets.load/atlas')
+def bench_assets_atlas(options):
+    # 아틀라스는 가짜 서버에서 받아 한 번 만들고 (시간에 넣지 않음), 열기(mmap) + 고르기를 잰다
+    try:
+        import PIL  # noqa: F401
+        import requests  # noqa: F401
+    except ImportError as e:
+        raise BenchmarkSkipped(f"Pillow/requests 필요: {e}")
+    from line530.atlas import SpriteAtlas, build
+    from line530.fakeapi import FakePokeAPI
+    from line530.fetch import AssetFetcher
+
+    work = tempfile.mkdtemp(prefix="line530-bench-")
+    try:
+        path = os.path.join(work, 'gen1.atlas')
+        with FakePokeAPI() as api, AssetFetcher(api.api_base, api.sprite_base, deadline=None) as fetcher:
+            build(path, fetcher=fetcher)
+        times = []
+        for _ in range(_repeat(options, 3)):
+            started = time.perf_counter()
+            atlas = SpriteAtlas(path)
+            try:
+                _load_assets(None, work, atlas=atlas)
+                times.append(time.perf_counter() - started)
+            finally:
+                atlas.close()
+        return times
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+# ---------------- 실행/비교 -----------------
+def run(only=None, **options):
+    """{이름: {'median_ms', 'min_ms', 'max_ms', 'runs'} 또는 {'skipped': 이유}}."""
+    results = {}
+    for name, fn in BENCHMARKS.items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+        try:
+            times = fn(options)
+        except BenchmarkSkipped as e:
+            results[name] = {'skipped': str(e)}
+            continue
+        results[name] = {
+            'median_ms': statistics.median(times) * 1000,
+            'min_ms': min(times) * 1000,
+            'max_ms': max(times) * 1000,
+            'runs': len(times),
+        }
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """{이름: (기준 ms, 현재 ms, 변화율, 느려졌는지)} (둘 다 잰 항목만)."""
+    report = {}
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base or 'median_ms' not in base or 'median_ms' not in current:
+            continue
+        change = current['median_ms'] / base['median_ms'] - 1 if base['median_ms'] else 0.0
+        report[name] = (base['median_ms'], current['median_ms'], change, change > threshold)
+    return report
+
+
+def _cpu_name():
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def machine_meta():
+    """결과를 잰 기계 정보 (기준과 비교할 때 같은 기계인지 보려고)."""
+    return {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu': _cpu_name(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def print_results(results, report=None):
+    report = report or {}
+    print(f"{'항목':<34} {'중앙값':>10} {'최소':>10} {'횟수':>5}  기준 대비")
+    for name, row in results.items():
+        if 'skipped' in row:
+            print(f"{name:<34} {'건너뜀':>10}  ({row['skipped']})")
+            continue
+        line = f"{name:<34} {row['median_ms']:>8.3f}ms {row['min_ms']:>8.3f}ms {row['runs']:>5}"
+        if name in report:
+            base_ms, _, change, regressed = report[name]
+            line += f"  {change:+.1%} (기준 {base_ms:.3f}ms){'  << 느려짐' if regressed else ''}"
+        print(line)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m line530.bench", description="벤치마크")
+    parser.add_argument('--only', nargs='+', metavar='NAME', help="이름에 이 문자열이 들어간 항목만")
+    parser.add_argument('--quick', action='store_true', help="반복 횟수를 줄여 빨리")
+    parser.add_argument('--latency', type=float, default=DEFAULT_LATENCY, help="가짜 PokeAPI 응답 지연 (초)")
+    parser.add_argument('-o', '--output', help="결과 JSON 경로")
+    parser.add_argument('--baseline', nargs='?', const=BASELINE_PATH, metavar='PATH',
+                        help="비교할 기준 JSON (PATH 생략 시 저장소의 bench-baseline.json)")
+    parser.add_argument('--save-baseline', metavar='PATH', help="이번 결과를 기준으로 저장")
+    parser.add_argument('--note', help="결과에 남길 기계/환경 메모")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="이 비율보다 느려지면 느려짐으로 표시 (기본 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    results = run(args.only, quick=args.quick, latency=args.latency)
+    document = {
+        'meta': dict(
+            machine_meta(),
+            created=time.strftime('%Y-%m-%dT%H:%M:%S'),
+            latency=args.latency,
+            quick=args.quick,
+            note=args.note,
+        ),
+        'results': results,
+    }
+
+    report = {}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        meta = baseline.get('meta', {})
+        print(f"[벤치마크] 기준 {args.baseline}: {meta.get('created', '?')}, "
+              f"{meta.get('cpu', meta.get('platform', '?'))} x{meta.get('cpus', '?')}"
+              f"{', ' + meta['note'] if meta.get('note') else ''}")
+        report = compare(results, baseline['results'], args.threshold)
+    print_results(results, report)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(document, f, ensure_ascii=False, indent=2)
+
+    regressions = [name for name, row in report.items() if row[3]]
+    if regressions:
+        print(f"[벤치마크] 느려진 항목 {len(regressions)}개: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,42 @@
+"""지뢰 배치와 숫자 계산 같은 순수 게임 로직 (Tk, Pillow 없이 동작)."""
+import random
+
+
+def mine_candidates(board_size, safe_row, safe_col, table=None):
+    """첫 클릭 주변(3x3)을 뺀, 지뢰를 놓을 수 있는 칸 목록.
+
+    table(topology.NeighbourTable)을 주면 그 모양에서 첫 클릭 칸의 이웃을 뺀다.
+    """
+    if table is not None:
+        safe = table.safe_zone(safe_row * board_size + safe_col)
+        return [divmod(i, board_size) for i in range(board_size * board_size) if i not in safe]
+    return [
+        (r, c)
+        for r in range(board_size)
+        for c in range(board_size)
+        if abs(r - safe_row) > 1 or abs(c - safe_col) > 1
+    ]
+
+
+def max_mines(board_size):
+    """첫 클릭 보호 영역을 빼고 놓을 수 있는 최대 지뢰 수 (최악의 경우 기준, 모든 보드 모양 공통)."""
+    return max(board_size * board_size - 9, 1)
+
+
+def place_mines(board_size, num_mines, safe_row, safe_col, rng=random, table=None):
+    """지뢰 위치 목록. 놓을 자리가 모자라면 가능한 만큼만 놓는다."""
+    candidates = mine_candidates(board_size, safe_row, safe_col, table)
+    return rng.sample(candidates, min(num_mines, len(candidates)))
+
+
+def neighbour_counts(board_size, mine_cells):
+    """칸마다 주변 8칸의 지뢰 수 (지뢰 칸 자신은 -1)."""
+    counts = [[0] * board_size for _ in range(board_size)]
+    for r, c in mine_cells:
+        for nr in range(max(r - 1, 0), min(r + 2, board_size)):
+            row = counts[nr]
+            for nc in range(max(c - 1, 0), min(c + 2, board_size)):
+                row[nc] += 1
+    for r, c in mine_cells:
+        counts[r][c] = -1
+    return counts
@@ -0,0 +1,165 @@
+"""스프라이트 원본 bytes를 보관하는 디스크 캐시.
+
+파일은 내용의 SHA-256으로 저장하고(같은 내용은 한 번만 저장), URL별
+메타데이터(ETag, Last-Modified, 마지막 확인/사용 시각)는 index.json에 둔다.
+전체 크기가 상한을 넘으면 가장 오래 쓰이지 않은 항목부터 지운다.
+
+위치: $XDG_CACHE_HOME/line530/sprites (없으면 ~/.cache/line530/sprites)
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# 이 시간 안에 확인한 항목은 서버에 다시 묻지 않는다 (스프라이트는 거의 안 바뀜)
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+
+
+def user_cache_dir():
+    """$XDG_CACHE_HOME/line530 (없으면 ~/.cache/line530). 게임이 스스로 만드는 파일을 둔다."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'line530')
+
+
+def default_cache_dir():
+    return os.path.join(user_cache_dir(), 'sprites')
+
+
+class SpriteCache:
+    def __init__(self, root=None, max_bytes=DEFAULT_MAX_BYTES, max_age=DEFAULT_MAX_AGE):
+        self.root = root or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._index_path = os.path.join(self.root, 'index.json')
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._index = self._read_index()
+
+    # ---------------- 인덱스 -----------------
+    def _read_index(self):
+        try:
+            with open(self._index_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def flush(self):
+        """바뀐 인덱스를 디스크에 쓴다 (임시 파일 후 교체)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(self.root, exist_ok=True)
+            tmp_path = self._index_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, self._index_path)
+            self._dirty = False
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, 'objects', digest[:2], digest)
+
+    # ---------------- 조회/저장 -----------------
+    def lookup(self, url):
+        """url의 메타데이터 사본. 없으면 None."""
+        with self._lock:
+            entry = self._index.get(url)
+            return dict(entry) if entry else None
+
+    def has(self, url):
+        with self._lock:
+            return url in self._index
+
+    def is_fresh(self, entry):
+        return time.time() - entry.get('checked', 0) < self.max_age
+
+    def read(self, url):
+        """캐시된 bytes. 없거나 파일이 깨졌으면 None."""
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                return None
+            try:
+                with open(self._object_path(entry['digest']), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                del self._index[url]
+                self._dirty = True
+                return None
+            entry['used'] = time.time()
+            self._dirty = True
+            return data
+
+    def revalidated(self, url):
+        """서버가 304로 그대로라고 답했을 때 확인 시각만 갱신."""
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is not None:
+                entry['checked'] = time.time()
+                self._dirty = True
+
+    def validators(self, url):
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since)."""
+        entry = self.lookup(url)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, url, data, etag=None, last_modified=None):
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        now = time.time()
+        with self._lock:
+            self._index[url] = {
+                'digest': digest,
+                'size': len(data),
+                'etag': etag,
+                'last_modified': last_modified,
+                'checked': now,
+                'used': now,
+            }
+            self._dirty = True
+            self._evict()
+
+    # ---------------- 용량 관리 -----------------
+    def total_bytes(self):
+        with self._lock:
+            return self._total_bytes()
+
+    def _total_bytes(self):
+        # 같은 내용을 가리키는 URL이 여럿이어도 디스크에는 한 번만 있다
+        sizes = {entry['digest']: entry['size'] for entry in self._index.values()}
+        return sum(sizes.values())
+
+    def _evict(self):
+        refs = {}
+        for entry in self._index.values():
+            refs[entry['digest']] = refs.get(entry['digest'], 0) + 1
+        total = self._total_bytes()
+        if total <= self.max_bytes:
+            return
+        by_age = sorted(self._index.items(), key=lambda item: item[1].get('used', 0))
+        for url, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            del self._index[url]
+            digest = entry['digest']
+            refs[digest] -= 1
+            if refs[digest] == 0:
+                total -= entry['size']
+                try:
+                    os.remove(self._object_path(digest))
+                except OSError:
+                    pass
@@ -0,0 +1,193 @@
+"""Tk 없이 동작하는 지뢰찾기 게임 엔진.
+
+칸 상태는 ``bytearray`` 로 들고 있다 (칸 번호 = 행 * 크기 + 열).
+    mines     1이면 지뢰
+    counts    주변 지뢰 수
+    revealed  1이면 열린 칸
+    flagged   1이면 깃발
+지뢰 칸에 어떤 포켓몬이 있는지는 작은 딕셔너리(pokemon)로 따로 둔다.
+
+어느 칸이 이웃인지는 보드 모양(topology: square, torus, hex, knight)이 정하고,
+숫자 세기와 연쇄 열기는 그 모양의 미리 계산된 이웃 표(CSR)를 그대로 읽는다.
+
+열린 칸 수와 깃발 수를 바로바로 세어 두므로 승리 판정은 O(1)이다.
+화면 쪽은 subscribe()로 이벤트를 받아 바뀐 칸만 다시 그리면 된다.
+    ('reveal', [칸 번호, ...], [층 끝 위치, ...])
+                                   새로 열린 칸들 (BFS 순서)과 거리별 층 경계
+    ('flag', 칸 번호, 깃발 여부)
+    ('explode', 칸 번호)            지뢰를 밟음
+    ('pokemon', 칸 번호)            지뢰 칸에 포켓몬이 붙음
+"""
+import random
+from collections import deque
+
+from line530 import board, topology as topologies
+
+
+class GameEngine:
+    def __init__(self, board_size, num_mines, rng=None, topology=None):
+        self.board_size = board_size
+        self.num_mines = num_mines
+        self.rng = rng or random.Random()
+        self.topology = topologies.get(topology)
+        self.table = self.topology.table(board_size)   # 같은 설정의 게임끼리 공유
+
+        n = board_size * board_size
+        self.mines = bytearray(n)
+        self.counts = bytearray(n)
+        self.revealed = bytearray(n)
+        self.flagged = bytearray(n)
+        self.pokemon = {}          # 지뢰 칸 번호 -> (스프라이트 키, 이름) 또는 'P'
+
+        self.mine_count = num_mines
+        self.revealed_count = 0
+        self.flag_count = 0
+        self.started = False
+        self.over = False
+        self.won = False
+        self._listeners = []
+
+    # ---------------- 이벤트 -----------------
+    def subscribe(self, listener):
+        """listener(event, *args)를 상태가 바뀔 때마다 부른다."""
+        self._listeners.append(listener)
+
+    def _emit(self, event, *args):
+        for listener in self._listeners:
+            listener(event, *args)
+
+    # ---------------- 좌표 -----------------
+    def index(self, r, c):
+        return r * self.board_size + c
+
+    def coords(self, i):
+        return divmod(i, self.board_size)
+
+    def neighbours(self, i):
+        return self.table.neighbours(i)
+
+    # ---------------- 시작 -----------------
+    def start(self, safe_row, safe_col, roster=()):
+        """첫 클릭 위치를 피해 지뢰를 놓는다. roster의 포켓몬을 지뢰 칸에 나눠 준다.
+
+        포켓몬이 모자란 지뢰 칸은 'P'로 남는다 (나중에 attach_pokemon으로 붙일 수 있음).
+        """
+        mine_locations = board.place_mines(
+            self.board_size, self.num_mines, safe_row, safe_col, rng=self.rng, table=self.table
+        )
+        self.load_mines([self.index(r, c) for r, c in mine_locations], roster)
+
+    def load_mines(self, mine_cells, roster=()):
+        """정해진 지뢰 배치로 시작 (재현, 미리 만든 보드 등)."""
+        starts, cells, counts = self.table.starts, self.table.cells, self.counts
+        for i in mine_cells:
+            for k in cells[starts[i]:starts[i + 1]]:
+                counts[k] += 1
+        for i in mine_cells:
+            counts[i] = 0   # 지뢰 칸 자신은 숫자를 쓰지 않는다
+
+        mines_to_place = list(roster[:len(mine_cells)])
+        mines_to_place += ['P'] * (len(mine_cells) - len(mines_to_place))
+        self.rng.shuffle(mines_to_place)
+        for i, mine in zip(mine_cells, mines_to_place):
+            self.mines[i] = 1
+            self.pokemon[i] = mine
+        self.mine_count = len(mine_cells)
+        self.started = True
+
+    def attach_pokemon(self, mine):
+        """아직 'P'인 지뢰 칸 하나에 포켓몬을 붙인다. 붙일 칸이 없으면 None."""
+        for i, current in self.pokemon.items():
+            if current == 'P':
+                self.pokemon[i] = mine
+                self._emit('pokemon', i)
+                return i
+        return None
+
+    # ---------------- 조회 -----------------
+    def is_mine(self, i):
+        return self.mines[i] == 1
+
+    def is_revealed(self, i):
+        return self.revealed[i] == 1
+
+    def is_flagged(self, i):
+        return self.flagged[i] == 1
+
+    def mine_cells(self):
+        return list(self.pokemon)
+
+    def has_won(self):
+        return self.started and self.revealed_count == len(self.mines) - self.mine_count
+
+    def remaining_mines(self):
+        return max(self.mine_count - self.flag_count, 0)
+
+    def safe_unrevealed(self):
+        """아직 안 열린 안전한 칸들 (힌트용)."""
+        return [
+            i for i in range(len(self.mines))
+            if not self.revealed[i] and not self.mines[i]
+        ]
+
+    # ---------------- 동작 -----------------
+    def toggle_flag(self, i):
+        if self.over or self.revealed[i]:
+            return
+        self.flagged[i] ^= 1
+        self.flag_count += 1 if self.flagged[i] else -1
+        self._emit('flag', i, bool(self.flagged[i]))
+
+    def reveal(self, i):
+        """칸 i를 연다. 0인 칸이면 주변까지 이어서 연다.
+
+        새로 열린 칸 목록을 돌려준다. 지뢰면 게임이 끝나고 빈 목록.
+        """
+        if self.over or self.revealed[i] or self.flagged[i]:
+            return []
+        if self.mines[i]:
+            self.over = True
+            self.won = False
+            self._emit('explode', i)
+            return []
+
+        opened, layer_ends = self.flood_fill(i)
+        for j in opened:
+            self.revealed[j] = 1
+            if self.flagged[j]:
+                # 0 칸이 이어서 열리며 잘못 꽂힌 깃발도 걷어낸다
+                self.flagged[j] = 0
+                self.flag_count -= 1
+        self.revealed_count += len(opened)
+
+        if self.has_won():
+            self.over = True
+            self.won = True
+        self._emit('reveal', opened, layer_ends)
+        return opened
+
+    def flood_fill(self, i):
+        """i에서 열리게 될 칸 전체를 BFS로 미리 구한다 (상태는 바꾸지 않음).
+
+        (칸 목록, 층 경계) 를 돌려준다. 칸 목록은 i에서 가까운 순서이고,
+        층 경계[k]는 거리 k까지의 칸 수다 (물결 효과용).
+        """
+        starts, cells = self.table.starts, self.table.cells
+        counts, revealed, mines = self.counts, self.revealed, self.mines
+        visited = bytearray(len(mines))
+        visited[i] = 1
+        opened = []
+        layer_ends = []
+        frontier = deque([i])
+        while frontier:
+            for _ in range(len(frontier)):
+                j = frontier.popleft()
+                opened.append(j)
+                if counts[j]:
+                    continue
+                for k in cells[starts[j]:starts[j + 1]]:
+                    if not visited[k] and not revealed[k] and not mines[k]:
+                        visited[k] = 1
+                        frontier.append(k)
+            layer_ends.append(len(opened))
+        return opened, layer_ends
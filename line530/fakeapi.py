@@ -0,0 +1,175 @@
+"""벤치마크와 오프라인 시험용 로컬 PokeAPI 대역 서버.
+
+AssetFetcher가 부르는 주소만 흉내 낸다.
+    /api/v2/pokemon?limit=N           포켓몬 목록
+    /api/v2/pokemon-species/{id}      이름 (ko, ja, ja-Hrkt, en)
+    /sprites/pokemon/{id}.png         스프라이트 (id마다 색이 다른 96x96 PNG)
+    /sprites/items/master-ball.png    깃발 아이콘
+
+응답마다 latency초를 기다리고, ETag/If-None-Match(304)를 지원한다.
+
+    with FakePokeAPI(latency=0.05) as api:
+        fetcher = AssetFetcher(api.api_base, api.sprite_base)
+
+    python -m line530.fakeapi --port 8765 --latency 0.05
+"""
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.parse import parse_qs, urlsplit
+
+SPRITE_SIZE = 96
+
+
+def _sprite_png(seed):
+    from PIL import Image, ImageDraw
+    digest = hashlib.sha256(str(seed).encode()).digest()
+    img = Image.new('RGBA', (SPRITE_SIZE, SPRITE_SIZE), (0, 0, 0, 0))
+    ImageDraw.Draw(img).ellipse((16, 16, 80, 80), fill=tuple(digest[:3]) + (255,))
+    out = BytesIO()
+    img.save(out, 'PNG')
+    return out.getvalue()
+
+
+def species_names(poke_id):
+    """가짜 종 이름 (언어 코드 -> 이름)."""
+    return {
+        'ko': f"포켓몬{poke_id}",
+        'ja-Hrkt': f"ポケモン{poke_id}",
+        'ja': f"ポケモン{poke_id}",
+        'en': f"Pokemon{poke_id}",
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        api = self.server.api
+        time.sleep(api.latency)
+        api.count_request()
+        body, content_type = api.resolve(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakePokeAPI:
+    def __init__(self, latency=0.0, count=151, host='127.0.0.1', port=0):
+        self.latency = latency
+        self.count = count
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._sprites = {}
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.api = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_base(self):
+        return f"{self.base_url}/api/v2"
+
+    @property
+    def sprite_base(self):
+        return f"{self.base_url}/sprites"
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def _sprite(self, key):
+        with self._lock:
+            if key not in self._sprites:
+                self._sprites[key] = _sprite_png(key)
+            return self._sprites[key]
+
+    def resolve(self, path):
+        """요청 경로 -> (본문 bytes 또는 None, Content-Type)."""
+        parts = urlsplit(path)
+        segments = [s for s in parts.path.split('/') if s]
+        if segments[:3] == ['api', 'v2', 'pokemon']:
+            limit = int(parse_qs(parts.query).get('limit', [self.count])[0])
+            results = [
+                {'name': f"pokemon{i}", 'url': f"{self.api_base}/pokemon/{i}/"}
+                for i in range(1, min(limit, self.count) + 1)
+            ]
+            return json.dumps({'count': self.count, 'results': results}).encode(), 'application/json'
+        if segments[:3] == ['api', 'v2', 'pokemon-species'] and len(segments) == 4:
+            poke_id = int(segments[3])
+            if not 1 <= poke_id <= self.count:
+                return None, None
+            names = [
+                {'language': {'name': lang}, 'name': name}
+                for lang, name in species_names(poke_id).items()
+            ]
+            return json.dumps({'id': poke_id, 'names': names}, ensure_ascii=False).encode(), 'application/json'
+        if segments[:2] == ['sprites', 'pokemon'] and len(segments) == 3:
+            return self._sprite(segments[2]), 'image/png'
+        if segments == ['sprites', 'items', 'master-ball.png']:
+            return self._sprite('master-ball'), 'image/png'
+        return None, None
+
+    # ---------------- 시작/종료 -----------------
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name="fake-pokeapi", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m line530.fakeapi", description="로컬 PokeAPI 대역 서버")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="응답마다 기다릴 초")
+    args = parser.parse_args(argv)
+
+    api = FakePokeAPI(latency=args.latency, port=args.port)
+    print(f"LINE530_API_BASE={api.api_base}")
+    print(f"LINE530_SPRITE_BASE={api.sprite_base}")
+    try:
+        api.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
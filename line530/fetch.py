@@ -0,0 +1,321 @@
+"""PokeAPI 자원을 병렬로 내려받는 파이프라인.
+
+하나의 ``requests.Session`` (keep-alive 연결 풀)을 스레드 풀이 공유하고,
+요청마다 타임아웃, 제한된 재시도(지수 백오프), 전체 마감 시간을 적용한다.
+마감 시간을 넘기면 받은 것까지만 돌려주고, 나머지는 호출 쪽에서
+'P' 모드로 대체하면 된다. SpriteCache를 넘기면 받은 내용을 디스크에
+보관하고 다음 실행부터 재사용한다. 이름 색인(line530.names)을 넘기면 색인에
+있는 포켓몬은 이름을 위한 pokemon-species 요청을 보내지 않는다.
+
+주소는 환경 변수로 바꿀 수 있어서 로컬 가짜 서버로도 시험할 수 있다.
+    LINE530_API_BASE     (기본: https://pokeapi.co/api/v2)
+    LINE530_SPRITE_BASE  (기본: PokeAPI sprites 저장소)
+"""
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from line530.names import DEFAULT_LANGUAGE, DISPLAY_LANGUAGES
+from line530.trace import span
+
+API_BASE = os.environ.get("LINE530_API_BASE", "https://pokeapi.co/api/v2")
+SPRITE_BASE = os.environ.get(
+    "LINE530_SPRITE_BASE",
+    "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites",
+)
+
+# 재시도할 만한 HTTP 상태 코드 (일시적인 서버 문제)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    """재시도를 다 써도 받지 못했거나 마감 시간을 넘긴 경우."""
+
+
+class FetchStats:
+    """요청 횟수와 걸린 시간 기록."""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.bytes = 0
+        self.cache_hits = 0
+        self.revalidated = 0
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, **counts):
+        with self._lock:
+            for key, value in counts.items():
+                setattr(self, key, getattr(self, key) + value)
+
+    def summary(self):
+        return (
+            f"요청 {self.requests}회 (재시도 {self.retries}, 실패 {self.failures}), "
+            f"캐시 {self.cache_hits}회 (재확인 {self.revalidated}), "
+            f"{self.bytes / 1024:.1f} KiB, {self.elapsed:.2f}초"
+        )
+
+
+class AssetFetcher:
+    def __init__(self, api_base=API_BASE, sprite_base=SPRITE_BASE, workers=8,
+                 timeout=(3.05, 5.0), retries=2, backoff=0.25, deadline=15.0,
+                 cache=None, offline_first=False, names=None, language=DEFAULT_LANGUAGE):
+        self.api_base = api_base.rstrip('/')
+        self.sprite_base = sprite_base.rstrip('/')
+        self.workers = workers
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.deadline = deadline
+        self.cache = cache
+        self.offline_first = offline_first
+        self.names = names          # NameIndex 또는 None
+        self.language = language    # 'ko', 'ja', 'en'
+        self.stats = FetchStats()
+        self._deadline_at = None
+        self._cancelled = threading.Event()
+
+        # 모든 작업 스레드가 같은 연결 풀을 쓰도록 세션 하나만 만든다
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """연결 풀을 닫는다. 다 쓴 fetcher는 닫거나 with 문으로 쓴다."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ---------------- 주소 -----------------
+    def pokemon_list_url(self, limit=151):
+        return f"{self.api_base}/pokemon?limit={limit}"
+
+    def species_url(self, poke_id):
+        return f"{self.api_base}/pokemon-species/{poke_id}"
+
+    def sprite_url(self, poke_id):
+        return f"{self.sprite_base}/pokemon/{poke_id}.png"
+
+    def flag_url(self):
+        return f"{self.sprite_base}/items/master-ball.png"
+
+    # ---------------- 단일 요청 -----------------
+    def _remaining(self):
+        if self._deadline_at is None:
+            return None
+        return self._deadline_at - time.perf_counter()
+
+    def cancel(self):
+        """진행 중인 요청들을 멈춘다 (이미 보낸 요청은 타임아웃까지 기다릴 수 있음)."""
+        self._cancelled.set()
+
+    def _timeout(self):
+        if self._cancelled.is_set():
+            raise FetchError("취소됨")
+        remaining = self._remaining()
+        if remaining is None:
+            return self.timeout
+        if remaining <= 0:
+            raise FetchError("전체 마감 시간 초과")
+        connect, read = self.timeout
+        return (min(connect, remaining), min(read, remaining))
+
+    def get(self, url):
+        """url의 내용을 bytes로 돌려준다. 일시적인 오류는 백오프 후 재시도.
+
+        캐시가 있으면: 최근에 확인했거나 offline_first면 네트워크 없이 캐시를,
+        오래된 항목은 조건부 요청(304)으로 확인하고, 끝내 실패하면 캐시를 쓴다.
+        """
+        cache = self.cache
+        entry = cache.lookup(url) if cache is not None else None
+        if entry is not None and (self.offline_first or cache.is_fresh(entry)):
+            data = cache.read(url)
+            if data is not None:
+                self.stats.add(cache_hits=1)
+                return data
+            entry = None
+
+        headers = cache.validators(url) if entry is not None else {}
+        last_error = None
+        for attempt in range(self.retries + 1):
+            if self._cancelled.is_set():
+                break
+            if attempt:
+                delay = self.backoff * (2 ** (attempt - 1))
+                remaining = self._remaining()
+                if remaining is not None and remaining <= delay:
+                    break
+                self.stats.add(retries=1)
+                time.sleep(delay)
+            try:
+                self.stats.add(requests=1)
+                with span('http', 'net', url=url, attempt=attempt):
+                    response = self.session.get(url, timeout=self._timeout(), headers=headers)
+                if response.status_code == 304 and entry is not None:
+                    data = cache.read(url)
+                    if data is not None:
+                        cache.revalidated(url)
+                        self.stats.add(revalidated=1)
+                        return data
+                    # 파일이 사라졌으면 조건 없이 다시 받는다
+                    headers = {}
+                    entry = None
+                    continue
+                if response.status_code in RETRY_STATUS:
+                    last_error = FetchError(f"HTTP {response.status_code}")
+                    continue
+                response.raise_for_status()
+                self.stats.add(bytes=len(response.content))
+                if cache is not None:
+                    cache.put(
+                        url,
+                        response.content,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified'),
+                    )
+                return response.content
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                last_error = e
+            except requests.exceptions.RequestException as e:
+                # 404 같은 영구적인 오류는 재시도하지 않는다
+                self.stats.add(failures=1)
+                raise FetchError(f"{url}: {e}") from e
+            except FetchError as e:
+                last_error = e
+                break
+
+        # 네트워크가 안 되면 오래된 캐시라도 쓴다
+        if entry is not None:
+            data = cache.read(url)
+            if data is not None:
+                self.stats.add(cache_hits=1)
+                return data
+        self.stats.add(failures=1)
+        raise FetchError(f"{url}: {last_error}")
+
+    def get_json(self, url):
+        import json
+        return json.loads(self.get(url))
+
+    # ---------------- 포켓몬 묶음 -----------------
+    def _indexed_name(self, poke_id):
+        if self.names is None or poke_id not in self.names:
+            return None
+        return self.names.display_name(poke_id, self.language)
+
+    def _fetch_species_name(self, poke_id, default):
+        try:
+            species_data = self.get_json(self.species_url(poke_id))
+        except (FetchError, ValueError) as e:
+            print(f"Could not fetch {self.language} name for {poke_id}: {e}")
+            return default
+        names = {entry['language']['name']: entry['name'] for entry in species_data['names']}
+        for code in DISPLAY_LANGUAGES.get(self.language, (self.language,)):
+            if code in names:
+                return names[code]
+        return default
+
+    def _is_cached(self, poke_id):
+        if not self.cache.has(self.sprite_url(poke_id)):
+            return False
+        return self._indexed_name(poke_id) is not None or self.cache.has(self.species_url(poke_id))
+
+    def _fetch_pokemon(self, poke_id, default_name):
+        name = self._indexed_name(poke_id) or self._fetch_species_name(poke_id, default_name)
+        sprite = self.get(self.sprite_url(poke_id))
+        return poke_id, name, sprite
+
+    @contextmanager
+    def _batch_window(self, deadline):
+        """한 묶음 요청 동안 마감 시간을 걸고, 끝나면 캐시/통계를 정리한다."""
+        started = time.perf_counter()
+        self._deadline_at = started + deadline if deadline else None
+        try:
+            yield
+        finally:
+            self._deadline_at = None
+            if self.cache is not None:
+                self.cache.flush()
+            self.stats.elapsed += time.perf_counter() - started
+
+    def _fetch_batch(self, selected, on_item=None, with_flag=True):
+        """깃발 아이콘(with_flag일 때)과 selected 포켓몬들을 스레드 풀로 동시에 받는다.
+
+        on_item이 있으면 받는 대로 on_item('flag', bytes) /
+        on_item('pokemon', (poke_id, 이름, bytes))를 작업 스레드에서 부른다.
+        """
+        flag = None
+        roster = []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            flag_future = pool.submit(self.get, self.flag_url()) if with_flag else None
+            futures = ([flag_future] if with_flag else []) + [
+                pool.submit(self._fetch_pokemon, p['url'].split('/')[-2], p['name'].capitalize())
+                for p in selected
+            ]
+            try:
+                for future in as_completed(futures, timeout=self._remaining()):
+                    if self._cancelled.is_set():
+                        break
+                    if future.exception() is not None:
+                        print(f"Warning: {future.exception()}")
+                        continue
+                    if future is flag_future:
+                        flag = future.result()
+                        kind, item = 'flag', flag
+                    else:
+                        item = future.result()
+                        roster.append(item)
+                        kind = 'pokemon'
+                    if on_item is not None:
+                        on_item(kind, item)
+            except FuturesTimeoutError:
+                pass
+            for future in futures:
+                future.cancel()
+        return flag, roster
+
+    def fetch_roster(self, count, rng=random, on_start=None, on_item=None, exclude=(), with_flag=True):
+        """깃발 아이콘과 무작위 포켓몬 count마리를 병렬로 받는다.
+
+        (flag_bytes 또는 None, [(poke_id, 이름, 스프라이트 bytes), ...], 선택한 수)를
+        돌려준다. 목록 자체를 못 받으면 FetchError. on_start(선택한 수)는
+        목록을 받은 직후, on_item은 _fetch_batch 참고. exclude(번호 문자열들)는
+        이미 가진 포켓몬이라 고르지 않는다.
+        """
+        with self._batch_window(self.deadline):
+            pokemon_list = self.get_json(self.pokemon_list_url())['results']
+            if exclude:
+                pokemon_list = [p for p in pokemon_list if p['url'].split('/')[-2] not in exclude]
+            if self.offline_first and self.cache is not None:
+                # 캐시에 다 들어 있는 포켓몬만으로 충분하면 그 안에서 고른다
+                cached = [p for p in pokemon_list if self._is_cached(p['url'].split('/')[-2])]
+                if len(cached) >= count:
+                    pokemon_list = cached
+            selected = rng.sample(pokemon_list, min(count, len(pokemon_list)))
+            if on_start is not None:
+                on_start(len(selected))
+            flag, roster = self._fetch_batch(selected, on_item, with_flag)
+            return flag, roster, len(selected)
+
+    def fetch_all(self, limit=151):
+        """도감 앞 limit마리 전부를 받는다 (아틀라스 빌드용, 마감 시간 없음).
+
+        (flag_bytes 또는 None, [(poke_id, 이름, 스프라이트 bytes), ...])를 돌려준다.
+        """
+        with self._batch_window(None):
+            pokemon_list = self.get_json(self.pokemon_list_url(limit))['results']
+            return self._fetch_batch(pokemon_list)
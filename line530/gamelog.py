@@ -0,0 +1,288 @@
+"""게임 기록(바이너리)과 Tk 없는 재생기.
+
+버그 신고를 재현하고, 실제 플레이를 성능 시험 입력으로 쓰기 위한 형식이다.
+모든 정수는 varint(7비트씩, 작은 값은 1바이트)로 적는다.
+
+    머리   MAGIC, VERSION(1바이트), 그다음 varint로
+           flags, 보드 크기, 지뢰 수, seed, 제한 시간(초, 0=없음), 힌트 수, 시작 시각(유닉스 초)
+           flags & EXPLICIT_MINES 면: 지뢰 수, 정렬된 지뢰 칸 번호의 차이들
+           flags & TOPOLOGY 면: 보드 모양 이름 길이, 이름(ASCII) (없으면 보통 보드)
+    기록   (직전 기록과의 시간 차 ms, 칸 번호 * 4 + 동작) 을 파일 끝까지 반복
+
+동작: LEFT(칸 열기), FLAG(깃발 토글), HINT(힌트로 연 칸), TIMEOUT(시간 초과, 칸은 0)
+
+지뢰 배치는 seed로 만든 GameEngine(rng=random.Random(seed))이 첫 클릭 때
+정하므로 보통은 seed만 적는다. 노게스처럼 미리 만든 보드는 지뢰 칸을 직접 적는다.
+
+    python -m line530.gamelog 기록.l530g ...          재생 결과
+    python -m line530.gamelog --repeat 1000 기록들...  재생 속도 측정
+"""
+import os
+import random
+import struct
+import time
+
+from line530.engine import GameEngine
+from line530.topology import DEFAULT_TOPOLOGY, TOPOLOGIES
+
+MAGIC = b'L530G'
+VERSION = 1
+HEADER = struct.Struct('<5sB')
+EXPLICIT_MINES = 1
+TOPOLOGY = 2
+SUFFIX = '.l530g'
+
+LEFT, FLAG, HINT, TIMEOUT = 0, 1, 2, 3
+ACTION_NAMES = {LEFT: 'left', FLAG: 'flag', HINT: 'hint', TIMEOUT: 'timeout'}
+
+
+class GameLogError(ValueError):
+    """기록 파일 형식이 잘못된 경우. 메시지 앞에 문제가 된 바이트 위치를 적는다."""
+
+
+def default_log_dir():
+    base = os.environ.get('XDG_STATE_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'state')
+    return os.path.join(base, 'line530', 'games')
+
+
+def new_seed():
+    return random.SystemRandom().getrandbits(63)
+
+
+# ---------------- varint -----------------
+def _put_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    start = pos
+    result = shift = 0
+    while True:
+        if pos >= len(data):
+            raise GameLogError(f"{start} 바이트: 기록이 중간에 끊겼습니다")
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+# ---------------- 쓰기 -----------------
+class GameRecorder:
+    """한 판의 기록을 메모리(bytearray)에 쌓는다. 파일 쓰기는 save()에서 한 번."""
+
+    def __init__(self, board_size, num_mines, seed, timer_limit=None, hints=0, mine_cells=None,
+                 topology=None):
+        self.board_size = board_size
+        self.num_mines = num_mines
+        self.seed = seed
+        self.timer_limit = timer_limit
+        self.hints = hints
+        self.topology = topology or DEFAULT_TOPOLOGY
+        self.started_at = int(time.time())
+        self.mine_cells = None
+        self.data = bytearray()
+        self.count = 0
+        self._last_tick = time.perf_counter()
+        if mine_cells is not None:
+            self.set_mines(mine_cells)
+
+    def set_mines(self, mine_cells):
+        """seed로 다시 만들 수 없는 보드(노게스 등)면 지뢰 칸을 직접 기록."""
+        self.mine_cells = sorted(mine_cells)
+
+    def record(self, action, cell=0):
+        now = time.perf_counter()
+        _put_varint(self.data, int((now - self._last_tick) * 1000))
+        _put_varint(self.data, cell << 2 | action)
+        self._last_tick = now
+        self.count += 1
+
+    def header(self):
+        out = bytearray(HEADER.pack(MAGIC, VERSION))
+        flags = EXPLICIT_MINES if self.mine_cells is not None else 0
+        if self.topology != DEFAULT_TOPOLOGY:
+            flags |= TOPOLOGY
+        for value in (flags, self.board_size, self.num_mines, self.seed,
+                      self.timer_limit or 0, self.hints, self.started_at):
+            _put_varint(out, value)
+        if self.mine_cells is not None:
+            _put_varint(out, len(self.mine_cells))
+            previous = 0
+            for cell in self.mine_cells:
+                _put_varint(out, cell - previous)
+                previous = cell
+        if flags & TOPOLOGY:
+            name = self.topology.encode('ascii')
+            _put_varint(out, len(name))
+            out += name
+        return out
+
+    def to_bytes(self):
+        return bytes(self.header() + self.data)
+
+    def save(self, directory=None):
+        """directory(기본: default_log_dir())에 저장하고 경로를 돌려준다."""
+        directory = directory or default_log_dir()
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(self.started_at))
+        path = os.path.join(directory, f"{stamp}-{self.seed}{SUFFIX}")
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+        return path
+
+
+# ---------------- 읽기/재생 -----------------
+class GameLog:
+    def __init__(self, board_size, num_mines, seed, timer_limit, hints, started_at,
+                 mine_cells, records, topology=DEFAULT_TOPOLOGY):
+        self.board_size = board_size
+        self.num_mines = num_mines
+        self.seed = seed
+        self.timer_limit = timer_limit
+        self.hints = hints
+        self.started_at = started_at
+        self.mine_cells = mine_cells
+        self.topology = topology
+        self.records = records      # [(시각 ms, 동작, 칸 번호), ...] 시각은 첫 기록부터 누적
+
+    @classmethod
+    def parse(cls, data):
+        if len(data) < HEADER.size:
+            raise GameLogError("기록 파일이 너무 짧습니다")
+        magic, version = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise GameLogError("게임 기록 파일이 아닙니다")
+        if version != VERSION:
+            raise GameLogError(f"지원하지 않는 기록 버전: {version}")
+        pos = HEADER.size
+        values = []
+        for _ in range(7):
+            value, pos = _read_varint(data, pos)
+            values.append(value)
+        flags, board_size, num_mines, seed, timer_limit, hints, started_at = values
+        cells = board_size * board_size
+        if board_size < 2 or not 1 <= num_mines < cells:
+            raise GameLogError(f"{HEADER.size} 바이트: 보드 {board_size}x{board_size}, 지뢰 {num_mines}개는 둘 수 없습니다")
+
+        def check_cell(cell, at):
+            if cell >= cells:
+                raise GameLogError(f"{at} 바이트: 칸 번호 {cell}이(가) {board_size}x{board_size} 보드 밖입니다")
+
+        mine_cells = None
+        if flags & EXPLICIT_MINES:
+            count, pos = _read_varint(data, pos)
+            mine_cells, cell = [], 0
+            for _ in range(count):
+                at = pos
+                delta, pos = _read_varint(data, pos)
+                cell += delta
+                check_cell(cell, at)
+                mine_cells.append(cell)
+
+        topology = DEFAULT_TOPOLOGY
+        if flags & TOPOLOGY:
+            length, pos = _read_varint(data, pos)
+            if pos + length > len(data):
+                raise GameLogError(f"{pos} 바이트: 기록이 중간에 끊겼습니다")
+            topology = data[pos:pos + length].decode('ascii', 'replace')
+            if topology not in TOPOLOGIES:
+                raise GameLogError(f"{pos} 바이트: 알 수 없는 보드 모양: {topology}")
+            pos += length
+
+        records, tick = [], 0
+        while pos < len(data):
+            delta, pos = _read_varint(data, pos)
+            at = pos
+            packed, pos = _read_varint(data, pos)
+            check_cell(packed >> 2, at)
+            tick += delta
+            records.append((tick, packed & 3, packed >> 2))
+        return cls(board_size, num_mines, seed, timer_limit or None, hints, started_at,
+                   mine_cells, records, topology)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.parse(f.read())
+
+    def replay(self):
+        """GUI 없이 끝까지 재생한다. 결과 dict (이겼는지, 끝났는지, 동작 수, 열린 칸 수 등)."""
+        engine = GameEngine(self.board_size, self.num_mines, rng=random.Random(self.seed),
+                            topology=self.topology)
+        reason = None
+        moves = 0
+        cells = self.board_size * self.board_size
+        for n, (tick, action, cell) in enumerate(self.records):
+            if engine.over:
+                break
+            if not 0 <= cell < cells:
+                raise GameLogError(f"{n}번째 기록: 칸 번호 {cell}이(가) 보드 밖입니다")
+            moves += 1
+            if action == TIMEOUT:
+                engine.over = True
+                reason = 'timeout'
+                break
+            if action == FLAG:
+                engine.toggle_flag(cell)
+                continue
+            if not engine.started:
+                if self.mine_cells is not None:
+                    engine.load_mines(self.mine_cells)
+                else:
+                    engine.start(*engine.coords(cell))
+            engine.reveal(cell)
+            if engine.over and not engine.won:
+                reason = 'mine'
+        return {
+            'won': engine.won,
+            'over': engine.over,
+            'reason': reason or ('won' if engine.won else None),
+            'moves': moves,
+            'revealed': engine.revealed_count,
+            'duration_ms': self.records[-1][0] if self.records else 0,
+        }
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m line530.gamelog", description="게임 기록 재생")
+    parser.add_argument('paths', nargs='+', help="기록 파일 또는 폴더")
+    parser.add_argument('--repeat', type=int, default=1, help="재생 속도를 잴 때 반복 횟수")
+    parser.add_argument('-q', '--quiet', action='store_true', help="파일별 결과는 출력하지 않음")
+    args = parser.parse_args(argv)
+
+    paths = []
+    for path in args.paths:
+        if os.path.isdir(path):
+            paths += sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(SUFFIX))
+        else:
+            paths.append(path)
+
+    logs = []
+    for path in paths:
+        try:
+            logs.append((path, GameLog.load(path)))
+        except (OSError, GameLogError) as e:
+            print(f"Warning: {path}: {e}")
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        results = [(path, log.replay()) for path, log in logs]
+    elapsed = time.perf_counter() - started
+
+    if not args.quiet:
+        for path, result in results:
+            print(f"{os.path.basename(path)}: {result['reason'] or '진행 중'}, 동작 {result['moves']}회, "
+                  f"열린 칸 {result['revealed']}, {result['duration_ms'] / 1000:.1f}초")
+    games = len(logs) * args.repeat
+    if games:
+        print(f"[재생] {games}판, {elapsed * 1000:.1f} ms ({games / elapsed:.0f}판/초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""디코딩은 한 번만, 크기별 PhotoImage는 필요할 때 만드는 이미지 저장소.
+
+스프라이트마다 Pillow 원본(master)을 하나만 두고, 타일 크기나 팝업 크기
+같은 변형은 처음 요청될 때 만들어 (키, 크기)별로 기억한다. 전체 메모리가
+예산을 넘으면 가장 오래 안 쓴 변형부터, 그래도 넘치면 원본도 지운다.
+
+단색 타일(수풀, 빈칸 등)은 Tk의 PhotoImage로 직접 칠하므로, 첫 화면을
+그릴 때까지 Pillow를 불러오지 않아도 된다.
+"""
+import tkinter as tk
+from collections import OrderedDict
+from io import BytesIO
+
+from line530.trace import span
+
+DEFAULT_BUDGET_BYTES = 32 * 1024 * 1024
+
+
+def _image_bytes(img):
+    # RGBA 기준 대략적인 메모리 사용량
+    return img.width * img.height * 4
+
+
+class ImageRegistry:
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._masters = OrderedDict()    # key -> PIL.Image
+        self._solids = {}                # key -> (r, g, b, a)
+        self._variants = OrderedDict()   # (key, (w, h)) -> (PhotoImage, bytes)
+        self._used_bytes = 0
+
+    # ---------------- 원본 등록 -----------------
+    def add_bytes(self, key, data):
+        """이미지 bytes를 디코딩해 원본으로 등록. 실패하면 False."""
+        from PIL import Image
+        try:
+            img = Image.open(BytesIO(data))
+            img.load()
+        except Exception as e:
+            print(f"Warning: Could not decode image {key}: {e}")
+            return False
+        self.add_image(key, img)
+        return True
+
+    def add_image(self, key, img):
+        """이미 디코딩된 Pillow 이미지를 원본으로 등록 (기존 변형은 버린다)."""
+        self.discard(key)
+        img = img.convert('RGBA')
+        self._masters[key] = img
+        self._used_bytes += _image_bytes(img)
+        self._evict()
+
+    def add_solid(self, key, color):
+        """한 가지 색으로 채운 타일 (수풀, 빈칸 등). 알파가 0이면 투명."""
+        self._solids[key] = color
+
+    def has(self, key):
+        return key in self._masters or key in self._solids
+
+    def discard(self, key):
+        img = self._masters.pop(key, None)
+        if img is not None:
+            self._used_bytes -= _image_bytes(img)
+        for variant_key in [k for k in self._variants if k[0] == key]:
+            self._drop_variant(variant_key)
+
+    # ---------------- 변형 -----------------
+    def photo(self, key, size):
+        """key 원본을 size로 줄인 PhotoImage. 원본이 없으면 None.
+
+        size는 정수(정사각형) 또는 (가로, 세로).
+        """
+        if isinstance(size, int):
+            size = (size, size)
+        variant_key = (key, size)
+        cached = self._variants.get(variant_key)
+        if cached is not None:
+            self._variants.move_to_end(variant_key)
+            if key in self._masters:
+                self._masters.move_to_end(key)
+            return cached[0]
+
+        if key in self._solids:
+            photo = self._solid_photo(self._solids[key], size)
+            nbytes = size[0] * size[1] * 4
+        else:
+            master = self._masters.get(key)
+            if master is None:
+                return None
+            from PIL import Image, ImageTk
+            self._masters.move_to_end(key)
+            with span('resize', 'image', key=key, size=f"{size[0]}x{size[1]}"):
+                resized = master.resize(size, Image.Resampling.LANCZOS)
+                photo = ImageTk.PhotoImage(resized)
+            nbytes = _image_bytes(resized)
+        self._variants[variant_key] = (photo, nbytes)
+        self._used_bytes += nbytes
+        self._evict(keep=variant_key)
+        return photo
+
+    @staticmethod
+    def _solid_photo(color, size):
+        photo = tk.PhotoImage(width=size[0], height=size[1])
+        r, g, b, a = color
+        if a:
+            photo.put(f"#{r:02x}{g:02x}{b:02x}", to=(0, 0, size[0], size[1]))
+        return photo
+
+    def _drop_variant(self, variant_key):
+        _, nbytes = self._variants.pop(variant_key)
+        self._used_bytes -= nbytes
+
+    # ---------------- 메모리 관리 -----------------
+    @property
+    def used_bytes(self):
+        return self._used_bytes
+
+    def _evict(self, keep=None):
+        # 화면에 붙어 있는 PhotoImage는 위젯 쪽에서도 참조를 들고 있으므로
+        # 여기서 지워도 바로 사라지지 않는다
+        while self._used_bytes > self.budget_bytes:
+            victim = next((k for k in self._variants if k != keep), None)
+            if victim is not None:
+                self._drop_variant(victim)
+                continue
+            master_key = next((k for k in self._masters if keep is None or k != keep[0]), None)
+            if master_key is None:
+                break
+            self._used_bytes -= _image_bytes(self._masters.pop(master_key))
@@ -0,0 +1,124 @@
+"""Tk 메인 스레드를 막지 않는 배경 자원 로더.
+
+작업 스레드가 아틀라스나 네트워크에서 스프라이트를 받아 Pillow 이미지로
+디코딩까지 해 두고, 결과는 thread-safe 큐에 넣는다. Tk 쪽은 ``after()``로
+큐를 주기적으로 비우면서 PhotoImage를 만든다 (Tk 객체는 메인 스레드에서만).
+
+큐에 들어가는 메시지 (항상 첫 값은 로드 번호):
+    (번호, 'start', 전체 수)
+    (번호, 'flag', Pillow 이미지)
+    (번호, 'pokemon', 스프라이트 키, 이름, Pillow 이미지)
+    (번호, 'done', 받은 수, 전체 수)
+
+requests와 Pillow는 작업 스레드 안에서 처음 불러오므로, 그 비용이
+첫 화면을 그리는 시간에 들어가지 않는다.
+"""
+import threading
+from io import BytesIO
+
+from line530.atlas import FLAG_ID
+from line530.names import DEFAULT_LANGUAGE
+from line530.trace import span
+
+
+def _decode(data):
+    from PIL import Image
+    with span('decode', 'image', bytes=len(data)):
+        img = Image.open(BytesIO(data))
+        img.load()
+    return img
+
+
+class AssetLoader(threading.Thread):
+    def __init__(self, generation, count, results, rng, atlas=None, cache=None, offline_first=False,
+                 fetcher_options=None, exclude=(), with_flag=True, names=None, language=DEFAULT_LANGUAGE):
+        super().__init__(name=f"asset-loader-{generation}", daemon=True)
+        self.generation = generation
+        self.count = count
+        self.results = results
+        self.rng = rng
+        self.atlas = atlas
+        self.cache = cache
+        self.offline_first = offline_first
+        self.fetcher_options = fetcher_options or {}   # AssetFetcher 인자 (주소, 마감 시간 등)
+        # 이미 받은 포켓몬 번호(문자열)는 다시 고르지 않는다 (지뢰 수를 늘릴 때 모자란 만큼만)
+        self.exclude = frozenset(str(poke_id) for poke_id in exclude)
+        self.with_flag = with_flag
+        self.names = names          # NameIndex가 있으면 이름은 색인에서 (species 요청 없음)
+        self.language = language
+        self.fetcher = None
+        self._cancelled = threading.Event()
+        self._loaded = 0
+
+    def cancel(self):
+        """결과를 더 보내지 않는다. 설정이 바뀌어 새 로드를 시작할 때 부른다."""
+        self._cancelled.set()
+        if self.fetcher is not None:
+            self.fetcher.cancel()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def _put(self, *message):
+        if not self.cancelled:
+            self.results.put((self.generation,) + message)
+
+    # ---------------- 작업 스레드 -----------------
+    def run(self):
+        total = 0
+        try:
+            with span('asset-loader', 'assets', generation=self.generation):
+                if self.atlas is not None:
+                    total = self._load_from_atlas()
+                else:
+                    total = self._load_from_network()
+        except ImportError as e:
+            print(f"Warning: Pillow/requests 라이브러리가 필요합니다: pip install Pillow requests ({e})")
+        except Exception as e:
+            # FetchError 등; 어떤 경우든 'done'은 보내서 'P' 모드로 넘어가게 한다
+            print(f"Warning: Could not load Pokemon list: {e}")
+        finally:
+            if self.fetcher is not None:
+                print(f"[자원 로딩] {self.fetcher.stats.summary()}")
+                self.fetcher.close()
+            self._put('done', self._loaded, total)
+
+    def _load_from_atlas(self):
+        pokemon_ids = [poke_id for poke_id in self.atlas.pokemon_ids() if str(poke_id) not in self.exclude]
+        total = min(self.count, len(pokemon_ids))
+        self._put('start', total)
+        if self.with_flag and self.atlas.has_flag():
+            self._put('flag', self.atlas.image(FLAG_ID))
+        for poke_id in self.rng.sample(pokemon_ids, total):
+            if self.cancelled:
+                break
+            name = self.names.display_name(poke_id, self.language) if self.names is not None else None
+            self._put('pokemon', f"pokemon/{poke_id}", name or self.atlas.name(poke_id), self.atlas.image(poke_id))
+            self._loaded += 1
+        return total
+
+    def _load_from_network(self):
+        from line530.fetch import AssetFetcher
+
+        self.fetcher = AssetFetcher(cache=self.cache, offline_first=self.offline_first, names=self.names,
+                                    language=self.language, **self.fetcher_options)
+        if self.cancelled:
+            self.fetcher.cancel()
+
+        def on_item(kind, item):
+            try:
+                if kind == 'flag':
+                    self._put('flag', _decode(item))
+                    return
+                poke_id, name, sprite = item
+                self._put('pokemon', f"pokemon/{poke_id}", name, _decode(sprite))
+                self._loaded += 1
+            except Exception as e:
+                print(f"Warning: Could not decode image: {e}")
+
+        _, _, total = self.fetcher.fetch_roster(
+            self.count, rng=self.rng, on_start=lambda n: self._put('start', n), on_item=on_item,
+            exclude=self.exclude, with_flag=self.with_flag,
+        )
+        return total
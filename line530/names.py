@@ -0,0 +1,277 @@
+"""1세대 포켓몬 종 이름 색인 (모든 언어).
+
+이름 하나를 찾으려고 pokemon-species/{id} JSON 전체를 받아 names 목록을 훑지
+않도록, 종 데이터에서 이름만 뽑아 작은 파일 하나로 묶는다. 실행 시에는 파일을
+통째로 읽어 두고 (번호, 언어) -> 이름을 오프셋 표 한 칸으로 찾는다 (O(1)).
+
+파일 구조 (little-endian):
+    헤더     MAGIC, 버전, 첫 번호, 종 수, 언어 수, 이름 영역 길이
+    언어     (코드 길이 1바이트, ASCII 코드) × 언어 수
+    오프셋   u32 × (종 수 × 언어 수 + 1)
+             종 i, 언어 j의 이름 = 이름[off[k]:off[k + 1]], k = i × 언어 수 + j
+    이름     UTF-8 이름을 이어 붙인 것 (그 언어 이름이 없으면 길이 0)
+
+만들기 (PokeAPI, 로컬 미러 서버, 또는 PokeAPI api-data 저장소를 받아 둔 폴더):
+    python -m line530.names build [-o 경로] [--api-base URL | --mirror 폴더]
+조회:
+    python -m line530.names show 25 --lang ja
+
+색인은 저장소에 넣지 않고 설치한 곳에서 만든다 (build 명령의 기본 출력은 패키지의
+data 폴더). 게임은 색인이 없으면 첫 온라인 실행 때 build_in_background()로 사용자
+캐시 폴더에 만들어 둔다 (패키지 폴더는 쓰지 못할 수 있으므로). 찾는 순서는
+LINE530_NAMES가 있으면 그 경로만, 없으면 패키지 data -> 사용자 캐시.
+"""
+import json
+import os
+import struct
+
+from line530.cache import user_cache_dir
+
+MAGIC = b'L530NAM\x00'
+VERSION = 1
+HEADER = struct.Struct('<8sHHHHI')
+OFFSET_PAIR = struct.Struct('<II')
+GEN1_COUNT = 151
+
+PACKAGED_NAMES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'gen1.names')
+USER_NAMES_PATH = os.path.join(user_cache_dir(), 'gen1.names')
+_ENV_NAMES_PATH = os.environ.get('LINE530_NAMES')
+DEFAULT_NAMES_PATH = _ENV_NAMES_PATH or PACKAGED_NAMES_PATH          # build 명령의 기본 출력
+NAMES_SEARCH_PATHS = (_ENV_NAMES_PATH,) if _ENV_NAMES_PATH else (PACKAGED_NAMES_PATH, USER_NAMES_PATH)
+BACKGROUND_NAMES_PATH = _ENV_NAMES_PATH or USER_NAMES_PATH           # 게임이 배경에서 만드는 곳
+
+# 화면에 고를 수 있는 언어 -> 찾아볼 PokeAPI 언어 코드 (앞에서부터)
+DISPLAY_LANGUAGES = {
+    'ko': ('ko',),
+    'ja': ('ja-Hrkt', 'ja'),   # 가타카나 이름 우선
+    'en': ('en',),
+}
+LANGUAGE_LABELS = {'ko': "한국어", 'ja': "日本語", 'en': "English"}
+DEFAULT_LANGUAGE = 'ko'
+
+
+class NamesError(Exception):
+    """이름 색인 파일 형식이 맞지 않음."""
+
+
+class NameIndex:
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            data = f.read()
+        try:
+            magic, version, self.first_id, self.count, n_languages, names_size = HEADER.unpack_from(data, 0)
+        except struct.error:
+            raise NamesError(f"{path}: 파일이 너무 짧습니다") from None
+        if magic != MAGIC or version != VERSION:
+            raise NamesError(f"{path}: 이름 색인 파일이 아닙니다")
+
+        pos = HEADER.size
+        self.languages = []
+        for _ in range(n_languages):
+            length = data[pos]
+            self.languages.append(data[pos + 1:pos + 1 + length].decode('ascii'))
+            pos += 1 + length
+        self._language_index = {code: j for j, code in enumerate(self.languages)}
+        self._offsets_at = pos
+        names_at = pos + OFFSET_PAIR.size // 2 * (self.count * n_languages + 1)
+        if names_at + names_size != len(data):
+            raise NamesError(f"{path}: 파일 길이가 맞지 않습니다")
+        self._data = data
+        self._names_at = names_at
+
+    @classmethod
+    def open_default(cls):
+        """NAMES_SEARCH_PATHS에서 처음 열리는 이름 색인. 없거나 모두 깨졌으면 None."""
+        for path in NAMES_SEARCH_PATHS:
+            if not os.path.exists(path):
+                continue
+            try:
+                return cls(path)
+            except (OSError, NamesError) as e:
+                print(f"Warning: Could not open name index: {e}")
+        return None
+
+    # ---------------- 조회 -----------------
+    def __contains__(self, poke_id):
+        return 0 <= int(poke_id) - self.first_id < self.count
+
+    def lookup(self, poke_id, language):
+        """번호(정수 또는 문자열)와 PokeAPI 언어 코드로 이름. 없으면 None."""
+        j = self._language_index.get(language)
+        i = int(poke_id) - self.first_id
+        if j is None or not 0 <= i < self.count:
+            return None
+        k = i * len(self.languages) + j
+        start, end = OFFSET_PAIR.unpack_from(self._data, self._offsets_at + 4 * k)
+        if start == end:
+            return None
+        return self._data[self._names_at + start:self._names_at + end].decode('utf-8')
+
+    def display_name(self, poke_id, language=DEFAULT_LANGUAGE):
+        """화면 언어('ko', 'ja', 'en')로 이름. 그 언어 이름이 없으면 None."""
+        for code in DISPLAY_LANGUAGES.get(language, (language,)):
+            name = self.lookup(poke_id, code)
+            if name is not None:
+                return name
+        return None
+
+
+def species_names(species):
+    """pokemon-species JSON -> {언어 코드: 이름}."""
+    return {entry['language']['name']: entry['name'] for entry in species.get('names', ())}
+
+
+# ---------------- 빌드 -----------------
+def pack(names_by_id):
+    """{번호: {언어 코드: 이름}} 를 색인 bytes로 묶는다. 번호는 빈 곳 없이 이어져야 한다."""
+    if not names_by_id:
+        raise NamesError("묶을 이름이 없습니다")
+    ids = sorted(names_by_id)
+    first_id = ids[0]
+    if ids != list(range(first_id, first_id + len(ids))):
+        raise NamesError("번호가 이어지지 않습니다")
+    languages = sorted({code for names in names_by_id.values() for code in names})
+
+    out = bytearray(HEADER.size)
+    for code in languages:
+        label = code.encode('ascii')
+        out.append(len(label))
+        out += label
+    offsets = [0]
+    names = bytearray()
+    for poke_id in ids:
+        for code in languages:
+            names += names_by_id[poke_id].get(code, '').encode('utf-8')
+            offsets.append(len(names))
+    out += struct.pack(f'<{len(offsets)}I', *offsets)
+    out += names
+    HEADER.pack_into(out, 0, MAGIC, VERSION, first_id, len(ids), len(languages), len(names))
+    return bytes(out)
+
+
+def _mirror_source(directory):
+    """api-data 저장소 폴더(data/api/v2 또는 그 위)에서 종 JSON을 읽는 함수."""
+    for root in (directory, os.path.join(directory, 'api', 'v2'), os.path.join(directory, 'data', 'api', 'v2')):
+        if os.path.isdir(os.path.join(root, 'pokemon-species')):
+            break
+    else:
+        raise NamesError(f"{directory}: pokemon-species 폴더가 없습니다")
+
+    def load(poke_id):
+        with open(os.path.join(root, 'pokemon-species', str(poke_id), 'index.json'), encoding='utf-8') as f:
+            return json.load(f)
+    return load
+
+
+def build(path=DEFAULT_NAMES_PATH, fetcher=None, mirror=None, limit=GEN1_COUNT):
+    """1세대 종 이름을 모두 모아 색인 파일을 만든다.
+
+    mirror(폴더)가 있으면 거기서 읽고, 아니면 fetcher(기본: LINE530_API_BASE의
+    AssetFetcher)로 pokemon-species/1..limit을 동시에 받는다. 넘겨받은 fetcher는
+    닫지 않는다 (여기서 만든 것만 닫음).
+    """
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    started = time.perf_counter()
+    if mirror is not None:
+        load = _mirror_source(mirror)
+        workers = 1
+    else:
+        from line530.fetch import AssetFetcher
+        owned = fetcher is None
+        fetcher = fetcher or AssetFetcher(deadline=None)
+        load = lambda poke_id: fetcher.get_json(fetcher.species_url(poke_id))
+        workers = fetcher.workers
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            species = list(pool.map(load, range(1, limit + 1)))
+    finally:
+        if fetcher is not None:
+            fetcher.stats.add(elapsed=time.perf_counter() - started)
+            print(f"[이름] {fetcher.stats.summary()}")
+            if owned:
+                fetcher.close()
+
+    data = pack({poke_id: species_names(entry) for poke_id, entry in enumerate(species, 1)})
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: Could not write name index to {path}: {e} (LINE530_NAMES로 다른 경로를 정할 수 있음)")
+        raise
+    index = NameIndex(path)
+    print(f"[이름] {path}: 포켓몬 {index.count}마리, 언어 {len(index.languages)}개 "
+          f"({', '.join(index.languages)}), {len(data) / 1024:.1f} KiB")
+    return path
+
+
+def build_in_background(on_done, path=BACKGROUND_NAMES_PATH, workers=2, limit=GEN1_COUNT, fetcher_options=None):
+    """기본 색인 파일이 없을 때 배경 스레드에서 PokeAPI로 만든다 (첫 온라인 실행용).
+
+    다 만들면 on_done(NameIndex)을 작업 스레드에서 부른다 (Tk 쪽은 큐로 넘겨
+    받을 것). 받거나 쓰지 못하면 경고만 남기고 on_done을 부르지 않으며, 다음
+    실행에서 다시 시도한다. fetcher_options는 AssetFetcher 인자 (주소 등). 스레드를 돌려준다.
+    """
+    import threading
+
+    def run():
+        from line530.fetch import AssetFetcher, FetchError
+        try:
+            with AssetFetcher(workers=workers, deadline=None, **(fetcher_options or {})) as fetcher:
+                build(path, fetcher=fetcher, limit=limit)
+            index = NameIndex(path)
+        except (FetchError, OSError, ValueError, KeyError, NamesError) as e:
+            print(f"Warning: Could not build name index: {e}")
+            return
+        on_done(index)
+
+    thread = threading.Thread(target=run, name="name-index", daemon=True)
+    thread.start()
+    return thread
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m line530.names", description="포켓몬 이름 색인 도구")
+    sub = parser.add_subparsers(dest='command', required=True)
+    build_parser = sub.add_parser('build', help="종 데이터에서 이름 색인 파일 만들기")
+    build_parser.add_argument('-o', '--output', default=DEFAULT_NAMES_PATH, help="출력 경로")
+    build_parser.add_argument('--api-base', help="PokeAPI 주소 (로컬 미러 서버 등, 기본: LINE530_API_BASE)")
+    build_parser.add_argument('--mirror', metavar='DIR', help="PokeAPI api-data 저장소를 받아 둔 폴더 (네트워크 없이)")
+    build_parser.add_argument('--limit', type=int, default=GEN1_COUNT, help="도감 앞 몇 마리까지")
+    show_parser = sub.add_parser('show', help="번호로 이름 찾기")
+    show_parser.add_argument('ids', type=int, nargs='+')
+    show_parser.add_argument('--lang', help="PokeAPI 언어 코드 또는 ko/ja/en (생략하면 모든 언어)")
+    show_parser.add_argument('--index', help="색인 파일 경로 (생략하면 기본 위치에서 찾음)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        if args.api_base:
+            from line530.fetch import AssetFetcher
+            with AssetFetcher(api_base=args.api_base, deadline=None) as fetcher:
+                build(args.output, fetcher=fetcher, mirror=args.mirror, limit=args.limit)
+        else:
+            build(args.output, mirror=args.mirror, limit=args.limit)
+        return
+
+    index = NameIndex(args.index) if args.index else NameIndex.open_default()
+    if index is None:
+        parser.error(f"이름 색인이 없습니다: {', '.join(NAMES_SEARCH_PATHS)} (python -m line530.names build)")
+    for poke_id in args.ids:
+        if args.lang:
+            name = (index.display_name(poke_id, args.lang) if args.lang in DISPLAY_LANGUAGES
+                    else index.lookup(poke_id, args.lang))
+            print(f"{poke_id}: {name or '-'}")
+        else:
+            names = ", ".join(f"{code}={index.lookup(poke_id, code)}" for code in index.languages
+                              if index.lookup(poke_id, code) is not None)
+            print(f"{poke_id}: {names or '-'}")
+
+
+if __name__ == "__main__":
+    main()
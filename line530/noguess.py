@@ -0,0 +1,296 @@
+"""추측 없이 풀 수 있는 보드(노게스) 만들기와 미리 만들어 두는 보드 풀.
+
+첫 클릭 칸에서 시작해 풀이기(solver.MineSolver)가 확실한 추론만으로 모든
+안전한 칸을 열 수 있으면 통과, 아니면 지뢰를 다시 놓는다. 지뢰가 빽빽할수록
+통과율이 낮아 오래 걸리므로, 생성은 별도 프로세스 풀에서 하고 결과는
+(보드 크기, 지뢰 수, 첫 클릭 칸 종류)별로 몇 개씩 모아 둔다.
+
+첫 클릭 칸 종류는 보드 모양의 대칭으로 묶는다. 한 종류의 보드를 대칭
+변환하면 같은 종류의 다른 칸에서 시작하는 보드가 되므로, 모든 칸 대신 종류마다
+하나만 준비하면 된다. 정사각형의 회전/뒤집기 8가지 중 이웃 관계를 지키는 것만
+쓰고 (보통/나이트는 8가지 모두, 육각은 2가지라 약 1/2), 토러스는 평행 이동으로
+모든 칸이 한 종류다. 종류가 너무 많으면 가운데에 가까운 종류부터 한도까지만
+미리 채우고, 나머지는 처음 눌렸을 때부터 채운다.
+
+이미 돌고 있는 작업은 취소할 수 없으므로, 풀에 넣는 작업은 작업 프로세스 수만큼만
+두고 나머지는 풀 안의 대기열에 둔다. 설정이 바뀌면 대기열을 비우고, 돌던 작업이
+예전 설정의 보드를 돌려주면 버린다.
+"""
+import os
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from functools import lru_cache
+
+from line530 import board, topology as topologies
+from line530.engine import GameEngine
+from line530.solver import MineSolver
+
+BOARDS_PER_CLASS = 1       # 종류마다 미리 만들어 둘 보드 수
+MAX_ATTEMPTS = 5000        # 작업 하나가 지뢰를 다시 놓아 보는 최대 횟수
+JOB_DEADLINE_S = 5.0       # 작업 하나의 최대 시간
+MAX_PREFILL_BOARD = 30     # 이보다 큰 보드는 미리 채우지 않는다 (눌린 종류만 채움)
+# 미리 채우는 종류 수 한도 (30x30 정사각형 보드의 종류 수와 같음). 넘으면 가운데부터
+MAX_PREFILL_CLASSES = (MAX_PREFILL_BOARD // 2) * (MAX_PREFILL_BOARD // 2 + 1) // 2
+GIVE_UP_RETRY_S = 120.0    # 보드를 못 찾은 종류를 다시 시도하기까지 기다리는 시간
+
+
+# ---------------- 대칭 -----------------
+def _transforms(n):
+    last = n - 1
+    return (
+        lambda r, c: (r, c),
+        lambda r, c: (c, last - r),
+        lambda r, c: (last - r, last - c),
+        lambda r, c: (last - c, r),
+        lambda r, c: (r, last - c),
+        lambda r, c: (last - r, c),
+        lambda r, c: (c, r),
+        lambda r, c: (last - c, last - r),
+    )
+
+
+@lru_cache(maxsize=32)
+def _symmetries(board_size, topology_name):
+    """회전/뒤집기 8가지 중 이 모양의 이웃 관계를 지키는 것들.
+
+    이웃 표로 직접 확인한다. 결과는 보드 크기의 짝/홀에만 달려 있으므로
+    (육각은 홀수 행을 미는 방향이 뒤집기에 따라 바뀜) 큰 보드는 짝/홀이 같은
+    작은 보드로 확인한다.
+    """
+    n = board_size if board_size <= MAX_PREFILL_BOARD else 8 + board_size % 2
+    table = topologies.neighbour_table(topology_name, n)
+    kept = []
+    for k, t in enumerate(_transforms(n)):
+        moved = [r * n + c for r, c in (t(*divmod(i, n)) for i in range(n * n))]
+        if all(sorted(moved[j] for j in table.neighbours(i)) == sorted(table.neighbours(moved[i]))
+               for i in range(n * n)):
+            kept.append(k)
+    transforms = _transforms(board_size)
+    return tuple(transforms[k] for k in kept)
+
+
+def cell_class(board_size, r, c, topology=None):
+    """(r, c)와 대칭인 칸들 중 대표 칸. 같은 대표 칸이면 같은 종류."""
+    topology = topologies.get(topology)
+    if topology.wrap:
+        return 0, 0     # 가장자리가 이어진 보드는 평행 이동하면 어느 칸이나 (0, 0)
+    return min(t(r, c) for t in _symmetries(board_size, topology.name))
+
+
+def cell_classes(board_size, topology=None):
+    """보드의 모든 첫 클릭 칸 종류 (대표 칸 목록)."""
+    return sorted({cell_class(board_size, r, c, topology)
+                   for r in range(board_size) for c in range(board_size)})
+
+
+def map_board(board_size, mine_cells, source, target, topology=None):
+    """source 칸에서 시작하도록 만든 보드를, 같은 종류의 target 칸에서 시작하는 보드로."""
+    topology = topologies.get(topology)
+    n = board_size
+    if topology.wrap:
+        dr, dc = target[0] - source[0], target[1] - source[1]
+        return [(r + dr) % n * n + (c + dc) % n for r, c in (divmod(i, n) for i in mine_cells)]
+    for t in _symmetries(board_size, topology.name):
+        if t(*source) == target:
+            return [board_size * nr + nc for nr, nc in
+                    (t(*divmod(i, board_size)) for i in mine_cells)]
+    raise ValueError(f"{source} 와 {target} 은 같은 종류가 아닙니다")
+
+
+# ---------------- 생성 (작업 프로세스) -----------------
+def is_solvable(board_size, mine_cells, safe_row, safe_col, topology=None):
+    """첫 클릭부터 확실한 추론만으로 끝까지 풀리는지."""
+    engine = GameEngine(board_size, len(mine_cells), topology=topology)
+    engine.load_mines(mine_cells)
+    solver = MineSolver(engine)
+    engine.reveal(engine.index(safe_row, safe_col))
+    while not engine.over:
+        solver.propagate()
+        if not solver.safe:
+            # 확률 계산에서 모든 배치에 안전한 칸이 나오면 solver.safe에 들어간다
+            _, risk = solver.hint()
+            if risk > 0 or not solver.safe:
+                return False
+        for i in sorted(solver.safe):
+            engine.reveal(i)
+    return engine.won
+
+
+def generate(board_size, num_mines, safe_row, safe_col, seed,
+             max_attempts=MAX_ATTEMPTS, deadline_s=JOB_DEADLINE_S, topology=None):
+    """노게스 보드 하나를 만든다 (프로세스 풀에서 실행).
+
+    (지뢰 칸 번호 목록 또는 None, 시도 횟수, 걸린 초)를 돌려준다.
+    """
+    started = time.perf_counter()
+    rng = random.Random(seed)
+    table = topologies.get(topology).table(board_size)
+    attempts = 0
+    while attempts < max_attempts and time.perf_counter() - started < deadline_s:
+        attempts += 1
+        cells = [r * board_size + c for r, c in
+                 board.place_mines(board_size, num_mines, safe_row, safe_col, rng=rng, table=table)]
+        if is_solvable(board_size, cells, safe_row, safe_col, topology):
+            return cells, attempts, time.perf_counter() - started
+    return None, attempts, time.perf_counter() - started
+
+
+# ---------------- 보드 풀 (Tk 쪽) -----------------
+class NoGuessStats:
+    """생성 시도 수와 통과율, 걸린 시간 기록."""
+
+    def __init__(self):
+        self.attempts = 0
+        self.accepted = 0
+        self.gave_up = 0
+        self.seconds = 0.0
+        self.served = 0
+        self.missed = 0
+        self.stale = 0      # 설정이 바뀐 뒤에 끝나 버린 보드
+
+    def summary(self):
+        rate = self.accepted / self.attempts if self.attempts else 0.0
+        per_board = self.seconds / self.accepted * 1000 if self.accepted else 0.0
+        return (
+            f"생성 {self.accepted}개 (시도 {self.attempts}회, 통과율 {rate:.1%}, "
+            f"보드당 {per_board:.1f} ms, 포기 {self.gave_up}, 버림 {self.stale}), "
+            f"바로 꺼냄 {self.served}회, 준비 안 됨 {self.missed}회"
+        )
+
+
+class BoardPool:
+    """(보드 크기, 지뢰 수, 보드 모양, 첫 클릭 칸 종류)별로 노게스 보드를 미리 만들어 둔다.
+
+    prefill()로 현재 설정의 모든 종류를 채우기 시작하고, take()로 첫 클릭
+    칸에 맞는 보드를 바로 꺼낸다. 꺼낸 종류는 다시 채운다. 프로세스 풀에 넣은
+    작업은 workers개까지이고 (키마다는 per_class개까지), 나머지는 _queued에서 기다린다.
+    """
+
+    def __init__(self, workers=None, per_class=BOARDS_PER_CLASS, rng=None):
+        self.workers = workers or max((os.cpu_count() or 2) - 1, 1)
+        self.per_class = per_class
+        self.rng = rng or random.Random()
+        self.stats = NoGuessStats()
+        self._executor = None
+        # cancel()은 완료 콜백을 같은 스레드에서 바로 부르므로 RLock
+        self._lock = threading.RLock()
+        self._ready = defaultdict(list)     # (크기, 지뢰, 모양, 대표 칸) -> [지뢰 칸 목록, ...]
+        self._pending = defaultdict(list)   # 같은 키 -> [Future, ...] (풀에 넣은 작업)
+        self._queued = deque()              # 풀에 넣을 차례를 기다리는 키들
+        self._given_up = {}                 # 통과하는 보드를 못 찾은 키 -> 포기한 시각
+        self._config = None                 # 지금 설정 (크기, 지뢰, 모양). 다른 설정의 결과는 버린다
+
+    def _in_flight(self):
+        return sum(len(futures) for futures in self._pending.values())
+
+    def _pump(self):
+        """풀에 넣은 작업이 workers개보다 적으면 대기열에서 꺼내 넣는다."""
+        while self._queued and self._in_flight() < self.workers:
+            self._submit(self._queued.popleft())
+
+    def _submit(self, key):
+        if self._executor is None:
+            # 프로세스 생성 비용은 노게스를 처음 쓸 때만
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        size, mines, topology, (r, c) = key
+        future = self._executor.submit(generate, size, mines, r, c, self.rng.getrandbits(64),
+                                       topology=topology)
+        self._pending[key].append(future)
+        future.add_done_callback(lambda f, key=key: self._on_done(key, f))
+
+    def _on_done(self, key, future):
+        # 프로세스 풀의 관리 스레드에서 불린다
+        with self._lock:
+            pending = self._pending.get(key, [])
+            if future in pending:
+                pending.remove(future)
+            try:
+                self._collect(key, future)
+            finally:
+                if self._executor is not None:
+                    self._pump()
+
+    def _collect(self, key, future):
+        if future.cancelled():
+            return
+        try:
+            cells, attempts, seconds = future.result()
+        except Exception as e:
+            print(f"Warning: 노게스 보드 생성 실패: {e}")
+            self._given_up[key] = time.monotonic()
+            return
+        self.stats.attempts += attempts
+        self.stats.seconds += seconds
+        if self._config is not None and key[:3] != self._config:
+            self.stats.stale += 1      # 취소할 수 없던, 이미 돌던 예전 설정의 작업
+            return
+        if cells is None:
+            self.stats.gave_up += 1
+            self._given_up[key] = time.monotonic()
+            return
+        self.stats.accepted += 1
+        self._ready[key].append(cells)
+
+    def _refill(self, key):
+        given_up = self._given_up.get(key)
+        if given_up is not None:
+            if time.monotonic() - given_up < GIVE_UP_RETRY_S:
+                return
+            del self._given_up[key]
+        missing = (self.per_class - len(self._ready[key]) - len(self._pending[key])
+                   - self._queued.count(key))
+        self._queued.extend([key] * missing)
+        self._pump()
+
+    def prefill(self, board_size, num_mines, topology=None):
+        """이 설정의 첫 클릭 칸 종류들을 채우기 시작한다. 다른 설정의 대기 작업은 취소.
+
+        종류가 MAX_PREFILL_CLASSES보다 많으면 보드 가운데에 가까운 종류부터 그만큼만
+        채운다 (나머지는 take()에서 처음 눌렸을 때부터 채움).
+        """
+        config = (board_size, num_mines, topologies.get(topology).name)
+        with self._lock:
+            self._config = config
+            self._queued = deque(key for key in self._queued if key[:3] == config)
+            for key, futures in self._pending.items():
+                if key[:3] != config:
+                    for future in list(futures):
+                        future.cancel()
+            for key in [k for k in self._ready if k[:3] != config]:
+                del self._ready[key]
+            # 다른 설정에서 포기한 종류는 그 설정으로 돌아오면 다시 시도한다
+            for key in [k for k in self._given_up if k[:3] != config]:
+                del self._given_up[key]
+            if board_size > MAX_PREFILL_BOARD:
+                return
+            middle = (board_size - 1) / 2
+            classes = sorted(cell_classes(board_size, topology),
+                             key=lambda rc: (rc[0] - middle) ** 2 + (rc[1] - middle) ** 2)
+            for cls in classes[:MAX_PREFILL_CLASSES]:
+                self._refill(config + (cls,))
+
+    def take(self, board_size, num_mines, r, c, topology=None):
+        """(r, c)를 첫 클릭으로 하는 노게스 보드의 지뢰 칸 목록. 준비된 게 없으면 None."""
+        cls = cell_class(board_size, r, c, topology)
+        key = (board_size, num_mines, topologies.get(topology).name, cls)
+        with self._lock:
+            ready = self._ready.get(key)
+            cells = ready.pop() if ready else None
+            if cells is None:
+                self.stats.missed += 1
+            else:
+                self.stats.served += 1
+            self._refill(key)
+        if cells is None:
+            return None
+        return map_board(board_size, cells, cls, (r, c), topology)
+
+    def shutdown(self):
+        with self._lock:
+            self._queued.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,53 @@
+"""시작 시간 측정 (``--startup-profile``).
+
+프로세스 시작부터 첫 화면이 그려질 때까지를 단계별로 기록하고,
+목표 시간(STARTUP_BUDGET_MS)을 넘었는지 알려 준다.
+"""
+import sys
+import time
+
+STARTUP_BUDGET_MS = 150
+# 첫 화면 전에 불러오지 않아야 하는 무거운 모듈들
+HEAVY_MODULES = ('requests', 'PIL.Image', 'PIL.ImageTk')
+
+
+class StartupProfile:
+    def __init__(self, started_at=None, enabled=False, budget_ms=STARTUP_BUDGET_MS):
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self.phases = []          # (이름, 초)
+        self.first_paint_at = None
+        self._last = self.started_at
+
+    def mark(self, phase, at=None):
+        """직전 표시부터 지금(또는 at)까지를 phase 단계로 기록."""
+        now = at if at is not None else time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def first_paint(self):
+        """Tk가 첫 화면을 그린 뒤(after_idle) 부른다. 요약을 출력."""
+        if self.first_paint_at is not None:
+            return
+        self.mark("첫 화면 그리기")
+        self.first_paint_at = self._last
+        if self.enabled:
+            self.report()
+
+    def report(self, out=None):
+        out = out or sys.stderr
+        total_ms = (self._last - self.started_at) * 1000
+        print("[시작 프로파일]", file=out)
+        for phase, seconds in self.phases:
+            print(f"  {phase:<16} {seconds * 1000:8.1f} ms", file=out)
+        verdict = "OK" if total_ms <= self.budget_ms else "초과"
+        print(f"  {'합계':<16} {total_ms:8.1f} ms (목표 {self.budget_ms} ms: {verdict})", file=out)
+        loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+        print(f"  첫 화면 전에 불러온 무거운 모듈: {', '.join(loaded) or '없음'}", file=out)
+
+    def assets_loaded(self, seconds, loaded, total):
+        """배경 자원 로딩이 끝났을 때 (첫 화면과 별개로 진행됨)."""
+        if self.enabled:
+            print(f"[시작 프로파일] 배경 자원 로딩 {seconds * 1000:.1f} ms (포켓몬 {loaded}/{total})",
+                  file=sys.stderr)
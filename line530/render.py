@@ -0,0 +1,559 @@
+"""보드 그리기 방식 (렌더러).
+
+세 가지를 같은 메서드로 바꿔 쓸 수 있다.
+    ButtonBoardRenderer    칸마다 tk.Button 하나 (원래 방식)
+    CanvasBoardRenderer    tk.Canvas 하나에 칸마다 이미지 아이템
+    ViewportBoardRenderer  스크롤되는 캔버스, 보이는 칸만 아이템을 만들어 재사용
+
+육각 보드(topology 'hex')는 build(..., shift_odd_rows=True)로 홀수 행을 반 칸
+오른쪽으로 밀어 그린다.
+
+캔버스 쪽은 숫자/깃발/배경 타일을 미리 그린 이미지로 쓰고, 클릭 위치는
+나눗셈으로 칸을 찾으며, 바뀐 칸의 아이템만 고친다. 위젯을 칸 수만큼
+만들지 않으므로 재시작이 빠르고 더 큰 보드도 다룰 수 있다.
+"""
+import math
+import time
+import tkinter as tk
+
+# --- 색상 설정 ---
+COLORS = {
+    1: '#0000FF', 2: '#008200', 3: '#FF0000', 4: '#000084',
+    5: '#840000', 6: '#008284', 7: '#840084', 8: '#000000',
+}
+BG_COLOR_REVEALED = '#D0D0D0'
+BG_COLOR_LOSS = '#FFB6C1'
+BG_COLOR_WIN = '#FFFACD'
+BG_COLOR_TRIGGERED = 'red'
+
+# 렌더러별 최대 보드 크기 (버튼은 위젯 수 때문에 20으로 제한)
+MAX_BOARD_SIZE = {'button': 20, 'canvas': 40, 'viewport': 300}
+
+
+def _rgba(color):
+    named = {'red': '#FF0000'}
+    color = named.get(color, color).lstrip('#')
+    return (int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16), 255)
+
+
+class ButtonBoardRenderer:
+    name = 'button'
+
+    def __init__(self, parent, images, registry, on_left, on_right):
+        self.parent = parent
+        self.images = images
+        self.registry = registry
+        self.on_left = on_left
+        self.on_right = on_right
+        self.tile = 0
+        self.buttons = []
+
+    def build(self, board_size, tile, shift_odd_rows=False):
+        self.destroy()
+        self.tile = tile
+        for r in range(board_size):
+            row_buttons = []
+            for c in range(board_size):
+                button = tk.Button(
+                    self.parent,
+                    width=tile,
+                    height=tile,
+                    image=self.images.get('bush'),
+                    relief=tk.RAISED,
+                    bd=1
+                )
+                button.bind('<Button-1>', lambda e, r=r, c=c: self.on_left(r, c))
+                button.bind('<Button-3>', lambda e, r=r, c=c: self.on_right(r, c))
+                if shift_odd_rows:
+                    # 칸마다 두 열을 차지하게 하고 홀수 행은 한 열(반 칸) 밀어 놓는다
+                    button.grid(row=r, column=2 * c + (r & 1), columnspan=2)
+                else:
+                    button.grid(row=r, column=c)
+                row_buttons.append(button)
+            self.buttons.append(row_buttons)
+
+    def rescale(self, tile):
+        """위젯은 그대로 두고 크기만 바꾼다. 모든 칸이 수풀로 돌아가므로 호출한 쪽이 다시 그린다."""
+        self.tile = tile
+        bush = self.images.get('bush')
+        for row in self.buttons:
+            for button in row:
+                button.config(width=tile, height=tile, image=bush)
+
+    def destroy(self):
+        for widget in self.parent.winfo_children():
+            widget.destroy()
+        self.buttons = []
+
+    def object_count(self):
+        """만든 Tk 객체 수 (위젯 + 바인딩)."""
+        return sum(len(row) for row in self.buttons) * 3
+
+    def draw_revealed(self, r, c, count):
+        button = self.buttons[r][c]
+        button.config(state='disabled', relief=tk.SUNKEN, bg=BG_COLOR_REVEALED)
+        if count > 0:
+            button.config(
+                image=self.images['blank'],
+                text=str(count),
+                font=('Helvetica', 10, 'bold'),
+                fg=COLORS.get(count),
+                compound='center'
+            )
+        else:
+            button.config(image=self.images['blank'], text='')
+
+    def draw_flag(self, r, c, flagged):
+        self.buttons[r][c].config(image=self.images['flag'] if flagged else self.images['bush'])
+
+    def draw_mine(self, r, c, mine, bg):
+        """mine: (스프라이트 키, 이름) 또는 'P'."""
+        button = self.buttons[r][c]
+        photo = None
+        if not isinstance(mine, str):
+            photo = self.registry.photo(mine[0], self.tile)
+        button.config(
+            image=photo or self.images['blank'],
+            text='' if photo else 'P',
+            compound='center',
+            bg=bg
+        )
+        button.image = photo
+
+
+class CanvasBoardRenderer:
+    name = 'canvas'
+    GAP = 2        # 칸 사이 간격 (버튼 테두리 대신)
+    NUMBER_MASTER_SIZE = 64
+
+    def __init__(self, parent, images, registry, on_left, on_right):
+        self.parent = parent
+        self.images = images
+        self.registry = registry
+        self.on_left = on_left
+        self.on_right = on_right
+        self.tile = 0
+        self.board_size = 0
+        self.shift_odd_rows = False
+        self.canvas = None
+        self.tiles = []       # 칸 번호 -> 바탕 이미지 아이템
+        self.overlays = {}    # 칸 번호 -> 위에 얹은 아이템 (깃발, 포켓몬, 'P')
+        # 캔버스 아이템은 PhotoImage 참조를 들고 있지 않으므로, 저장소에서
+        # 밀려나도 화면에서 사라지지 않게 여기서 붙잡아 둔다
+        self._in_use = set()
+
+    # ---------------- 만들기 -----------------
+    def _row_shift(self, r, pitch):
+        return pitch // 2 if self.shift_odd_rows and r & 1 else 0
+
+    def _width(self, pitch):
+        return self.board_size * pitch + self.GAP + (pitch // 2 if self.shift_odd_rows else 0)
+
+    def build(self, board_size, tile, shift_odd_rows=False):
+        self.tile = tile
+        self.board_size = board_size
+        self.shift_odd_rows = shift_odd_rows
+        pitch = tile + self.GAP
+        side = board_size * pitch + self.GAP
+
+        if self.canvas is None:
+            self.canvas = tk.Canvas(self.parent, highlightthickness=0, bg='#808080')
+            self.canvas.bind('<Button-1>', self._on_click_left)
+            self.canvas.bind('<Button-3>', self._on_click_right)
+            self.canvas.pack()
+        self.canvas.config(width=self._width(pitch), height=side)
+        self.canvas.delete('all')
+        self.overlays = {}
+        self._in_use = set()
+
+        bush = self.images.get('bush')
+        create = self.canvas.create_image
+        self.tiles = [
+            create(self.GAP + c * pitch + self._row_shift(r, pitch), self.GAP + r * pitch,
+                   image=bush, anchor=tk.NW)
+            for r in range(board_size)
+            for c in range(board_size)
+        ]
+
+    def rescale(self, tile):
+        """바탕 아이템은 그대로 두고 자리와 크기만 바꾼다. 겹친 아이템(깃발 등)은 지우므로
+        호출한 쪽이 다시 그린다."""
+        self.tile = tile
+        pitch = tile + self.GAP
+        side = self.board_size * pitch + self.GAP
+        canvas = self.canvas
+        canvas.config(width=self._width(pitch), height=side)
+        for i in list(self.overlays):
+            self._clear_overlay(i)
+        self._in_use = set()
+        bush = self.images.get('bush')
+        size = self.board_size
+        for i, item in enumerate(self.tiles):
+            r, c = divmod(i, size)
+            canvas.coords(item, self.GAP + c * pitch + self._row_shift(r, pitch), self.GAP + r * pitch)
+            canvas.itemconfig(item, image=bush)
+
+    def destroy(self):
+        if self.canvas is not None:
+            self.canvas.destroy()
+            self.canvas = None
+        self.tiles = []
+        self.overlays = {}
+        self._in_use = set()
+
+    def object_count(self):
+        """만든 Tk 객체 수 (캔버스 1개 + 아이템)."""
+        return 1 + len(self.tiles) + len(self.overlays)
+
+    # ---------------- 클릭 -> 칸 -----------------
+    def _cell_at(self, event):
+        pitch = self.tile + self.GAP
+        x = int(self.canvas.canvasx(event.x)) - self.GAP
+        y = int(self.canvas.canvasy(event.y)) - self.GAP
+        if y < 0:
+            return None
+        r = y // pitch
+        x -= self._row_shift(r, pitch)
+        if x < 0:
+            return None
+        c = x // pitch
+        if r >= self.board_size or c >= self.board_size:
+            return None
+        return r, c
+
+    def _on_click_left(self, event):
+        cell = self._cell_at(event)
+        if cell is not None:
+            self.on_left(*cell)
+
+    def _on_click_right(self, event):
+        cell = self._cell_at(event)
+        if cell is not None:
+            self.on_right(*cell)
+
+    # ---------------- 타일 이미지 -----------------
+    def _solid(self, color):
+        key = f"solid/{color}"
+        if not self.registry.has(key):
+            self.registry.add_solid(key, _rgba(color))
+        return self.registry.photo(key, self.tile)
+
+    def _number(self, count):
+        """회색 바탕에 숫자를 미리 그린 타일 (숫자마다 한 번만 그림)."""
+        key = f"number/{count}"
+        if not self.registry.has(key):
+            from PIL import Image, ImageDraw, ImageFont
+            size = self.NUMBER_MASTER_SIZE
+            img = Image.new('RGBA', (size, size), _rgba(BG_COLOR_REVEALED))
+            try:
+                font = ImageFont.load_default(size=size * 5 // 8)
+            except (TypeError, OSError):
+                font = ImageFont.load_default()
+            color = COLORS.get(count, '#000000')
+            ImageDraw.Draw(img).text(
+                (size / 2, size / 2), str(count), fill=color, font=font,
+                anchor='mm', stroke_width=1, stroke_fill=color,
+            )
+            self.registry.add_image(key, img)
+        return self.registry.photo(key, self.tile)
+
+    # ---------------- 칸 그리기 (바뀐 칸만) -----------------
+    def _clear_overlay(self, i):
+        item = self.overlays.pop(i, None)
+        if item is not None:
+            self.canvas.delete(item)
+
+    def _overlay(self, i, **options):
+        self._clear_overlay(i)
+        pitch = self.tile + self.GAP
+        r, c = divmod(i, self.board_size)
+        x = self.GAP + c * pitch + self._row_shift(r, pitch) + self.tile // 2
+        y = self.GAP + r * pitch + self.tile // 2
+        if 'text' in options:
+            item = self.canvas.create_text(x, y, font=('Helvetica', 10, 'bold'), **options)
+        else:
+            self._in_use.add(options['image'])
+            item = self.canvas.create_image(x, y, anchor=tk.CENTER, **options)
+        self.overlays[i] = item
+
+    def draw_revealed(self, r, c, count):
+        i = r * self.board_size + c
+        self._clear_overlay(i)
+        image = self._number(count) if count > 0 else self._solid(BG_COLOR_REVEALED)
+        self._in_use.add(image)
+        self.canvas.itemconfig(self.tiles[i], image=image)
+
+    def draw_flag(self, r, c, flagged):
+        i = r * self.board_size + c
+        if flagged:
+            self._overlay(i, image=self.images['flag'])
+        else:
+            self._clear_overlay(i)
+
+    def draw_mine(self, r, c, mine, bg):
+        i = r * self.board_size + c
+        background = self._solid(bg)
+        self._in_use.add(background)
+        self.canvas.itemconfig(self.tiles[i], image=background)
+        photo = None
+        if not isinstance(mine, str):
+            photo = self.registry.photo(mine[0], self.tile)
+        if photo is not None:
+            self._overlay(i, image=photo)
+        else:
+            self._overlay(i, text='P')
+
+
+# 뷰포트 렌더러가 기억하는 칸 모양
+_HIDDEN, _REVEALED, _MINE = 0, 1, 2
+
+
+class ViewportBoardRenderer(CanvasBoardRenderer):
+    """아주 큰 보드(예: 300x300)용. 스크롤되는 캔버스에 보이는 범위 + 여유 줄만큼의
+    타일 아이템(슬롯)을 만들어 두고, 스크롤하면 화면 밖으로 나간 슬롯을 새로 들어온
+    칸에 다시 쓴다.
+
+    칸 모양은 bytearray로 따로 기억하므로, 화면 밖 칸의 draw_* 호출은 값만 적고
+    끝난다. 그 칸이 화면에 들어올 때 기억해 둔 모양으로 그린다.
+    """
+    name = 'viewport'
+    VIEW_PX = 640     # 보이는 캔버스의 최대 가로/세로 (픽셀)
+    MARGIN = 2        # 보이는 범위 밖으로 미리 만들어 둘 줄 수
+
+    def __init__(self, parent, images, registry, on_left, on_right):
+        super().__init__(parent, images, registry, on_left, on_right)
+        self.frame = None
+        self.looks = bytearray()     # 칸 번호 -> _HIDDEN / _REVEALED / _MINE
+        self.counts = bytearray()    # 열린 칸의 숫자
+        self.flags = bytearray()
+        self.mines = {}              # 칸 번호 -> (포켓몬, 바탕색)
+        # 슬롯: [바탕 아이템, 겹침 이미지 아이템, 'P' 글자 아이템, 보여 주는 칸 번호]
+        self.slots = []
+        self.pool_rows = 0
+        self.pool_cols = 0
+        self.window = None           # 슬롯이 덮고 있는 (첫 행, 첫 열)
+
+    # ---------------- 만들기 -----------------
+    def build(self, board_size, tile, shift_odd_rows=False):
+        self.tile = tile
+        self.board_size = board_size
+        self.shift_odd_rows = shift_odd_rows
+        pitch = tile + self.GAP
+        side = board_size * pitch + self.GAP
+        width = self._width(pitch)
+        view = min(side, self.VIEW_PX)
+
+        if self.frame is None:
+            self._create_widgets()
+        self.canvas.config(
+            width=min(width, self.VIEW_PX), height=view, scrollregion=(0, 0, width, side),
+            xscrollincrement=pitch, yscrollincrement=pitch,
+        )
+        self.canvas.xview_moveto(0)
+        self.canvas.yview_moveto(0)
+
+        n = board_size * board_size
+        self.looks = bytearray(n)
+        self.counts = bytearray(n)
+        self.flags = bytearray(n)
+        self.mines = {}
+        self._in_use = set()
+
+        # 보이는 칸 수 + 걸친 칸 1줄 + 양쪽 여유
+        visible = math.ceil(view / pitch) + 1
+        pool = min(board_size, visible + 2 * self.MARGIN)
+        if (pool, pool) != (self.pool_rows, self.pool_cols):
+            self._create_slots(pool, pool)
+        else:
+            # 같은 크기면 아이템은 그대로 두고 모두 다시 칠하게만 한다
+            for slot in self.slots:
+                slot[3] = -1
+        self.window = None
+        self._sync_viewport()
+
+    def rescale(self, tile):
+        # 슬롯 수가 타일 크기에 따라 달라지므로 build로 슬롯만 다시 맞춘다 (보드 크기만큼의
+        # 아이템은 원래 없음). 칸 모양 기억도 비워지므로 호출한 쪽이 다시 그린다.
+        self.build(self.board_size, tile, self.shift_odd_rows)
+
+    def _create_widgets(self):
+        self.frame = tk.Frame(self.parent)
+        self.frame.pack()
+        self.canvas = tk.Canvas(self.frame, highlightthickness=0, bg='#808080')
+        ybar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._yview)
+        xbar = tk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self._xview)
+        self.canvas.config(xscrollcommand=xbar.set, yscrollcommand=ybar.set)
+        self.canvas.grid(row=0, column=0)
+        ybar.grid(row=0, column=1, sticky='ns')
+        xbar.grid(row=1, column=0, sticky='ew')
+
+        self.canvas.bind('<Button-1>', self._on_click_left)
+        self.canvas.bind('<Button-3>', self._on_click_right)
+        # 휠: Windows/macOS는 <MouseWheel>, X11은 Button-4/5. Shift를 누르면 가로
+        self.canvas.bind('<MouseWheel>', lambda e: self._yview('scroll', -1 if e.delta > 0 else 1, 'units'))
+        self.canvas.bind('<Shift-MouseWheel>', lambda e: self._xview('scroll', -1 if e.delta > 0 else 1, 'units'))
+        self.canvas.bind('<Button-4>', lambda e: self._yview('scroll', -1, 'units'))
+        self.canvas.bind('<Button-5>', lambda e: self._yview('scroll', 1, 'units'))
+        self.canvas.bind('<Shift-Button-4>', lambda e: self._xview('scroll', -1, 'units'))
+        self.canvas.bind('<Shift-Button-5>', lambda e: self._xview('scroll', 1, 'units'))
+
+    def _create_slots(self, rows, cols):
+        self.canvas.delete('all')
+        self.pool_rows = rows
+        self.pool_cols = cols
+        bush = self.images.get('bush')
+        canvas = self.canvas
+        self.slots = [
+            [
+                canvas.create_image(0, 0, image=bush, anchor=tk.NW),
+                canvas.create_image(0, 0, anchor=tk.CENTER, state=tk.HIDDEN),
+                canvas.create_text(0, 0, text='P', font=('Helvetica', 10, 'bold'), state=tk.HIDDEN),
+                -1,
+            ]
+            for _ in range(rows * cols)
+        ]
+
+    def destroy(self):
+        if self.frame is not None:
+            self.frame.destroy()
+            self.frame = None
+        self.canvas = None
+        self.slots = []
+        self.pool_rows = self.pool_cols = 0
+        self.window = None
+        self._in_use = set()
+
+    def object_count(self):
+        """만든 Tk 객체 수 (캔버스 + 스크롤바 2개 + 슬롯마다 아이템 3개)."""
+        return 3 + len(self.slots) * 3
+
+    # ---------------- 스크롤 -> 슬롯 재사용 -----------------
+    def _xview(self, *args):
+        self.canvas.xview(*args)
+        self._sync_viewport()
+
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self._sync_viewport()
+
+    def _sync_viewport(self):
+        """슬롯들이 지금 보이는 범위(+ 여유)를 덮도록 옮긴다.
+
+        칸 (r, c)는 항상 슬롯 (r % 행 수, c % 열 수)에 그려지므로, 범위가 한 줄
+        밀리면 바뀌는 건 밀려난 줄의 슬롯뿐이다.
+        """
+        pitch = self.tile + self.GAP
+        size = self.board_size
+        top = int(self.canvas.canvasy(0)) // pitch - self.MARGIN
+        left = int(self.canvas.canvasx(0)) // pitch - self.MARGIN
+        r0 = max(min(top, size - self.pool_rows), 0)
+        c0 = max(min(left, size - self.pool_cols), 0)
+        if (r0, c0) == self.window:
+            return
+        self.window = (r0, c0)
+
+        rows, cols = self.pool_rows, self.pool_cols
+        slots = self.slots
+        for r in range(r0, r0 + rows):
+            base = (r % rows) * cols
+            for c in range(c0, c0 + cols):
+                slot = slots[base + c % cols]
+                i = r * size + c
+                if slot[3] != i:
+                    self._bind_slot(slot, r, c, i)
+
+    def _bind_slot(self, slot, r, c, i):
+        pitch = self.tile + self.GAP
+        x = self.GAP + c * pitch + self._row_shift(r, pitch)
+        y = self.GAP + r * pitch
+        half = self.tile // 2
+        self.canvas.coords(slot[0], x, y)
+        self.canvas.coords(slot[1], x + half, y + half)
+        self.canvas.coords(slot[2], x + half, y + half)
+        slot[3] = i
+        self._paint(slot, i)
+
+    def _slot_of(self, i):
+        """칸 i를 그리고 있는 슬롯. 화면 밖이면 None."""
+        if self.window is None:
+            return None
+        r, c = divmod(i, self.board_size)
+        r0, c0 = self.window
+        if not (r0 <= r < r0 + self.pool_rows and c0 <= c < c0 + self.pool_cols):
+            return None
+        return self.slots[(r % self.pool_rows) * self.pool_cols + c % self.pool_cols]
+
+    def _paint(self, slot, i):
+        look = self.looks[i]
+        overlay = None
+        show_text = False
+        if look == _REVEALED:
+            count = self.counts[i]
+            image = self._number(count) if count > 0 else self._solid(BG_COLOR_REVEALED)
+        elif look == _MINE:
+            mine, bg = self.mines[i]
+            image = self._solid(bg)
+            if not isinstance(mine, str):
+                overlay = self.registry.photo(mine[0], self.tile)
+            show_text = overlay is None
+        else:
+            image = self.images.get('bush')
+            if self.flags[i]:
+                overlay = self.images['flag']
+        for photo in (image, overlay):
+            if photo is not None:
+                self._in_use.add(photo)
+
+        canvas = self.canvas
+        canvas.itemconfig(slot[0], image=image)
+        if overlay is not None:
+            canvas.itemconfig(slot[1], image=overlay, state=tk.NORMAL)
+        else:
+            canvas.itemconfig(slot[1], state=tk.HIDDEN)
+        canvas.itemconfig(slot[2], state=tk.NORMAL if show_text else tk.HIDDEN)
+
+    # ---------------- 칸 그리기 (화면 밖이면 기억만) -----------------
+    def _update(self, i):
+        slot = self._slot_of(i)
+        if slot is not None:
+            self._paint(slot, i)
+
+    def draw_revealed(self, r, c, count):
+        i = r * self.board_size + c
+        self.looks[i] = _REVEALED
+        self.counts[i] = count
+        self.flags[i] = 0
+        self._update(i)
+
+    def draw_flag(self, r, c, flagged):
+        i = r * self.board_size + c
+        self.flags[i] = 1 if flagged else 0
+        self._update(i)
+
+    def draw_mine(self, r, c, mine, bg):
+        i = r * self.board_size + c
+        self.looks[i] = _MINE
+        self.mines[i] = (mine, bg)
+        self._update(i)
+
+
+RENDERERS = {
+    ButtonBoardRenderer.name: ButtonBoardRenderer,
+    CanvasBoardRenderer.name: CanvasBoardRenderer,
+    ViewportBoardRenderer.name: ViewportBoardRenderer,
+}
+
+
+def measure_build(renderer, board_size, tile, shift_odd_rows=False):
+    """renderer.build 한 번의 (걸린 초, 늘어난 파이썬 메모리 바이트 또는 None).
+
+    메모리는 tracemalloc이 켜져 있을 때만 잰다 (Tk 내부 메모리는 포함되지 않음).
+    """
+    import tracemalloc
+    tracing = tracemalloc.is_tracing()
+    before = tracemalloc.get_traced_memory()[0] if tracing else 0
+    started = time.perf_counter()
+    renderer.build(board_size, tile, shift_odd_rows)
+    elapsed = time.perf_counter() - started
+    after = tracemalloc.get_traced_memory()[0] if tracing else 0
+    return elapsed, (after - before) if tracing else None
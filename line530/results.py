@@ -0,0 +1,253 @@
+"""끝난 게임 결과를 모아 두는 SQLite 저장소.
+
+게임 창과 시뮬레이터(``--db``)가 같은 표(games)에 한 판씩 쌓는다. 쓰기는 배경
+스레드가 큐에서 모아 한 트랜잭션으로 넣으므로(write-behind) 게임 종료 팝업을
+늦추지 않는다. 읽기는 메인 스레드의 별도 연결로 하고, WAL 모드라 쓰는 중에도
+막히지 않는다.
+
+순위표와 백분위는 (보드 크기, 지뢰 수, 제한 시간, 출처, 승리, 걸린 시간) 인덱스
+하나로 답한다. 조건이 인덱스 앞부분과 같으므로 표가 수백만 줄이어도 해당 설정의
+범위만 읽는다. 설정별 판 수/승 수는 config_totals에 따로 세어 두어 바로 읽는다.
+
+위치: $XDG_DATA_HOME/line530/results.sqlite3 (없으면 ~/.local/share/line530/...)
+"""
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from line530.topology import DEFAULT_TOPOLOGY
+
+WRITE_BATCH = 500          # 한 트랜잭션에 넣는 최대 줄 수
+SOURCE_GAME = 'game'       # 사람이 둔 판. 시뮬레이션은 'sim:<전략>'
+
+COLUMNS = (
+    'played_at', 'source', 'board_size', 'num_mines', 'timer_limit', 'won', 'reason',
+    'duration_ms', 'moves', 'hints_used', 'pokemon_key', 'pokemon_name', 'seed',
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,         -- 유닉스 시각 (초)
+    source TEXT NOT NULL,
+    board_size INTEGER NOT NULL,
+    num_mines INTEGER NOT NULL,
+    timer_limit INTEGER NOT NULL,    -- 초, 0 = 제한 없음
+    won INTEGER NOT NULL,
+    reason TEXT,                     -- 'won', 'mine', 'timeout'
+    duration_ms REAL,
+    moves INTEGER,
+    hints_used INTEGER,
+    pokemon_key TEXT,                -- 패배 때 밟은 포켓몬
+    pokemon_name TEXT,
+    seed INTEGER
+);
+CREATE INDEX IF NOT EXISTS games_by_config
+    ON games (board_size, num_mines, timer_limit, source, won, duration_ms);
+-- 설정별 판 수/승 수 (쓰기 스레드가 games와 같은 트랜잭션에서 갱신)
+CREATE TABLE IF NOT EXISTS config_totals (
+    board_size INTEGER NOT NULL,
+    num_mines INTEGER NOT NULL,
+    timer_limit INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    PRIMARY KEY (board_size, num_mines, timer_limit, source)
+) WITHOUT ROWID;
+"""
+
+_INSERT = f"INSERT INTO games ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+_ADD_TOTALS = (
+    "INSERT INTO config_totals VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT DO UPDATE SET games = games + excluded.games, wins = wins + excluded.wins"
+)
+_CONFIG = "board_size = ? AND num_mines = ? AND timer_limit = ? AND source = ?"
+_STOP = object()
+
+
+def default_db_path():
+    base = os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share')
+    return os.path.join(base, 'line530', 'results.sqlite3')
+
+
+def source_name(base, topology=None):
+    """출처 이름. 보통 보드가 아니면 ':<보드 모양>'을 붙여 모양별 순위표가 섞이지 않게 한다."""
+    return base if topology in (None, DEFAULT_TOPOLOGY) else f"{base}:{topology}"
+
+
+def make_row(board_size, num_mines, won, timer_limit=None, reason=None, duration_ms=None, moves=None,
+             hints_used=None, pokemon=None, seed=None, source=SOURCE_GAME, played_at=None):
+    """한 판의 결과 -> games 표의 한 줄 (COLUMNS 순서). pokemon은 (스프라이트 키, 이름) 또는 None."""
+    key, name = pokemon if isinstance(pokemon, tuple) else (None, None)
+    return (
+        played_at or time.time(), source, board_size, num_mines, timer_limit or 0, int(won),
+        reason or ('won' if won else 'mine'), duration_ms, moves, hints_used, key, name, seed,
+    )
+
+
+class ResultStore:
+    def __init__(self, path=None):
+        self.path = path or default_db_path()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._queue = queue.Queue()
+        self.written = 0
+        # 읽기 연결 (메인 스레드). 표/인덱스도 여기서 만든다.
+        self._db = self._connect()
+        self._db.executescript(SCHEMA)
+        self._writer = threading.Thread(target=self._write_loop, name="results-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    # ---------------- 쓰기 (배경 스레드) -----------------
+    def add(self, row):
+        """make_row()로 만든 한 줄을 쓰기 대기열에 넣는다 (바로 돌아옴)."""
+        self._queue.put([row])
+
+    def add_many(self, rows):
+        self._queue.put(list(rows))
+
+    def flush(self, timeout=None):
+        """지금까지 넣은 줄이 모두 기록될 때까지 기다린다. 시간 안에 끝났으면 True."""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._db.close()
+
+    def _write_loop(self):
+        db = self._connect()
+        try:
+            while True:
+                item = self._queue.get()
+                rows, waiters = [], []
+                # 대기열에 쌓인 것을 한 트랜잭션으로 모은다
+                while True:
+                    if item is _STOP:
+                        self._commit(db, rows, waiters)
+                        return
+                    if isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        rows += item
+                    if len(rows) >= WRITE_BATCH:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                self._commit(db, rows, waiters)
+        finally:
+            db.close()
+
+    def _commit(self, db, rows, waiters):
+        if rows:
+            totals = {}
+            for row in rows:
+                # row[1:5] = 출처, 보드 크기, 지뢰 수, 제한 시간 / row[5] = 이겼는지
+                key = (row[2], row[3], row[4], row[1])
+                games, wins = totals.get(key, (0, 0))
+                totals[key] = (games + 1, wins + row[5])
+            try:
+                with db:
+                    db.executemany(_INSERT, rows)
+                    db.executemany(_ADD_TOTALS, [key + value for key, value in totals.items()])
+                self.written += len(rows)
+            except sqlite3.Error as e:
+                print(f"Warning: 게임 결과 저장 실패 ({len(rows)}줄): {e}")
+        for done in waiters:
+            done.set()
+
+    # ---------------- 읽기 -----------------
+    def _config(self, board_size, num_mines, timer_limit, source):
+        return (board_size, num_mines, timer_limit or 0, source)
+
+    def summary(self, board_size, num_mines, timer_limit=None, source=SOURCE_GAME):
+        """(판 수, 이긴 판 수)."""
+        row = self._db.execute(
+            f"SELECT games, wins FROM config_totals WHERE {_CONFIG}",
+            self._config(board_size, num_mines, timer_limit, source),
+        ).fetchone()
+        return row or (0, 0)
+
+    def leaderboard(self, board_size, num_mines, timer_limit=None, limit=10, source=SOURCE_GAME):
+        """이긴 판 중 빠른 순 [(걸린 ms, 시각, 쓴 힌트 수), ...]."""
+        return self._db.execute(
+            f"SELECT duration_ms, played_at, hints_used FROM games "
+            f"WHERE {_CONFIG} AND won = 1 ORDER BY duration_ms LIMIT ?",
+            self._config(board_size, num_mines, timer_limit, source) + (limit,),
+        ).fetchall()
+
+    def duration_percentiles(self, board_size, num_mines, timer_limit=None, percents=(50, 90),
+                             source=SOURCE_GAME):
+        """이긴 판의 걸린 시간 백분위 {백분위: ms}. 이긴 판이 없으면 빈 dict."""
+        config = self._config(board_size, num_mines, timer_limit, source)
+        _, wins = self.summary(board_size, num_mines, timer_limit, source)
+        result = {}
+        for p in percents if wins else ():
+            offset = min(int(wins * p / 100), wins - 1)
+            result[p], = self._db.execute(
+                f"SELECT duration_ms FROM games WHERE {_CONFIG} AND won = 1 "
+                f"ORDER BY duration_ms LIMIT 1 OFFSET ?", config + (offset,),
+            ).fetchone()
+        return result
+
+    def rank(self, board_size, num_mines, duration_ms, timer_limit=None, source=SOURCE_GAME):
+        """duration_ms보다 빨리 이긴 판의 비율 (0.0 = 최고 기록). 이긴 판이 없으면 None."""
+        config = self._config(board_size, num_mines, timer_limit, source)
+        _, wins = self.summary(board_size, num_mines, timer_limit, source)
+        if not wins:
+            return None
+        faster, = self._db.execute(
+            f"SELECT COUNT(*) FROM games WHERE {_CONFIG} AND won = 1 AND duration_ms < ?",
+            config + (duration_ms,),
+        ).fetchone()
+        return faster / wins
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m line530.results", description="게임 결과 조회")
+    parser.add_argument('board_size', type=int)
+    parser.add_argument('num_mines', type=int)
+    parser.add_argument('--timer', type=int, default=0, help="제한 시간 (초, 0 = 없음)")
+    parser.add_argument('--source', default=SOURCE_GAME,
+                        help="'game' 또는 'sim:<전략>' (보통 보드가 아니면 뒤에 ':<모양>', 예: game:hex)")
+    parser.add_argument('--db', help="데이터베이스 경로 (기본: ~/.local/share/line530/results.sqlite3)")
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    store = ResultStore(args.db)
+    try:
+        started = time.perf_counter()
+        games, wins = store.summary(args.board_size, args.num_mines, args.timer, args.source)
+        best = store.leaderboard(args.board_size, args.num_mines, args.timer, args.limit, args.source)
+        percentiles = store.duration_percentiles(args.board_size, args.num_mines, args.timer,
+                                                 source=args.source)
+        elapsed = time.perf_counter() - started
+    finally:
+        store.close()
+
+    print(f"{args.board_size}x{args.board_size}, 지뢰 {args.num_mines}, 제한 시간 {args.timer or '없음'}, "
+          f"{args.source}: {games}판 {wins}승")
+    for n, (duration_ms, played_at, hints_used) in enumerate(best, 1):
+        print(f"  {n:>2}. {duration_ms / 1000:8.3f}초  {time.strftime('%Y-%m-%d %H:%M', time.localtime(played_at))}"
+              f"  힌트 {hints_used if hints_used is not None else '-'}")
+    if percentiles:
+        print("  " + ", ".join(f"p{p} {ms / 1000:.3f}초" for p, ms in percentiles.items()))
+    print(f"[결과] 조회 {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""판마다 포켓몬 명단을 바꾸기 위한 다음 명단 미리 받기.
+
+지금 판을 하는 동안 배경 스레드(AssetLoader)가 다음 판의 포켓몬을 무작위로 골라
+받고 Pillow 이미지로 디코딩까지 해 둔다. '다시 시작'은 준비된 명단을 꺼내 쓰기만
+하므로 기다리지 않는다.
+
+메모리에 두는 명단은 지금 판 명단 + 준비된 명단 max_ready개 + 받는 중인 명단
+하나까지다. 결과는 자체 큐로 받고, Tk 쪽이 poll()로 비운다.
+"""
+import queue
+from collections import deque
+
+DEFAULT_MAX_READY = 1
+DEFAULT_POOL_SIZE = 151   # 고를 수 있는 포켓몬 수 (1세대). 명단은 이보다 길 수 없다
+
+
+class RosterPrefetcher:
+    def __init__(self, make_loader, max_ready=DEFAULT_MAX_READY, pool_size=DEFAULT_POOL_SIZE):
+        # make_loader(번호, 마리 수, 결과 큐, 뺄 번호들) -> 시작 전의 AssetLoader
+        self.make_loader = make_loader
+        self.max_ready = max_ready
+        self.pool_size = pool_size
+        self.results = queue.Queue()
+        self.ready = deque()      # [(스프라이트 키, 이름, Pillow 이미지), ...] 명단들
+        self.loader = None
+        self.generation = 0
+        self.count = 0            # 받는 중인 명단의 마리 수
+        self._pending = []
+
+    @property
+    def busy(self):
+        return self.loader is not None
+
+    def prefetch(self, count, exclude=()):
+        """count마리 명단 하나를 배경에서 받기 시작한다.
+
+        준비된 명단이 이미 가득하거나 같은 크기 이상을 받는 중이면 아무것도 하지 않는다.
+        지뢰가 포켓몬 종 수보다 많으면 pool_size마리 명단을 받는다 (로더도 그 이상은 못 고름).
+        """
+        count = min(count, self.pool_size)
+        if count <= 0 or len(self.ready) >= self.max_ready:
+            return False
+        if self.loader is not None:
+            if self.count >= count:
+                return False
+            self.cancel()   # 지뢰 수가 늘어 모자라게 될 명단
+        self.generation += 1
+        self.count = count
+        self._pending = []
+        self.loader = self.make_loader(self.generation, count, self.results, exclude)
+        self.loader.start()
+        return True
+
+    def cancel(self):
+        if self.loader is not None:
+            self.loader.cancel()
+            self.loader = None
+        self._pending = []
+
+    def poll(self, limit):
+        """큐에 온 결과를 limit개까지 처리 (Tk 메인 스레드). 처리한 수를 돌려준다."""
+        handled = 0
+        while handled < limit:
+            try:
+                generation, kind, *payload = self.results.get_nowait()
+            except queue.Empty:
+                break
+            handled += 1
+            if generation != self.generation or self.loader is None:
+                continue  # 취소된 명단
+            if kind == 'pokemon':
+                self._pending.append(tuple(payload))
+            elif kind == 'done':
+                if self._pending:
+                    self.ready.append(self._pending)
+                self.loader = None
+                self._pending = []
+        return handled
+
+    def take(self, count):
+        """count마리(최대 pool_size) 이상 준비된 명단 하나. 없으면 None (모자란 명단은 버린다)."""
+        count = min(count, self.pool_size)
+        while self.ready:
+            roster = self.ready.popleft()
+            if len(roster) >= count:
+                return roster
+        return None
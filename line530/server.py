@@ -0,0 +1,440 @@
+"""여러 판을 한 프로세스에서 돌리는 asyncio 게임 서버 (키오스크, 웹 클라이언트용).
+
+연결 하나가 세션 하나이고, 세션마다 GameEngine과 MineSolver를 따로 가진다.
+Tk는 쓰지 않는다. 스프라이트 메타데이터(번호, 이름, 주소)는 서버에 하나만 두고
+모든 세션이 같이 쓴다 (응답 bytes도 한 번만 만든다).
+
+프로토콜: 요청/응답 모두 한 줄에 JSON 하나 (UTF-8, '\\n'으로 끝남).
+    {"op": "sprites"}                                 스프라이트 메타데이터
+    {"op": "new", "size": 10, "mines": 15, "hints": 3, "seed": (선택), "topology": (선택)}
+                                                      topology: square(기본), torus, hex, knight
+    {"op": "reveal", "r": 0, "c": 0}                  게임 창의 on_left_click과 같음
+    {"op": "flag", "r": 0, "c": 0}                    on_right_click과 같음
+    {"op": "hint", "risky": false}                    use_hint와 같음. 확실히 안전한 칸이
+                                                      없으면 risky일 때만 열고, 아니면
+                                                      "hint": {"cell", "risk"}만 알려 준다
+    {"op": "stats"}                                   세션 수, 처리한 요청 수, CPU 시간
+
+게임 응답에는 바뀐 칸만 담는다 (보드 전체를 보내지 않음):
+    {"cells": [[칸 번호, 값], ...], "state": "playing" | "won" | "lost",
+     "mines_left": n, "hints_left": n}
+    값: 0~8 = 열린 칸의 숫자, "F" = 깃발, "H" = 깃발 해제
+    게임이 끝나면 "mines": [[칸 번호, 스프라이트 번호 또는 0], ...], 밟았으면 "exploded": 칸 번호
+    new에는 "board_size", "num_mines"(보드에 맞게 줄인 값), "seed", "topology"가 더 붙는다.
+잘못된 요청에는 {"error": "..."}.
+힌트(풀이기 계산)와 new(큰 보드의 엔진과 이웃 표 만들기)는 길어질 수 있어
+이벤트 루프 밖의 스레드에서 처리한다 (그동안 다른 세션의 요청은 그대로 처리된다).
+
+    python -m line530.server serve --port 8530
+    python -m line530.server loadtest --sessions 200      (서버를 따로 띄워 부하 측정)
+"""
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from line530 import board
+from line530.atlas import SpriteAtlas
+from line530.engine import GameEngine
+from line530.gamelog import new_seed
+from line530.names import DEFAULT_LANGUAGE, DISPLAY_LANGUAGES, NameIndex
+from line530.solver import MineSolver
+from line530.topology import DEFAULT_TOPOLOGY, TOPOLOGIES
+
+DEFAULT_PORT = 8530
+MAX_BOARD_SIZE = 300
+# fetch.SPRITE_BASE와 같은 기본값 (서버는 requests 없이 돌아야 해서 따로 읽음)
+SPRITE_BASE = os.environ.get(
+    "LINE530_SPRITE_BASE",
+    "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites",
+)
+GEN1_COUNT = 151
+HINT_WORKERS = 2    # 힌트(풀이기 계산)와 새 게임 만들기를 돌리는 스레드 수
+
+
+# ---------------- 스프라이트 메타데이터 (세션 공용) -----------------
+class SpriteCatalog:
+    """지뢰에 붙일 포켓몬 목록. 이름은 이름 색인(language) -> 아틀라스 순으로 찾고, 둘 다 없으면 번호만 쓴다."""
+
+    def __init__(self, atlas=None, count=GEN1_COUNT, sprite_base=SPRITE_BASE, names=None,
+                 language=DEFAULT_LANGUAGE):
+        if atlas is not None:
+            entries = [(poke_id, atlas.name(poke_id)) for poke_id in sorted(atlas.pokemon_ids())]
+        else:
+            entries = [(poke_id, None) for poke_id in range(1, count + 1)]
+        if names is not None:
+            entries = [(poke_id, names.display_name(poke_id, language) or name) for poke_id, name in entries]
+        # 엔진에 넘기는 roster 항목과 같은 꼴 (스프라이트 키, 이름)
+        self.roster = tuple((f"pokemon/{poke_id}", name) for poke_id, name in entries)
+        self.payload = _encode({'sprites': [
+            {'id': poke_id, 'key': f"pokemon/{poke_id}", 'name': name,
+             'url': f"{sprite_base}/pokemon/{poke_id}.png"}
+            for poke_id, name in entries
+        ]})
+
+    @classmethod
+    def open_default(cls, language=DEFAULT_LANGUAGE):
+        return cls(SpriteAtlas.open_default(), names=NameIndex.open_default(), language=language)
+
+    def pick(self, count, seed):
+        """한 판에 쓸 포켓몬 count마리 (seed마다 같음, 지뢰 배치 난수와는 따로)."""
+        return random.Random(f"roster:{seed}").sample(self.roster, min(count, len(self.roster)))
+
+
+def _encode(message):
+    return json.dumps(message, ensure_ascii=False, separators=(',', ':')).encode() + b'\n'
+
+
+def _sprite_id(mine):
+    return int(mine[0].rsplit('/', 1)[1]) if isinstance(mine, tuple) else 0
+
+
+# ---------------- 세션 -----------------
+class SessionError(Exception):
+    """요청을 처리할 수 없음 (클라이언트에 error로 돌려줌)."""
+
+
+class GameSession:
+    """연결 하나의 게임 상태. 동작은 게임 창의 클릭/힌트 처리와 같은 규칙을 따른다."""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.engine = None
+        self.solver = None
+        self.seed = None
+        self.hints_left = 0
+        self._changed = []
+
+    def new_game(self, size=10, mines=15, hints=3, seed=None, topology=None):
+        size = max(2, min(int(size), MAX_BOARD_SIZE))
+        mines = max(1, min(int(mines), board.max_mines(size)))
+        self.seed = int(seed) if seed is not None else new_seed()
+        # 이웃 표는 (모양, 크기)마다 하나를 모든 세션이 같이 쓴다
+        self.engine = GameEngine(size, mines, rng=random.Random(self.seed), topology=topology)
+        self.engine.subscribe(self._on_engine_event)
+        self.solver = MineSolver(self.engine)
+        self.hints_left = max(0, int(hints))
+        self._changed = []
+        return self._reply(board_size=size, num_mines=mines, seed=self.seed,
+                           topology=self.engine.topology.name)
+
+    def _on_engine_event(self, event, *args):
+        if event == 'reveal':
+            counts = self.engine.counts
+            self._changed += [[i, counts[i]] for i in args[0]]
+        elif event == 'flag':
+            i, flagged = args
+            self._changed.append([i, 'F' if flagged else 'H'])
+
+    def _cell(self, r, c):
+        if self.engine is None:
+            raise SessionError("먼저 new로 게임을 시작하세요")
+        r, c = int(r), int(c)
+        size = self.engine.board_size
+        if not (0 <= r < size and 0 <= c < size):
+            raise SessionError(f"보드 밖의 칸: ({r}, {c})")
+        return self.engine.index(r, c)
+
+    def reveal(self, r, c):
+        return self._open(self._cell(r, c))
+
+    def _open(self, i):
+        engine = self.engine
+        if engine.over or engine.is_flagged(i):
+            return self._reply()
+        if not engine.started:
+            engine.start(*engine.coords(i), roster=self.catalog.pick(engine.num_mines, self.seed))
+        exploded = engine.is_mine(i)
+        engine.reveal(i)
+        return self._reply(exploded=i) if exploded else self._reply()
+
+    def flag(self, r, c):
+        i = self._cell(r, c)
+        if not self.engine.over:
+            self.engine.toggle_flag(i)
+        return self._reply()
+
+    def hint(self, risky=False):
+        engine = self.engine
+        if engine is None or not engine.started:
+            raise SessionError("먼저 칸을 하나 열어서 게임을 시작하세요")
+        if engine.over or self.hints_left <= 0:
+            return self._reply()
+        i, risk = self.solver.hint(engine.rng)
+        if i is None:
+            return self._reply()
+        if risk > 0 and not risky:
+            return self._reply(hint={'cell': i, 'risk': risk})
+        if engine.is_flagged(i):
+            engine.toggle_flag(i)
+        self.hints_left -= 1
+        return self._open(i)
+
+    def _reply(self, **extra):
+        engine = self.engine
+        message = {
+            'cells': self._changed,
+            'state': 'won' if engine.won else 'lost' if engine.over else 'playing',
+            'mines_left': engine.remaining_mines(),
+            'hints_left': self.hints_left,
+        }
+        if engine.over:
+            message['mines'] = [[i, _sprite_id(engine.pokemon[i])] for i in engine.mine_cells()]
+        message.update(extra)
+        self._changed = []
+        return message
+
+
+# ---------------- 서버 -----------------
+class GameServer:
+    def __init__(self, catalog=None, hint_workers=HINT_WORKERS):
+        self.catalog = catalog or SpriteCatalog.open_default()
+        self.sessions = 0
+        self.requests = 0
+        self._hint_pool = ThreadPoolExecutor(max_workers=hint_workers, thread_name_prefix="hint")
+
+    @staticmethod
+    def _parse(line):
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            raise SessionError(f"잘못된 요청: {e!r}") from None
+        if not isinstance(request, dict):
+            raise SessionError("요청은 JSON 객체여야 합니다")
+        return request
+
+    def dispatch(self, session, line):
+        """요청 한 줄 -> 응답 bytes (부른 스레드에서 바로 처리)."""
+        self.requests += 1
+        try:
+            request = self._parse(line)
+        except SessionError as e:
+            return _encode({'error': str(e)})
+        return self._respond(session, request)
+
+    async def dispatch_async(self, session, line):
+        """dispatch와 같지만 힌트와 new는 스레드 풀에서 처리해 이벤트 루프를 막지 않는다.
+
+        new는 보드가 크면 (300x300) 엔진과 CSR 이웃 표를 만드는 데 수십 ms가 걸린다.
+
+        세션 하나의 요청은 차례로 처리되므로 (응답을 보낸 뒤에 다음 줄을 읽음)
+        한 세션의 상태를 두 스레드가 동시에 만지지는 않는다.
+        """
+        self.requests += 1
+        try:
+            request = self._parse(line)
+        except SessionError as e:
+            return _encode({'error': str(e)})
+        if request.get('op') in ('hint', 'new'):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._hint_pool, self._respond, session, request)
+        return self._respond(session, request)
+
+    def _respond(self, session, request):
+        try:
+            op = request.get('op')
+            if op == 'sprites':
+                return self.catalog.payload
+            if op == 'new':
+                reply = session.new_game(request.get('size', 10), request.get('mines', 15),
+                                         request.get('hints', 3), request.get('seed'),
+                                         request.get('topology'))
+            elif op == 'reveal':
+                reply = session.reveal(request['r'], request['c'])
+            elif op == 'flag':
+                reply = session.flag(request['r'], request['c'])
+            elif op == 'hint':
+                reply = session.hint(bool(request.get('risky')))
+            elif op == 'stats':
+                reply = {'sessions': self.sessions, 'requests': self.requests, 'cpu_s': time.process_time()}
+            else:
+                raise SessionError(f"알 수 없는 op: {op!r}")
+        except SessionError as e:
+            reply = {'error': str(e)}
+        except (ValueError, TypeError, KeyError, AttributeError, OverflowError) as e:
+            # OverflowError: int(1e999) 같은 inf/너무 큰 숫자
+            reply = {'error': f"잘못된 요청: {e!r}"}
+        return _encode(reply)
+
+    async def handle(self, reader, writer):
+        session = GameSession(self.catalog)
+        self.sessions += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(await self.dispatch_async(session, line))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle, host, port)
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"[서버] {host}:{port} 대기 (포켓몬 {len(self.catalog.roster)}종)", flush=True)
+        async with server:
+            await server.serve_forever()
+
+
+# ---------------- 부하 측정 클라이언트 -----------------
+class _Client:
+    def __init__(self, reader, writer, latencies):
+        self.reader = reader
+        self.writer = writer
+        self.latencies = latencies
+
+    async def call(self, request, timed=True):
+        started = time.perf_counter()
+        self.writer.write(_encode(request))
+        await self.writer.drain()
+        reply = json.loads(await self.reader.readline())
+        if timed:
+            self.latencies.append(time.perf_counter() - started)
+        if 'error' in reply:
+            raise RuntimeError(reply['error'])
+        return reply
+
+
+async def _play_session(host, port, games, size, mines, think_s, hint_ratio, rng, latencies, topology=None):
+    """게임 games판을 둔다. 수(reveal/flag/hint)마다 응답 시간을 latencies에 더한다."""
+    client = _Client(*await asyncio.open_connection(host, port), latencies)
+    try:
+        await client.call({'op': 'sprites'}, timed=False)
+        for _ in range(games):
+            await client.call({'op': 'new', 'size': size, 'mines': mines, 'hints': 10 ** 6,
+                               'seed': rng.getrandbits(63), 'topology': topology}, timed=False)
+            hidden = set(range(size * size))
+            state = 'playing'
+            while state == 'playing':
+                if think_s:
+                    await asyncio.sleep(rng.expovariate(1 / think_s))
+                if len(hidden) < size * size and rng.random() < hint_ratio:
+                    request = {'op': 'hint', 'risky': True}
+                else:
+                    r, c = divmod(rng.choice(tuple(hidden)), size)
+                    request = {'op': 'reveal', 'r': r, 'c': c}
+                reply = await client.call(request)
+                hidden.difference_update(i for i, _ in reply['cells'])
+                state = reply['state']
+    finally:
+        client.writer.close()
+
+
+async def load_test(host, port, sessions=100, games=3, size=16, mines=40, think_s=0.0,
+                    hint_ratio=0.3, seed=0, topology=None):
+    """세션 sessions개를 동시에 돌려 응답 시간과 서버 CPU 사용량을 잰다."""
+    latencies = []
+    stats = _Client(*await asyncio.open_connection(host, port), [])
+    before = await stats.call({'op': 'stats'}, timed=False)
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _play_session(host, port, games, size, mines, think_s, hint_ratio,
+                      random.Random(f"{seed}:{n}"), latencies, topology)
+        for n in range(sessions)
+    ))
+    elapsed = time.perf_counter() - started
+    after = await stats.call({'op': 'stats'}, timed=False)
+    stats.writer.close()
+
+    latencies.sort()
+    moves = len(latencies)
+    cpu_s = after['cpu_s'] - before['cpu_s']
+    return {
+        'sessions': sessions, 'moves': moves, 'seconds': elapsed,
+        'moves_per_s': moves / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': latencies[min(int(moves * 0.99), moves - 1)] * 1000,
+        'max_ms': latencies[-1] * 1000,
+        'server_cpu_s': cpu_s,
+        'cpu_ms_per_move': cpu_s / moves * 1000,
+    }
+
+
+async def _start_server_process():
+    """서버를 다른 프로세스로 띄우고 (프로세스, 포트)를 돌려준다 (클라이언트와 CPU를 나눠 쓰지 않게)."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, '-m', 'line530.server', 'serve', '--port', '0',
+        stdout=asyncio.subprocess.PIPE,
+    )
+    line = (await process.stdout.readline()).decode()
+    if not line.startswith('[서버]'):
+        process.kill()
+        raise RuntimeError(f"서버 시작 실패: {line!r}")
+    port = int(line.split()[1].rsplit(':', 1)[1])
+    return process, port
+
+
+async def _run_load_test(args):
+    process = None
+    if args.connect:
+        host, port = args.connect.rsplit(':', 1)
+        port = int(port)
+    else:
+        host = '127.0.0.1'
+        process, port = await _start_server_process()
+    try:
+        return await load_test(host, port, args.sessions, args.games, args.size, args.mines,
+                               args.think, args.hint_ratio, args.seed, args.topology)
+    finally:
+        if process is not None:
+            process.terminate()
+            await process.wait()
+
+
+def print_load_test(result, human_rate):
+    print(f"[부하] 세션 {result['sessions']}개, {result['moves']}수, {result['seconds']:.2f}초 "
+          f"({result['moves_per_s']:.0f}수/초)")
+    print(f"  응답 시간: 중앙값 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms, "
+          f"최대 {result['max_ms']:.2f} ms")
+    print(f"  서버 CPU: {result['server_cpu_s']:.2f}초, 한 수에 {result['cpu_ms_per_move']:.3f} ms")
+    if result['cpu_ms_per_move'] > 0:
+        per_core = 1000 / result['cpu_ms_per_move'] / human_rate
+        print(f"  코어 하나당 세션 수 (세션마다 초당 {human_rate:g}수 기준): 약 {per_core:.0f}개")
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m line530.server", description="여러 세션 게임 서버")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help="서버 실행")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=DEFAULT_PORT, help="0이면 빈 포트")
+    serve.add_argument('--language', choices=sorted(DISPLAY_LANGUAGES), default=DEFAULT_LANGUAGE,
+                       help="sprites 응답의 포켓몬 이름 언어 (이름 색인이 있을 때)")
+
+    test = commands.add_parser('loadtest', help="localhost 서버에 세션을 동시에 붙여 부하 측정")
+    test.add_argument('--connect', metavar='HOST:PORT', help="이미 떠 있는 서버 (없으면 새로 띄움)")
+    test.add_argument('--sessions', type=int, default=100)
+    test.add_argument('--games', type=int, default=3, help="세션마다 판 수")
+    test.add_argument('--size', type=int, default=16)
+    test.add_argument('--mines', type=int, default=40)
+    test.add_argument('--think', type=float, default=0.0,
+                      help="수 사이 평균 대기 (초, 0이면 쉬지 않고 보냄 = 최대 처리량)")
+    test.add_argument('--hint-ratio', type=float, default=0.3, help="힌트로 두는 수의 비율")
+    test.add_argument('--human-rate', type=float, default=1.0,
+                      help="코어당 세션 수를 셀 때 가정하는 사람 한 명의 초당 수")
+    test.add_argument('--seed', type=int, default=0)
+    test.add_argument('--topology', choices=sorted(TOPOLOGIES), default=DEFAULT_TOPOLOGY, help="보드 모양")
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        try:
+            catalog = SpriteCatalog.open_default(args.language)
+            asyncio.run(GameServer(catalog).serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+    else:
+        print_load_test(asyncio.run(_run_load_test(args)), args.human_rate)
+
+
+if __name__ == "__main__":
+    main()
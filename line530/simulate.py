@@ -0,0 +1,254 @@
+"""Tk 없이 게임을 대량으로 돌려 보는 난이도 측정기.
+
+봇 전략 (STRATEGIES):
+    random  아직 안 열린 칸 아무거나
+    hint    확실한 추론(solver.propagate)으로 안전한 칸이 있으면 열고,
+            없으면 무작위로 찍는다
+    solver  힌트 버튼과 같음: 확실한 칸, 없으면 확률이 가장 낮은 칸
+
+첫 클릭 보호(3x3)와 승리 판정은 GameEngine 그대로 쓴다. 게임은 (보드 크기,
+지뢰 수, 전략)마다 작은 묶음(shard)으로 나눠 프로세스 풀에 뿌리고, 묶음마다
+seed를 정해 두므로 같은 인자로 다시 돌리면 같은 결과가 나온다.
+
+    python -m line530.simulate --sizes 8 10 16 --density 0.1 0.15 0.2 --games 2000
+
+결과는 승률, 평균 수, 평균 '찍기'(확실한 칸 없이 연 횟수)이고, --json으로
+저장하면 설정 창의 난이도 프리셋을 고르는 데 쓸 수 있다. --db를 주면 판마다
+게임 결과 DB(line530.results)에 한 줄씩 남긴다. --topology로 보드 모양
+(torus, hex, knight)을 바꿔 잴 수 있다.
+"""
+import json
+import os
+import random
+import time
+
+from line530 import board
+from line530.engine import GameEngine
+from line530.solver import MineSolver
+from line530.topology import DEFAULT_TOPOLOGY, TOPOLOGIES
+
+GAMES_PER_SHARD = 200
+DEFAULT_DENSITIES = (0.10, 0.15, 0.20)
+# 프리셋 이름 -> 목표 승률 (solver 전략 기준)
+PRESET_TARGETS = {'쉬움': 0.90, '보통': 0.60, '어려움': 0.30}
+
+
+# ---------------- 봇 전략 -----------------
+# 전략은 (엔진, 풀이기, rng) -> (열 칸 번호, 찍었는지)
+
+def _random_unrevealed(engine, rng):
+    while True:
+        i = rng.randrange(len(engine.mines))
+        if not engine.revealed[i]:
+            return i
+
+
+def play_random(engine, solver, rng):
+    return _random_unrevealed(engine, rng), True
+
+
+def play_hint(engine, solver, rng):
+    solver.propagate()
+    if solver.safe:
+        return min(solver.safe), False
+    while True:
+        i = _random_unrevealed(engine, rng)
+        if solver.known[i] == 0:   # 지뢰로 밝혀진 칸은 피한다
+            return i, True
+
+
+def play_solver(engine, solver, rng):
+    i, risk = solver.hint(rng)
+    return i, risk > 0
+
+
+STRATEGIES = {
+    'random': play_random,
+    'hint': play_hint,
+    'solver': play_solver,
+}
+
+
+def play_game(board_size, num_mines, strategy, rng, topology=None):
+    """한 판을 끝까지 둔다. (이겼는지, 연 횟수, 찍은 횟수)."""
+    engine = GameEngine(board_size, num_mines, rng=rng, topology=topology)
+    solver = MineSolver(engine) if strategy != 'random' else None
+    move = STRATEGIES[strategy]
+
+    # 첫 클릭은 아무 칸이나 (엔진이 주변 3x3을 비워 준다)
+    first = rng.randrange(board_size * board_size)
+    engine.start(*engine.coords(first))
+    engine.reveal(first)
+    moves, guesses = 1, 0
+    while not engine.over:
+        i, guessed = move(engine, solver, rng)
+        engine.reveal(i)
+        moves += 1
+        guesses += guessed
+    return engine.won, moves, guesses
+
+
+# ---------------- 묶음 (작업 프로세스) -----------------
+def run_shard(board_size, num_mines, strategy, games, seed, keep_games=False, topology=None):
+    """게임 games판을 돌린 합계 dict. seed가 같으면 결과도 같다.
+
+    keep_games면 판마다 (이겼는지, 연 횟수, 걸린 ms)를 'per_game'에 담는다 (결과 DB용).
+    """
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    wins = moves = guesses = 0
+    per_game = []
+    for _ in range(games):
+        game_started = time.perf_counter()
+        won, n_moves, n_guesses = play_game(board_size, num_mines, strategy, rng, topology)
+        wins += won
+        moves += n_moves
+        guesses += n_guesses
+        if keep_games:
+            per_game.append((won, n_moves, (time.perf_counter() - game_started) * 1000))
+    shard = {
+        'board_size': board_size, 'num_mines': num_mines, 'strategy': strategy,
+        'games': games, 'wins': wins, 'moves': moves, 'guesses': guesses,
+        'seconds': time.perf_counter() - started, 'topology': topology or DEFAULT_TOPOLOGY,
+    }
+    if keep_games:
+        shard['per_game'] = per_game
+    return shard
+
+
+def _store_shard(store, shard):
+    from line530.results import make_row, source_name
+    source = source_name(f"sim:{shard['strategy']}", shard['topology'])
+    store.add_many(
+        make_row(shard['board_size'], shard['num_mines'], won, duration_ms=duration_ms, moves=moves,
+                 source=source)
+        for won, moves, duration_ms in shard.pop('per_game')
+    )
+
+
+def shard_seed(seed, board_size, num_mines, strategy, index):
+    # 문자열 seed는 프로세스/실행이 바뀌어도 같은 난수열을 만든다
+    return f"{seed}:{board_size}:{num_mines}:{strategy}:{index}"
+
+
+def simulate(configs, strategies=('solver',), games=1000, seed=0, workers=None,
+             games_per_shard=GAMES_PER_SHARD, store=None, topology=None):
+    """configs: [(보드 크기, 지뢰 수), ...]. 설정/전략마다 합친 결과 목록을 돌려준다.
+
+    store(results.ResultStore)를 주면 판마다 한 줄씩 'sim:<전략>' 출처로 기록한다.
+    """
+    keep_games = store is not None
+    jobs = []
+    for board_size, num_mines in configs:
+        for strategy in strategies:
+            for index, start in enumerate(range(0, games, games_per_shard)):
+                n = min(games_per_shard, games - start)
+                jobs.append((board_size, num_mines, strategy, n,
+                             shard_seed(seed, board_size, num_mines, strategy, index), keep_games,
+                             topology))
+
+    totals = {}
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        shards = [run_shard(*job) for job in jobs]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shards = list(executor.map(run_shard, *zip(*jobs)))
+
+    for shard in shards:
+        if keep_games:
+            _store_shard(store, shard)
+        key = (shard['board_size'], shard['num_mines'], shard['strategy'])
+        total = totals.setdefault(key, dict(shard, games=0, wins=0, moves=0, guesses=0, seconds=0.0))
+        for field in ('games', 'wins', 'moves', 'guesses', 'seconds'):
+            total[field] += shard[field]
+
+    results = []
+    for key in sorted(totals):
+        total = totals[key]
+        games_played = total['games']
+        results.append(dict(
+            total,
+            win_rate=total['wins'] / games_played,
+            avg_moves=total['moves'] / games_played,
+            avg_guesses=total['guesses'] / games_played,
+        ))
+    return results
+
+
+def suggest_presets(results, strategy='solver', targets=PRESET_TARGETS):
+    """목표 승률에 가장 가까운 (보드 크기, 지뢰 수)를 프리셋 이름별로 고른다."""
+    rows = [row for row in results if row['strategy'] == strategy]
+    if not rows:
+        return {}
+    return {
+        name: min(rows, key=lambda row: abs(row['win_rate'] - target))
+        for name, target in targets.items()
+    }
+
+
+def print_table(results, elapsed=None):
+    print(f"{'크기':>4} {'지뢰':>5} {'전략':<7} {'판 수':>7} {'승률':>7} {'평균 수':>8} {'평균 찍기':>9}")
+    for row in results:
+        print(f"{row['board_size']:>4} {row['num_mines']:>5} {row['strategy']:<7} {row['games']:>7} "
+              f"{row['win_rate']:>7.1%} {row['avg_moves']:>8.1f} {row['avg_guesses']:>9.2f}")
+    if elapsed:
+        games = sum(row['games'] for row in results)
+        print(f"[시뮬레이션] {games}판, {elapsed:.2f}초 ({games / elapsed:.0f}판/초)")
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m line530.simulate", description="봇으로 난이도 측정")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[8, 10, 16], help="보드 크기들")
+    parser.add_argument('--mines', type=int, nargs='+', help="지뢰 수들 (주면 --density 무시)")
+    parser.add_argument('--density', type=float, nargs='+', default=list(DEFAULT_DENSITIES),
+                        help="지뢰 비율들 (칸 수 대비)")
+    parser.add_argument('--strategy', nargs='+', choices=sorted(STRATEGIES), default=['solver'])
+    parser.add_argument('--topology', choices=sorted(TOPOLOGIES), default=DEFAULT_TOPOLOGY, help="보드 모양")
+    parser.add_argument('--games', type=int, default=1000, help="설정/전략마다 판 수")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--json', metavar='PATH', help="결과를 JSON으로 저장")
+    parser.add_argument('--db', metavar='PATH', nargs='?', const='',
+                        help="판마다 결과를 게임 결과 DB에 기록 (PATH 생략 시 게임과 같은 DB)")
+    args = parser.parse_args(argv)
+
+    configs = []
+    for size in args.sizes:
+        counts = args.mines or [round(size * size * d) for d in args.density]
+        for num_mines in counts:
+            num_mines = max(1, min(num_mines, board.max_mines(size)))
+            if (size, num_mines) not in configs:
+                configs.append((size, num_mines))
+
+    store = None
+    if args.db is not None:
+        from line530.results import ResultStore
+        store = ResultStore(args.db or None)
+    started = time.perf_counter()
+    results = simulate(configs, args.strategy, args.games, args.seed, args.workers, store=store,
+                       topology=args.topology)
+    print_table(results, time.perf_counter() - started)
+    if store is not None:
+        store.close()
+        print(f"[결과] {store.written}판을 {store.path}에 기록")
+
+    presets = suggest_presets(results)
+    for name, row in presets.items():
+        print(f"  프리셋 '{name}': {row['board_size']}x{row['board_size']}, 지뢰 {row['num_mines']} "
+              f"(승률 {row['win_rate']:.1%})")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'seed': args.seed,
+                'games': args.games,
+                'results': results,
+                'presets': {name: [row['board_size'], row['num_mines']] for name, row in presets.items()},
+            }, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,427 @@
+"""열린 숫자만 보고 추론하는 지뢰찾기 풀이기 (스마트 힌트용).
+
+엔진의 지뢰 위치는 보지 않는다. 플레이어에게 보이는 것(열린 칸과 숫자,
+전체 지뢰 수)만으로 다음 순서로 추론한다.
+    1. 한 칸 추론     남은 지뢰 0 -> 모두 안전, 남은 지뢰 = 칸 수 -> 모두 지뢰
+    2. 두 제약 비교   겹치는 숫자 두 개로 부분집합/연결 추론
+    3. 확률 계산      경계(frontier)를 서로 독립인 덩어리로 나눠 가능한 배치를
+                      모두 세고, 전체 지뢰 수까지 반영한 정확한 확률
+
+제약은 엔진의 'reveal' 이벤트를 받을 때마다 바뀐 부분만 고친다. 새로
+바뀐 제약만 다시 살펴보고, 덩어리별 배치 수는 제약이 그대로인 동안 기억해
+두었다가 다시 쓴다. 새로 세는 양에는 노드 한도가 있어서 (넘는 덩어리는 지역
+밀도로 근사) 큰 보드나 이웃이 많은 보드(나이트)에서도 힌트가 몇 ms 안에 나온다.
+"""
+import math
+import random
+import time
+from collections import defaultdict
+
+_UNKNOWN, _SAFE, _MINE = 0, 1, 2
+
+# 확률 계산에서 정확히 세는 한도 (넘으면 근사값 사용)
+MAX_COMPONENT_CELLS = 48       # 한 덩어리의 칸 수
+MAX_COMPONENT_NODES = 1_000    # 한 덩어리를 세는 탐색 노드 수
+MAX_SEARCH_NODES = 2_000       # 힌트 한 번에 새로 세는 탐색 노드 수 (모든 덩어리 합계)
+
+
+class _OutOfBudget(Exception):
+    """배치 세기가 노드 한도를 넘음."""
+
+
+class MineSolver:
+    def __init__(self, engine):
+        self.engine = engine
+        self.known = bytearray(len(engine.mines))   # 추론 결과: _SAFE / _MINE
+        self.constraints = {}           # 숫자 칸 -> [모르는 이웃 set, 남은 지뢰 수]
+        self.watchers = defaultdict(set)  # 모르는 칸 -> 그 칸을 이웃으로 둔 숫자 칸들
+        self.safe = set()               # 안전하다고 밝혀졌지만 아직 안 열린 칸
+        self.mines_found = 0
+        self._dirty = set()             # 한 칸 추론을 다시 해 볼 제약
+        self._pending_pairs = set()     # 두 제약 비교를 다시 해 볼 제약
+        # 덩어리의 제약 모양 -> (칸 순서, 배치 수 또는 None=한도 초과). 지난 힌트에서 센 것
+        self._enumerated = {}
+        self.last_ms = 0.0
+        engine.subscribe(self._on_event)
+
+    # ---------------- 엔진 이벤트 -> 제약 갱신 -----------------
+    def _on_event(self, event, *args):
+        if event == 'reveal':
+            self._on_reveal(args[0])
+
+    def _on_reveal(self, cells):
+        engine = self.engine
+        revealed = engine.revealed
+        for j in cells:
+            self.safe.discard(j)
+            self.known[j] = _SAFE
+            for c in self.watchers.pop(j, ()):
+                entry = self.constraints.get(c)
+                if entry is not None:
+                    entry[0].discard(j)
+                    self._dirty.add(c)
+            count = engine.counts[j]
+            if not count:
+                continue
+            unknown = set()
+            for k in engine.neighbours(j):
+                if self.known[k] == _MINE:
+                    count -= 1
+                elif not revealed[k] and self.known[k] != _SAFE:
+                    unknown.add(k)
+            if unknown:
+                self.constraints[j] = [unknown, count]
+                for k in unknown:
+                    self.watchers[k].add(j)
+                self._dirty.add(j)
+
+    def _mark(self, cell, value):
+        if self.known[cell] != _UNKNOWN:
+            return
+        self.known[cell] = value
+        if value == _SAFE:
+            self.safe.add(cell)
+        else:
+            self.mines_found += 1
+        for c in self.watchers.pop(cell, ()):
+            entry = self.constraints.get(c)
+            if entry is None:
+                continue
+            entry[0].discard(cell)
+            if value == _MINE:
+                entry[1] -= 1
+            self._dirty.add(c)
+
+    # ---------------- 1, 2단계: 확실한 추론 -----------------
+    def propagate(self):
+        """바뀐 제약들에서 확실한 안전/지뢰 칸을 더 이상 없을 때까지 찾는다."""
+        while self._dirty or self._pending_pairs:
+            while self._dirty:
+                c = self._dirty.pop()
+                entry = self.constraints.get(c)
+                if entry is None:
+                    continue
+                cells, mines = entry
+                if not cells:
+                    del self.constraints[c]
+                elif mines == 0:
+                    for x in list(cells):
+                        self._mark(x, _SAFE)
+                elif mines == len(cells):
+                    for x in list(cells):
+                        self._mark(x, _MINE)
+                else:
+                    self._pending_pairs.add(c)
+            if self._pending_pairs:
+                self._compare_pairs(self._pending_pairs.pop())
+
+    def _compare_pairs(self, a):
+        """제약 a와 칸을 공유하는 제약 b마다:
+        b의 지뢰 - a의 지뢰 = (b에만 있는 칸 수)면 b에만 있는 칸은 모두 지뢰,
+        a에만 있는 칸은 모두 안전. (a가 b의 부분집합이면 이것이 부분집합 추론)
+        """
+        entry_a = self.constraints.get(a)
+        if entry_a is None:
+            return
+        cells_a, mines_a = entry_a
+        others = set()
+        for x in cells_a:
+            others.update(self.watchers.get(x, ()))
+        others.discard(a)
+        for b in others:
+            entry_b = self.constraints.get(b)
+            if entry_b is None:
+                continue
+            cells_b, mines_b = entry_b
+            for first, m1, second, m2 in ((cells_a, mines_a, cells_b, mines_b),
+                                          (cells_b, mines_b, cells_a, mines_a)):
+                only_second = second - first
+                if only_second and m2 - m1 == len(only_second):
+                    only_first = first - second
+                    for x in only_second:
+                        self._mark(x, _MINE)
+                    for x in only_first:
+                        self._mark(x, _SAFE)
+                    return
+                if not (first - second) and only_second and m2 == m1:
+                    for x in only_second:
+                        self._mark(x, _SAFE)
+                    return
+
+    # ---------------- 3단계: 확률 -----------------
+    def _components(self):
+        """경계 칸들을 제약으로 이어진 덩어리로 나눈다. [(칸 목록, 제약 목록), ...]"""
+        seen = set()
+        components = []
+        for start in self.watchers:
+            if start in seen:
+                continue
+            seen.add(start)
+            cells, constraints = [], set()
+            stack = [start]
+            while stack:
+                x = stack.pop()
+                cells.append(x)
+                for c in self.watchers[x]:
+                    if c in constraints:
+                        continue
+                    constraints.add(c)
+                    for y in self.constraints[c][0]:
+                        if y not in seen:
+                            seen.add(y)
+                            stack.append(y)
+            components.append((cells, [self.constraints[c] for c in constraints]))
+        return components
+
+    @staticmethod
+    def _enumerate(cells, constraints, budget):
+        """덩어리 안의 가능한 배치를 모두 센다.
+
+        ({지뢰 수 k: [배치 수, [칸별 지뢰인 배치 수]]} 또는 None, 쓴 노드 수) 를
+        돌려준다. 탐색 노드가 budget을 넘으면 None.
+
+        걸린 제약이 똑같은 칸들은 한 묶음으로 보고 '묶음에 지뢰 몇 개'만 정한다
+        (배치 수는 조합 수 C(묶음 크기, 지뢰 수)를 곱함). 벽 뒤 칸처럼 같은 숫자들에만
+        닿는 칸이 많아서, 칸마다 정할 때보다 탐색이 훨씬 작다.
+        """
+        index = {x: n for n, x in enumerate(cells)}
+        cell_constraints = [[] for _ in cells]
+        state = []      # 제약마다 [남은 지뢰, 아직 안 정한 칸 수]
+        for n, (members, mines) in enumerate(constraints):
+            state.append([mines, len(members)])
+            for x in members:
+                cell_constraints[index[x]].append(n)
+        groups = {}     # 걸린 제약들 -> 칸 위치 목록 (처음 나온 순서)
+        for pos, touched in enumerate(cell_constraints):
+            groups.setdefault(tuple(touched), []).append(pos)
+        groups = list(groups.items())
+        combs = [[math.comb(len(members), m) for m in range(len(members) + 1)] for _, members in groups]
+
+        result = {}
+        chosen = []     # 지금 배치에서 지뢰가 있는 (묶음 번호, 지뢰 수)
+        nodes = 0
+
+        def search(g, mines, ways):
+            nonlocal nodes
+            nodes += 1
+            if nodes > budget:
+                raise _OutOfBudget
+            if g == len(groups):
+                entry = result.get(mines)
+                if entry is None:
+                    entry = result[mines] = [0, [0] * len(groups)]
+                entry[0] += ways
+                per_group = entry[1]
+                for n, m in chosen:
+                    per_group[n] += ways * m
+                nodes += len(chosen)
+                return
+            touched, members = groups[g]
+            size = len(members)
+            for m in range(size + 1):
+                ok = True
+                for n in touched:
+                    left = state[n][0] - m
+                    if left < 0 or left > state[n][1] - size:
+                        ok = False
+                        break
+                if not ok:
+                    continue
+                for n in touched:
+                    state[n][0] -= m
+                    state[n][1] -= size
+                if m:
+                    chosen.append((g, m))
+                search(g + 1, mines + m, ways * combs[g][m])
+                if m:
+                    chosen.pop()
+                for n in touched:
+                    state[n][0] += m
+                    state[n][1] += size
+
+        try:
+            search(0, 0, 1)
+        except _OutOfBudget:
+            return None, budget
+        # 묶음의 지뢰 수를 칸마다 고르게 나눈다 (묶음 안의 칸은 서로 대칭)
+        for entry in result.values():
+            per_group = entry[1]
+            per_cell = [0] * len(cells)
+            for g, (_, members) in enumerate(groups):
+                for pos in members:
+                    per_cell[pos] = per_group[g] / len(members)
+            entry[1] = per_cell
+        return result, nodes
+
+    @staticmethod
+    def _convolve(a, b):
+        out = defaultdict(float)
+        for k1, w1 in a.items():
+            for k2, w2 in b.items():
+                out[k1 + k2] += w1 * w2
+        return out
+
+    def probabilities(self):
+        """(경계 칸 -> 지뢰일 확률, 경계 밖 모르는 칸 하나의 확률) 을 돌려준다."""
+        probs, interior_p, _ = self._probabilities()
+        return probs, interior_p
+
+    def _count_components(self, components):
+        """덩어리마다 (칸 순서, 배치 수 또는 None) 을 구한다.
+
+        제약이 지난번과 같은 덩어리는 기억해 둔 결과를 쓰고, 새로 세는 양은 모두
+        합쳐 MAX_SEARCH_NODES까지만. 이번에 한도가 모자라 못 센 덩어리는 기억하지
+        않아 다음 힌트에서 다시 세어 본다.
+        """
+        budget = MAX_SEARCH_NODES
+        previous, self._enumerated = self._enumerated, {}
+        counted = []
+        for cells, constraints in components:
+            if len(cells) > MAX_COMPONENT_CELLS:
+                counted.append((cells, None))
+                continue
+            shape = frozenset((frozenset(members), mines) for members, mines in constraints)
+            entry = previous.get(shape)
+            if entry is None and budget > 0:
+                limit = min(MAX_COMPONENT_NODES, budget)
+                counts, used = self._enumerate(cells, constraints, limit)
+                budget -= used
+                if counts is not None or limit == MAX_COMPONENT_NODES:
+                    entry = (cells, counts)
+            if entry is None:
+                counted.append((cells, None))
+                continue
+            self._enumerated[shape] = entry
+            counted.append(entry)
+        return counted
+
+    def _probabilities(self):
+        """(경계 칸 -> 확률, 경계 밖 칸 하나의 확률, 확실한 칸 -> _SAFE/_MINE).
+
+        확실한 칸은 그 덩어리의 모든 배치에서 안전/지뢰인 칸이다. 모든 덩어리를
+        정확히 셌을 때만 전체 지뢰 수까지 반영한 확률 0/1도 확실한 것으로 본다
+        (근사한 덩어리가 있으면 남은 지뢰 수가 어림값이라 그렇게 믿을 수 없다).
+        """
+        engine = self.engine
+        components = [(cells, [(c[0], c[1]) for c in constraints])
+                      for cells, constraints in self._components()]
+        frontier = sum(len(cells) for cells, _ in components)
+        unknown_total = (len(engine.mines) - engine.revealed_count
+                         - self.mines_found - len(self.safe))
+        interior = unknown_total - frontier
+        mines_left = engine.mine_count - self.mines_found
+
+        probs = {}
+        certain = {}
+        exact = []
+        for cells, counts in self._count_components(components):
+            if counts:
+                exact.append((cells, counts))
+                for idx, x in enumerate(cells):
+                    hits = [per_cell[idx] for _, per_cell in counts.values()]
+                    if not any(hits):
+                        certain[x] = _SAFE
+                    elif all(h == total for h, (total, _) in zip(hits, counts.values())):
+                        certain[x] = _MINE
+                continue
+            # 너무 크거나 한도를 넘은 덩어리: 걸린 제약 중 가장 높은 지역 밀도로 근사
+            for x in cells:
+                probs[x] = max(m / len(members) for members, m in
+                               (self.constraints[c] for c in self.watchers[x]))
+            mines_left -= round(sum(probs[x] for x in cells))
+        approximate = len(exact) < len(components)
+
+        # 경계 밖 칸들의 가중치: C(interior, 남은 지뢰 - 경계 지뢰), 로그로 계산
+        def log_weight(k):
+            rest = mines_left - k
+            if rest < 0 or rest > interior:
+                return None
+            return (math.lgamma(interior + 1) - math.lgamma(rest + 1)
+                    - math.lgamma(interior - rest + 1))
+
+        def local_only():
+            # 전체 지뢰 수로 가중치를 줄 수 없으면 덩어리 안의 배치 비율만 쓴다
+            for cells, counts in exact:
+                total = sum(t for t, _ in counts.values())
+                for idx, x in enumerate(cells):
+                    probs[x] = sum(per_cell[idx] for _, per_cell in counts.values()) / total
+            return probs, (mines_left / interior if interior > 0 else 0.0), certain
+
+        dists = [{k: float(total) for k, (total, _) in counts.items()} for _, counts in exact]
+        total_dist = {0: 1.0}
+        for dist in dists:
+            total_dist = self._convolve(total_dist, dist)
+        logs = {k: log_weight(k) for k in total_dist}
+        valid = [v for v in logs.values() if v is not None]
+        if not valid:
+            return local_only()
+        top = max(valid)
+        weight = {k: (math.exp(v - top) if v is not None else 0.0) for k, v in logs.items()}
+
+        z = sum(total_dist[k] * weight[k] for k in total_dist)
+        if z <= 0:
+            return local_only()
+        interior_p = 0.0
+        if interior > 0:
+            interior_p = sum(
+                total_dist[k] * weight[k] * (mines_left - k) / interior for k in total_dist
+            ) / z
+
+        for n, (cells, counts) in enumerate(exact):
+            others = {0: 1.0}
+            for m, dist in enumerate(dists):
+                if m != n:
+                    others = self._convolve(others, dist)
+            mine_weight = [0.0] * len(cells)
+            for k, (_, per_cell) in counts.items():
+                w = sum(ow * weight.get(k + k2, 0.0) for k2, ow in others.items())
+                if w:
+                    for idx, hits in enumerate(per_cell):
+                        mine_weight[idx] += hits * w
+            for idx, x in enumerate(cells):
+                p = probs[x] = mine_weight[idx] / z
+                if not approximate and x not in certain:
+                    if p <= 1e-12:
+                        certain[x] = _SAFE
+                    elif p >= 1 - 1e-12:
+                        certain[x] = _MINE
+        return probs, interior_p, certain
+
+    # ---------------- 힌트 -----------------
+    def hint(self, rng=random):
+        """(열 칸 번호, 지뢰일 확률). 확실히 안전한 칸이 있으면 확률은 0.
+
+        안전한 칸이 없으면 확률이 가장 낮은 칸을 고른다 (같으면 경계 칸 우선).
+        열 칸이 없으면 (None, 0.0).
+        """
+        started = time.perf_counter()
+        try:
+            self.propagate()
+            if not self.safe:
+                probs, interior_p, certain = self._probabilities()
+                # 모든 배치에서 안전/지뢰인 칸은 확실한 결과로 기억해 둔다
+                for x, value in certain.items():
+                    self._mark(x, value)
+                self.propagate()
+                if not self.safe:
+                    return self._lowest_risk(probs, interior_p, rng)
+            return rng.choice(sorted(self.safe)), 0.0
+        finally:
+            self.last_ms = (time.perf_counter() - started) * 1000
+
+    def _lowest_risk(self, probs, interior_p, rng):
+        candidates = {x: p for x, p in probs.items() if self.known[x] == _UNKNOWN}
+        best = min(candidates.values(), default=None)
+        if best is not None and best <= interior_p + 1e-9:
+            choices = sorted(x for x, p in candidates.items() if p <= best + 1e-9)
+            return rng.choice(choices), best
+        engine = self.engine
+        interior = [
+            i for i in range(len(engine.mines))
+            if not engine.revealed[i] and self.known[i] == _UNKNOWN and i not in self.watchers
+        ]
+        if interior:
+            return rng.choice(interior), interior_p
+        if best is not None:
+            return min(candidates, key=candidates.get), best
+        return None, 0.0
@@ -0,0 +1,142 @@
+"""보드 모양 (어느 칸이 이웃인지)과 미리 계산해 두는 이웃 표.
+
+    square  보통 지뢰찾기, 주변 8칸
+    torus   square와 같지만 위/아래, 왼쪽/오른쪽 가장자리가 서로 이어짐
+    hex     육각 칸. 홀수 행을 반 칸 오른쪽으로 밀어 그리고, 이웃은 6칸
+    knight  체스 나이트가 한 번에 갈 수 있는 8칸
+
+이웃 표는 CSR 형식의 평평한 배열 두 개다. 칸 i의 이웃은
+``cells[starts[i]:starts[i + 1]]`` 이다. (모양, 보드 크기)마다 한 번만 만들어
+숫자 세기, 연쇄 열기, 첫 클릭 보호 영역, 힌트(풀이기)가 모두 같은 표를 쓰고,
+같은 설정의 게임끼리(서버 세션, 시뮬레이션)도 같은 표를 나눠 쓴다.
+
+새 모양은 이웃으로 가는 방향 목록 하나로 TOPOLOGIES에 더하면 된다.
+"""
+from array import array
+from functools import lru_cache
+from itertools import accumulate, compress
+
+DEFAULT_TOPOLOGY = 'square'
+
+_KING_STEPS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+_KNIGHT_STEPS = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)]
+# 홀수 행이 반 칸 오른쪽에 있는 육각 칸 ('odd-r')
+_HEX_STEPS = (
+    [(-1, -1), (-1, 0), (0, -1), (0, 1), (1, -1), (1, 0)],   # 짝수 행
+    [(-1, 0), (-1, 1), (0, -1), (0, 1), (1, 0), (1, 1)],     # 홀수 행
+)
+
+
+class Topology:
+    """보드 모양 하나.
+
+    steps           이웃으로 가는 (행 차이, 열 차이) 목록. 행 짝/홀마다 다르면 두 개
+    wrap            보드 밖으로 나가면 반대편으로 이어지는지 (아니면 그 방향은 없음)
+    shift_odd_rows  홀수 행을 반 칸 밀어 그려야 하는지 (렌더러용)
+    """
+
+    def __init__(self, name, label, steps, wrap=False, shift_odd_rows=False):
+        self.name = name
+        self.label = label
+        self.steps = steps if isinstance(steps, tuple) else (steps, steps)
+        self.wrap = wrap
+        self.shift_odd_rows = shift_odd_rows
+
+    def table(self, board_size):
+        return neighbour_table(self.name, board_size)
+
+
+TOPOLOGIES = {
+    topology.name: topology for topology in (
+        Topology('square', "보통", _KING_STEPS),
+        Topology('torus', "토러스", _KING_STEPS, wrap=True),
+        Topology('hex', "육각", _HEX_STEPS, shift_odd_rows=True),
+        Topology('knight', "나이트", _KNIGHT_STEPS),
+    )
+}
+
+
+def get(name):
+    """이름(None이면 기본) -> Topology. 모르는 이름이면 ValueError."""
+    try:
+        return TOPOLOGIES[name or DEFAULT_TOPOLOGY]
+    except KeyError:
+        raise ValueError(f"알 수 없는 보드 모양: {name} (가능: {', '.join(TOPOLOGIES)})") from None
+
+
+class NeighbourTable:
+    """칸 i의 이웃 = cells[starts[i]:starts[i + 1]] (칸 번호 = 행 * 크기 + 열).
+
+    한 칸의 이웃 순서는 모양의 steps 순서다 (보통 보드는 예전 3x3 반복과 같은 순서).
+    """
+
+    def __init__(self, topology, board_size):
+        self.topology = topology
+        self.board_size = board_size
+        self.starts = array('i', [0])
+        self.cells = array('i')
+        if topology.wrap and board_size < 3:
+            self._build_small()
+        else:
+            self._build()
+
+    def _build(self):
+        # 한 행씩, 방향마다 그 행 모든 칸의 이웃을 슬라이스 대입으로 한 번에 채운다
+        # (칸마다 파이썬 반복을 돌지 않으므로 300x300도 금방 만든다)
+        n = self.board_size
+        wrap = self.topology.wrap
+        columns = list(range(n))
+        for r in range(n):
+            steps = self.topology.steps[r & 1]
+            if wrap:
+                steps = [((r + dr) % n, dc % n) for dr, dc in steps]
+            else:
+                steps = [(r + dr, dc) for dr, dc in steps if 0 <= r + dr < n]
+            k = len(steps)
+            row = [0] * (n * k)      # 칸 c의 j번째 방향 = row[c * k + j]
+            keep = [True] * (n * k)
+            counts = [k] * n
+            for j, (nr, dc) in enumerate(steps):
+                base = nr * n
+                if wrap:
+                    row[j::k] = [base + c for c in columns[dc:] + columns[:dc]]
+                    continue
+                lo, hi = max(-dc, 0), min(n - dc, n)
+                row[j + lo * k:j + hi * k:k] = range(base + lo + dc, base + hi + dc)
+                for c in (*range(lo), *range(hi, n)):   # 보드 밖으로 나가는 칸
+                    keep[j + c * k] = False
+                    counts[c] -= 1
+            self.cells.extend(row if wrap else compress(row, keep))
+            self.starts.extend(accumulate(counts, initial=self.starts[-1]))
+            del self.starts[-n - 1]   # initial 값 (이미 들어 있는 앞 행의 끝)
+
+    def _build_small(self):
+        # 1x1, 2x2 토러스: 여러 방향이 같은 칸에 닿으므로 칸마다 중복을 뺀다
+        n = self.board_size
+        for r in range(n):
+            for c in range(n):
+                seen = {r * n + c}
+                for dr, dc in self.topology.steps[r & 1]:
+                    k = (r + dr) % n * n + (c + dc) % n
+                    if k not in seen:
+                        seen.add(k)
+                        self.cells.append(k)
+                self.starts.append(len(self.cells))
+
+    def neighbours(self, i):
+        return self.cells[self.starts[i]:self.starts[i + 1]]
+
+    def safe_zone(self, i):
+        """첫 클릭 칸 i와 그 이웃 (지뢰를 놓지 않는 칸들)."""
+        zone = set(self.neighbours(i))
+        zone.add(i)
+        return zone
+
+    def nbytes(self):
+        return (len(self.starts) + len(self.cells)) * self.cells.itemsize
+
+
+@lru_cache(maxsize=16)
+def neighbour_table(name, board_size):
+    """(모양 이름, 보드 크기)마다 한 번만 만드는 이웃 표."""
+    return NeighbourTable(get(name), board_size)
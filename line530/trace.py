@@ -0,0 +1,199 @@
+"""켜고 끌 수 있는 실행 추적 (``--trace``).
+
+"보드가 멈췄다"는 신고가 오면 HTTP, 이미지 크기 조절, Tk 위젯 작업, 연쇄 열기
+중 어디가 느렸는지 볼 수 있게, 구간(span)마다 시작 시각과 길이를 기록해
+Chrome/Perfetto에서 여는 trace 파일(JSON)과 요약 표로 내보낸다.
+
+    with span('http', 'net', url=url):   # 꺼져 있으면 아무것도 하지 않음
+        ...
+
+꺼져 있을 때 비용은 span() 호출 한 번(빈 컨텍스트 매니저)뿐이다. GUI 메서드는
+켜졌을 때만 wrap_methods()로 감싸므로 꺼져 있으면 비용이 없다.
+
+켜져 있으면 추가로
+    Tcl 호출 수   root.tk를 호출 수를 세는 대리 객체로 바꿔 구간마다 몇 번 불렀는지
+    이벤트 루프 지연  after()로 예약한 콜백이 예정보다 얼마나 늦게 불렸는지
+도 기록한다.
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+LAG_PROBE_MS = 100    # 이벤트 루프 지연을 재는 주기
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class TclCallCounter:
+    """tkapp 대리 객체. call/eval 횟수(= Tcl 왕복 수)를 센다."""
+
+    def __init__(self, tkapp):
+        self._tkapp = tkapp
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self._tkapp.call(*args)
+
+    def eval(self, script):
+        self.calls += 1
+        return self._tkapp.eval(script)
+
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.events = []          # Chrome trace 이벤트 dict
+        self.tcl = None           # TclCallCounter (install_tcl_counter 뒤)
+        self.lag_samples = []     # 이벤트 루프 지연 (ms)
+        self._started_at = time.perf_counter()
+        self._pid = os.getpid()
+        self._threads = {}
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+        self._started_at = time.perf_counter()
+
+    def _us(self, at):
+        return (at - self._started_at) * 1_000_000
+
+    def _tid(self):
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            with self._lock:
+                self._threads[tid] = threading.current_thread().name
+        return tid
+
+    # ---------------- 기록 -----------------
+    @contextmanager
+    def _span(self, name, cat, args):
+        tcl_before = self.tcl.calls if self.tcl is not None else None
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            ended = time.perf_counter()
+            if tcl_before is not None and threading.current_thread() is threading.main_thread():
+                args['tcl_calls'] = self.tcl.calls - tcl_before
+            self.events.append({
+                'name': name, 'cat': cat, 'ph': 'X', 'pid': self._pid, 'tid': self._tid(),
+                'ts': self._us(started), 'dur': (ended - started) * 1_000_000, 'args': args,
+            })
+
+    def span(self, name, cat='', **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name, cat, args)
+
+    def counter(self, name, **values):
+        if self.enabled:
+            self.events.append({
+                'name': name, 'ph': 'C', 'pid': self._pid, 'tid': self._tid(),
+                'ts': self._us(time.perf_counter()), 'args': values,
+            })
+
+    def wrap_methods(self, obj, names, cat='gui'):
+        """obj의 메서드들을 구간 기록으로 감싼다 (인스턴스 속성으로 덮어씀).
+
+        콜백으로 넘기기 전에 불러야 감싼 메서드가 쓰인다.
+        """
+        prefix = type(obj).__name__
+        for name in names:
+            original = getattr(obj, name)
+
+            def traced(*args, _original=original, _name=f"{prefix}.{name}", **kwargs):
+                with self.span(_name, cat):
+                    return _original(*args, **kwargs)
+
+            setattr(obj, name, traced)
+
+    # ---------------- Tk 쪽 측정 -----------------
+    def install_tcl_counter(self, root):
+        """root.tk를 호출 수를 세는 대리 객체로 바꾼다. 위젯을 만들기 전에 불러야 한다."""
+        self.tcl = TclCallCounter(root.tk)
+        root.tk = self.tcl
+        return self.tcl
+
+    def start_lag_probe(self, root, interval_ms=LAG_PROBE_MS):
+        """interval_ms마다 after() 콜백이 얼마나 늦게 불렸는지 기록한다."""
+        def probe(expected):
+            lag_ms = max((time.perf_counter() - expected) * 1000, 0.0)
+            self.lag_samples.append(lag_ms)
+            values = {'lag_ms': lag_ms}
+            if self.tcl is not None:
+                values['tcl_calls'] = self.tcl.calls
+            self.counter('event loop', **values)
+            schedule()
+
+        def schedule():
+            root.after(interval_ms, probe, time.perf_counter() + interval_ms / 1000)
+
+        schedule()
+
+    # ---------------- 내보내기 -----------------
+    def write(self, path):
+        """Chrome/Perfetto trace 형식(JSON)으로 저장."""
+        import json
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid, 'args': {'name': name}}
+            for tid, name in self._threads.items()
+        ]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': metadata + self.events, 'displayTimeUnit': 'ms'}, f,
+                      ensure_ascii=False)
+
+    def summary(self):
+        """구간 이름별 [(이름, 횟수, 합계 ms, 평균 ms, p95 ms, 최대 ms, Tcl 호출 수)]. 합계 큰 순."""
+        import statistics
+        by_name = {}
+        for event in self.events:
+            if event['ph'] == 'X':
+                by_name.setdefault(event['name'], []).append(event)
+        rows = []
+        for name, events in by_name.items():
+            durations = sorted(e['dur'] / 1000 for e in events)
+            p95 = durations[min(int(len(durations) * 0.95), len(durations) - 1)]
+            tcl = sum(e['args'].get('tcl_calls', 0) for e in events)
+            rows.append((name, len(durations), sum(durations), statistics.fmean(durations),
+                         p95, durations[-1], tcl))
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows
+
+    def print_summary(self):
+        import statistics
+        print("[추적] 구간별 시간")
+        print(f"  {'구간':<32} {'횟수':>6} {'합계':>10} {'평균':>9} {'p95':>9} {'최대':>9} {'Tcl':>8}")
+        for name, count, total, mean, p95, worst, tcl in self.summary():
+            print(f"  {name:<32} {count:>6} {total:>8.1f}ms {mean:>7.2f}ms {p95:>7.2f}ms "
+                  f"{worst:>7.2f}ms {tcl:>8}")
+        if self.tcl is not None:
+            print(f"  Tcl 호출 전체: {self.tcl.calls}회")
+        if self.lag_samples:
+            lags = sorted(self.lag_samples)
+            p95 = lags[min(int(len(lags) * 0.95), len(lags) - 1)]
+            print(f"  이벤트 루프 지연: 중앙값 {statistics.median(lags):.1f} ms, "
+                  f"p95 {p95:.1f} ms, 최대 {lags[-1]:.1f} ms ({len(lags)}회 측정)")
+
+
+TRACER = Tracer()
+
+
+def span(name, cat='', **args):
+    """TRACER.span의 줄임. 추적이 꺼져 있으면 빈 컨텍스트 매니저."""
+    if not TRACER.enabled:
+        return _NULL_SPAN
+    return TRACER._span(name, cat, args)
@@ -0,0 +1,47 @@
+import importlib.util
+import os
+
+import pytest
+
+from line530.fakeapi import FakePokeAPI, _Handler
+
+
+class _FlakyHandler(_Handler):
+    """api.failures[경로]번까지는 api.failure_status로 답하고, 그다음부터 정상 응답."""
+
+    def do_GET(self):
+        api = self.server.api
+        with api._lock:
+            left = api.failures.get(self.path, 0)
+            if left:
+                api.failures[self.path] = left - 1
+        if left:
+            api.count_request()
+            self.send_response(api.failure_status)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        super().do_GET()
+
+
+@pytest.fixture
+def api():
+    """로컬 PokeAPI 대역 서버. api.failures[경로] = n 으로 앞 n번을 실패시킬 수 있다."""
+    server = FakePokeAPI(count=20)
+    server.failures = {}
+    server.failure_status = 503
+    server.server.RequestHandlerClass = _FlakyHandler
+    with server:
+        yield server
+
+
+GAME_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "포켓몬 지뢰찾기(수정본).py")
+
+
+@pytest.fixture(scope='session')
+def game_module():
+    """게임 창 파일을 모듈로 불러온다 (창은 만들지 않음)."""
+    spec = importlib.util.spec_from_file_location("pokemon_minesweeper", GAME_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
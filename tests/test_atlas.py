@@ -0,0 +1,88 @@
+import queue
+import random
+
+import pytest
+from PIL import Image
+
+from line530 import atlas as atlas_module
+from line530.atlas import FLAG_ID, AtlasError, SpriteAtlas, build, pack
+from line530.fetch import AssetFetcher
+from line530.loader import AssetLoader
+
+
+def _sprite(poke_id, size=(12, 10)):
+    return Image.new('RGBA', size, (poke_id * 10, 0, 255 - poke_id, 255))
+
+
+@pytest.fixture
+def atlas_path(tmp_path):
+    entries = [(poke_id, f"포켓몬{poke_id}", _sprite(poke_id)) for poke_id in range(1, 21)]
+    path = tmp_path / 'gen1.atlas'
+    path.write_bytes(pack(entries, flag=_sprite(0, size=(8, 8)), columns=6))
+    return str(path)
+
+
+def test_pack_and_read_back_through_mmap(atlas_path):
+    atlas = SpriteAtlas(atlas_path)
+    try:
+        assert sorted(atlas.pokemon_ids()) == list(range(1, 21))
+        assert atlas.has_flag()
+        assert atlas.name(7) == "포켓몬7"
+        image = atlas.image(7)
+        assert image.size == (12, 10)
+        assert image.getpixel((0, 0)) == (70, 0, 248, 255)
+        assert atlas.image(FLAG_ID).size == (8, 8)
+        # 시트는 처음 한 번만 디코딩한다
+        assert atlas._decode_sheet() is atlas._decode_sheet()
+    finally:
+        atlas.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'gen1.atlas'
+    path.write_bytes(b'x' * 64)
+    with pytest.raises(AtlasError):
+        SpriteAtlas(str(path))
+    with pytest.raises(AtlasError):
+        pack([])
+
+
+def test_open_default_search_order(atlas_path, tmp_path, monkeypatch, capsys):
+    missing = str(tmp_path / 'package' / 'gen1.atlas')
+    broken = tmp_path / 'broken.atlas'
+    broken.write_bytes(b'')
+    monkeypatch.setattr(atlas_module, 'ATLAS_SEARCH_PATHS', (missing, str(broken), atlas_path))
+    opened = SpriteAtlas.open_default()
+    assert opened.path == atlas_path
+    opened.close()
+    assert "Could not open sprite atlas" in capsys.readouterr().out
+    monkeypatch.setattr(atlas_module, 'ATLAS_SEARCH_PATHS', (missing,))
+    assert SpriteAtlas.open_default() is None
+
+
+def test_loader_picks_from_atlas_without_network(atlas_path):
+    results = queue.Queue()
+    atlas = SpriteAtlas(atlas_path)
+    loader = AssetLoader(1, 5, results, random.Random(0), atlas=atlas, exclude=[1, 2])
+    loader.run()
+    messages = [results.get_nowait() for _ in range(results.qsize())]
+    atlas.close()
+    assert [message[1] for message in messages] == ['start', 'flag'] + ['pokemon'] * 5 + ['done']
+    keys = [message[2] for message in messages if message[1] == 'pokemon']
+    assert not {'pokemon/1', 'pokemon/2'} & set(keys)
+    assert loader.fetcher is None
+    assert messages[-1] == (1, 'done', 5, 5)
+
+
+def test_build_from_fake_api(api, tmp_path):
+    path = str(tmp_path / 'gen1.atlas')
+    with AssetFetcher(api.api_base, api.sprite_base, deadline=None) as fetcher:
+        build(path, fetcher=fetcher)
+    atlas = SpriteAtlas(path)
+    try:
+        assert sorted(atlas.pokemon_ids()) == list(range(1, api.count + 1))
+        assert atlas.name(3) == "포켓몬3"
+        assert atlas.image(3).size == (96, 96)
+        assert atlas.has_flag()
+    finally:
+        atlas.close()
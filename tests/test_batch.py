@@ -0,0 +1,26 @@
+import importlib
+import sys
+
+import pytest
+
+from line530 import board
+
+
+def test_missing_numpy_names_the_extra(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+    monkeypatch.delitem(sys.modules, 'line530.batch', raising=False)
+    with pytest.raises(ImportError, match=r"line530\[batch\]"):
+        importlib.import_module('line530.batch')
+
+
+def test_matches_reference():
+    pytest.importorskip('numpy')
+    from line530 import batch
+    mines, counts = batch.generate_boards(50, 9, 12, 4, 4, seed=1)
+    expected = batch.reference_boards(50, 9, 12, 4, 4, seed=1)
+    candidates = set(board.mine_candidates(9, 4, 4))
+    for i, (cells, ref_counts) in enumerate(expected):
+        assert batch.mine_cells(mines[i]) == cells
+        assert counts[i].tolist() == ref_counts
+        assert len(cells) == 12
+        assert all(divmod(c, 9) in candidates for c in cells)
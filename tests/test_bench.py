@@ -0,0 +1,30 @@
+import json
+
+from line530 import bench
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        'a': {'median_ms': 10.0},
+        'b': {'median_ms': 10.0},
+        'c': {'skipped': "화면 없음"},
+    }
+    results = {
+        'a': {'median_ms': 11.0},
+        'b': {'median_ms': 13.0},
+        'c': {'median_ms': 1.0},
+        'new': {'median_ms': 1.0},
+    }
+    report = bench.compare(results, baseline, threshold=0.2)
+    assert set(report) == {'a', 'b'}
+    assert not report['a'][3]
+    assert report['b'][3]
+
+
+def test_committed_baseline_is_readable():
+    with open(bench.BASELINE_PATH, encoding='utf-8') as f:
+        document = json.load(f)
+    assert {'cpu', 'cpus', 'platform', 'created'} <= set(document['meta'])
+    assert set(document['results']) <= set(bench.BENCHMARKS)
+    measured = [row for row in document['results'].values() if 'median_ms' in row]
+    assert measured
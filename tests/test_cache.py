@@ -0,0 +1,104 @@
+import itertools
+import os
+
+import pytest
+
+from line530 import cache as cache_module
+from line530.cache import SpriteCache
+from line530.fetch import AssetFetcher
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """항목마다 사용 시각이 달라지도록 1초씩 가는 시계."""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(cache_module.time, 'time', lambda: next(ticks))
+
+
+def _objects(root):
+    return sorted(name for _, _, files in os.walk(os.path.join(root, 'objects')) for name in files)
+
+
+def test_evicts_least_recently_used_over_budget(tmp_path, clock):
+    cache = SpriteCache(str(tmp_path), max_bytes=250)
+    cache.put('a', b'a' * 100)
+    cache.put('b', b'b' * 100)
+    assert cache.read('a') == b'a' * 100      # a를 썼으니 b가 가장 오래됨
+    cache.put('c', b'c' * 100)
+    assert cache.has('a') and cache.has('c')
+    assert not cache.has('b')
+    assert cache.total_bytes() == 200
+    assert len(_objects(tmp_path)) == 2
+
+
+def test_shared_digest_is_stored_once_and_kept_while_referenced(tmp_path, clock):
+    cache = SpriteCache(str(tmp_path), max_bytes=350)
+    same = b's' * 100
+    cache.put('old', same)
+    cache.put('x', b'x' * 100)
+    cache.put('new', same)
+    assert cache.total_bytes() == 200
+    assert len(_objects(tmp_path)) == 2
+
+    # 400바이트 -> 'old'를 지워도 'new'가 같은 파일을 쓰므로 줄지 않아 'x'까지 지운다
+    cache.put('y', b'y' * 200)
+    assert not cache.has('old') and not cache.has('x')
+    assert cache.read('new') == same
+    assert cache.total_bytes() == 300
+    assert len(_objects(tmp_path)) == 2
+
+
+def test_last_reference_removes_object(tmp_path, clock):
+    cache = SpriteCache(str(tmp_path), max_bytes=150)
+    cache.put('a', b'a' * 100)
+    cache.put('b', b'a' * 100)
+    cache.put('c', b'c' * 100)
+    assert not cache.has('a') and not cache.has('b')
+    assert _objects(tmp_path) == [cache._index['c']['digest']]
+
+
+def test_index_survives_reopen(tmp_path):
+    cache = SpriteCache(str(tmp_path))
+    cache.put('a', b'data', etag='"abc"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+    cache.flush()
+    reopened = SpriteCache(str(tmp_path))
+    assert reopened.read('a') == b'data'
+    assert reopened.validators('a') == {
+        'If-None-Match': '"abc"',
+        'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT',
+    }
+    assert reopened.validators('missing') == {}
+
+
+def test_missing_object_drops_entry(tmp_path):
+    cache = SpriteCache(str(tmp_path))
+    cache.put('a', b'data')
+    os.remove(cache._object_path(cache._index['a']['digest']))
+    assert cache.read('a') is None
+    assert not cache.has('a')
+
+
+def test_revalidation_sends_etag_and_keeps_bytes(api, tmp_path, monkeypatch):
+    cache = SpriteCache(str(tmp_path), max_age=60)
+    fetcher = AssetFetcher(api.api_base, api.sprite_base, cache=cache)
+    url = fetcher.sprite_url(3)
+    first = fetcher.get(url)
+    etag = cache.lookup(url)['etag']
+    assert etag
+
+    # 확인한 지 max_age가 지나면 If-None-Match로 묻고 304면 캐시를 쓴다
+    checked = cache.lookup(url)['checked']
+    monkeypatch.setattr(cache_module.time, 'time', lambda: checked + 120)
+    sent = []
+    original = fetcher.session.get
+
+    def get(url, **options):
+        sent.append(options.get('headers'))
+        return original(url, **options)
+    fetcher.session.get = get
+
+    assert fetcher.get(url) == first
+    assert sent == [{'If-None-Match': etag}]
+    assert fetcher.stats.revalidated == 1
+    assert cache.lookup(url)['checked'] == checked + 120
+    assert cache.is_fresh(cache.lookup(url))
@@ -0,0 +1,121 @@
+import random
+
+from line530.engine import GameEngine
+
+
+def _engine(board_size, mine_cells, topology=None):
+    engine = GameEngine(board_size, len(mine_cells), rng=random.Random(0), topology=topology)
+    engine.load_mines(mine_cells)
+    return engine
+
+
+def test_counts():
+    # . . .
+    # . * .
+    # . . *
+    engine = _engine(3, [4, 8])
+    assert list(engine.counts) == [1, 1, 1, 1, 0, 2, 1, 2, 0]
+
+
+def test_flood_fill_stops_at_numbers():
+    # 0 0 0 0
+    # 0 1 1 1
+    # 0 1 * 1
+    # 0 1 1 1
+    engine = _engine(4, [10])
+    opened = engine.reveal(0)
+    # 숫자 칸에서 멈추므로 숫자 칸으로만 둘러싸인 11, 14, 15는 닫힌 채로
+    assert sorted(opened) == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 12, 13]
+    assert engine.revealed_count == 12
+    assert not engine.over
+    for i in (11, 14, 15):
+        engine.reveal(i)
+    assert engine.revealed_count == 15
+    assert engine.over and engine.won
+
+
+def test_flood_fill_layers():
+    engine = _engine(5, [24])
+    opened, layer_ends = engine.flood_fill(0)
+    assert opened[0] == 0
+    assert layer_ends[0] == 1
+    assert layer_ends[-1] == len(opened) == 24
+    # 한 층의 칸은 모두 시작 칸에서 같은 거리(킹 이동)
+    start = 0
+    for distance, end in enumerate(layer_ends):
+        for i in opened[start:end]:
+            r, c = engine.coords(i)
+            assert max(r, c) == distance
+        start = end
+
+
+def test_flood_fill_does_not_open_past_flags_revealed_or_mines():
+    engine = _engine(4, [3, 12])
+    engine.toggle_flag(5)
+    opened = engine.reveal(5)
+    assert opened == []
+    assert engine.revealed_count == 0
+
+    opened = engine.reveal(10)
+    assert 3 not in opened and 12 not in opened
+    # 0 칸에서 이어 열리면 잘못 꽂힌 깃발도 걷힌다
+    assert 5 in opened
+    assert not engine.is_flagged(5)
+    assert engine.flag_count == 0
+
+
+def test_counters_and_win():
+    engine = _engine(3, [4])   # 나머지 칸은 모두 1
+    engine.toggle_flag(4)
+    assert engine.flag_count == 1
+    assert engine.remaining_mines() == 0
+    engine.toggle_flag(4)
+    assert engine.flag_count == 0
+
+    for n, i in enumerate((0, 1, 2, 3, 5, 6, 7), 1):
+        assert engine.reveal(i) == [i]
+        assert engine.revealed_count == n
+        assert not engine.over
+    engine.reveal(0)             # 이미 열린 칸은 세지 않는다
+    assert engine.revealed_count == 7
+    engine.reveal(8)
+    assert engine.revealed_count == 8
+    assert engine.has_won()
+    assert engine.over and engine.won
+
+
+def test_loss():
+    events = []
+    engine = _engine(3, [4])
+    engine.subscribe(lambda event, *args: events.append((event, *args)))
+    assert engine.reveal(4) == []
+    assert engine.over and not engine.won
+    assert events == [('explode', 4)]
+    # 끝난 판은 더 열리지 않는다
+    assert engine.reveal(0) == []
+    assert engine.revealed_count == 0
+
+
+def test_reveal_emits_event():
+    events = []
+    engine = _engine(3, [8])
+    engine.subscribe(lambda event, *args: events.append((event, *args)))
+    opened = engine.reveal(0)
+    assert events == [('reveal', opened, [1, 4, 8])]
+
+
+def test_start_keeps_first_click_safe():
+    for seed in range(50):
+        engine = GameEngine(8, 20, rng=random.Random(seed))
+        engine.start(3, 3)
+        zone = engine.table.safe_zone(engine.index(3, 3))
+        assert len(engine.mine_cells()) == 20
+        assert not zone & set(engine.mine_cells())
+
+
+def test_hex_and_knight_counts_use_topology():
+    for topology in ('torus', 'hex', 'knight'):
+        engine = _engine(6, [0, 14, 35], topology)
+        for i in range(36):
+            expected = 0 if engine.is_mine(i) else sum(engine.is_mine(k) for k in engine.neighbours(i))
+            assert engine.counts[i] == expected
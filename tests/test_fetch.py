@@ -0,0 +1,114 @@
+import time
+from urllib.parse import urlsplit
+
+import pytest
+
+from line530.cache import SpriteCache
+from line530.fetch import AssetFetcher, FetchError
+
+
+def _fetcher(api, **options):
+    options.setdefault('backoff', 0.01)
+    return AssetFetcher(api.api_base, api.sprite_base, **options)
+
+
+def _path(url):
+    return urlsplit(url).path
+
+
+def test_get_json(api):
+    fetcher = _fetcher(api)
+    species = fetcher.get_json(fetcher.species_url(7))
+    assert species['id'] == 7
+    assert fetcher.stats.requests == 1
+    assert fetcher.stats.retries == 0
+
+
+def test_retries_transient_errors(api):
+    fetcher = _fetcher(api, retries=2)
+    url = fetcher.sprite_url(1)
+    api.failures[_path(url)] = 2
+    assert fetcher.get(url).startswith(b'\x89PNG')
+    assert fetcher.stats.requests == 3
+    assert fetcher.stats.retries == 2
+    assert fetcher.stats.failures == 0
+
+
+def test_gives_up_after_retries(api):
+    fetcher = _fetcher(api, retries=2)
+    url = fetcher.sprite_url(1)
+    api.failures[_path(url)] = 5
+    with pytest.raises(FetchError, match="503"):
+        fetcher.get(url)
+    assert fetcher.stats.requests == 3
+    assert fetcher.stats.failures == 1
+
+
+def test_not_found_is_not_retried(api):
+    fetcher = _fetcher(api, retries=3)
+    with pytest.raises(FetchError):
+        fetcher.get(fetcher.species_url(999))
+    assert fetcher.stats.requests == 1
+    assert fetcher.stats.retries == 0
+    assert api.requests == 1
+
+
+def test_deadline_stops_slow_batch(api):
+    api.latency = 1.0
+    fetcher = _fetcher(api, deadline=0.2)
+    started = time.perf_counter()
+    with pytest.raises(FetchError):
+        fetcher.fetch_roster(3)
+    assert time.perf_counter() - started < 0.9
+
+
+def test_fetch_roster(api):
+    fetcher = _fetcher(api)
+    flag, roster, selected = fetcher.fetch_roster(5)
+    assert flag.startswith(b'\x89PNG')
+    assert selected == len(roster) == 5
+    for poke_id, name, sprite in roster:
+        assert name == f"포켓몬{poke_id}"
+        assert sprite.startswith(b'\x89PNG')
+
+
+def test_cache_hit_skips_network(api, tmp_path):
+    cache = SpriteCache(str(tmp_path))
+    url = _fetcher(api).sprite_url(7)
+    first = _fetcher(api, cache=cache).get(url)
+    requests_before = api.requests
+
+    fetcher = _fetcher(api, cache=cache)
+    assert fetcher.get(url) == first
+    assert fetcher.stats.cache_hits == 1
+    assert api.requests == requests_before
+
+
+def test_stale_cache_is_revalidated(api, tmp_path):
+    cache = SpriteCache(str(tmp_path), max_age=0)
+    url = _fetcher(api).sprite_url(7)
+    first = _fetcher(api, cache=cache).get(url)
+
+    fetcher = _fetcher(api, cache=cache)
+    assert fetcher.get(url) == first
+    assert fetcher.stats.revalidated == 1
+    assert fetcher.stats.bytes == 0
+
+
+def test_stale_cache_used_when_offline(api, tmp_path):
+    cache = SpriteCache(str(tmp_path), max_age=0)
+    url = _fetcher(api).sprite_url(7)
+    first = _fetcher(api, cache=cache).get(url)
+
+    api.failures[_path(url)] = 10
+    fetcher = _fetcher(api, cache=cache, retries=1)
+    assert fetcher.get(url) == first
+    assert fetcher.stats.cache_hits == 1
+
+
+def test_context_manager_closes_session(api, monkeypatch):
+    closed = []
+    with _fetcher(api) as fetcher:
+        monkeypatch.setattr(fetcher.session, 'close', lambda: closed.append(True))
+        assert fetcher.get(fetcher.sprite_url(1)).startswith(b'\x89PNG')
+    assert closed == [True]
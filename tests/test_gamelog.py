@@ -0,0 +1,130 @@
+import random
+
+import pytest
+
+from line530 import gamelog
+from line530.engine import GameEngine
+from line530.gamelog import FLAG, HINT, LEFT, TIMEOUT, GameLog, GameLogError, GameRecorder
+
+
+def _record_game(seed, board_size=9, num_mines=10, topology=None, mine_cells=None):
+    """seed 게임을 무작위로 두며 기록한다. (기록기, 엔진) 을 돌려준다."""
+    rng = random.Random(seed)
+    engine = GameEngine(board_size, num_mines, rng=random.Random(seed), topology=topology)
+    recorder = GameRecorder(board_size, num_mines, seed, timer_limit=120, hints=3,
+                            mine_cells=mine_cells, topology=topology)
+    first = rng.randrange(board_size * board_size)
+    if mine_cells is not None:
+        engine.load_mines(mine_cells)
+    else:
+        engine.start(*engine.coords(first))
+    recorder.record(LEFT, first)
+    engine.reveal(first)
+    while not engine.over:
+        cell = rng.randrange(board_size * board_size)
+        if engine.revealed[cell]:
+            continue
+        action = rng.choice((LEFT, LEFT, LEFT, FLAG, HINT))
+        recorder.record(action, cell)
+        if action == FLAG:
+            engine.toggle_flag(cell)
+        else:
+            engine.reveal(cell)
+    return recorder, engine
+
+
+@pytest.mark.parametrize('varint', [0, 1, 127, 128, 300, 2 ** 32, 2 ** 63 - 1])
+def test_varint_round_trip(varint):
+    out = bytearray()
+    gamelog._put_varint(out, varint)
+    assert gamelog._read_varint(bytes(out) + b'\xff', 0) == (varint, len(out))
+
+
+@pytest.mark.parametrize('topology', [None, 'torus', 'hex', 'knight'])
+def test_round_trip_and_replay(topology):
+    for seed in range(20):
+        recorder, engine = _record_game(seed, topology=topology)
+        log = GameLog.parse(recorder.to_bytes())
+        assert (log.board_size, log.num_mines, log.seed) == (9, 10, seed)
+        assert (log.timer_limit, log.hints, log.started_at) == (120, 3, recorder.started_at)
+        assert log.topology == (topology or 'square')
+        assert log.mine_cells is None
+        assert len(log.records) == recorder.count
+        ticks = [tick for tick, _, _ in log.records]
+        assert ticks == sorted(ticks)
+
+        result = log.replay()
+        assert result['won'] == engine.won
+        assert result['over'] == engine.over
+        assert result['revealed'] == engine.revealed_count
+        assert result['reason'] == ('won' if engine.won else 'mine')
+
+
+def test_explicit_mines_round_trip():
+    mine_cells = [3, 17, 40, 41, 80]
+    recorder, engine = _record_game(7, mine_cells=mine_cells, num_mines=len(mine_cells))
+    log = GameLog.parse(recorder.to_bytes())
+    assert log.mine_cells == mine_cells
+    result = log.replay()
+    assert result['won'] == engine.won
+    assert result['revealed'] == engine.revealed_count
+
+
+def test_timeout():
+    recorder = GameRecorder(9, 10, seed=1)
+    recorder.record(LEFT, 40)
+    recorder.record(TIMEOUT)
+    result = GameLog.parse(recorder.to_bytes()).replay()
+    assert result['reason'] == 'timeout'
+    assert result['over'] and not result['won']
+
+
+def test_save_and_load(tmp_path):
+    recorder, _ = _record_game(2)
+    path = recorder.save(str(tmp_path))
+    assert path.endswith(gamelog.SUFFIX)
+    assert GameLog.load(path).records == GameLog.parse(recorder.to_bytes()).records
+
+
+@pytest.mark.parametrize('data', [b'', b'L530G', b'NOTLOG\x01\x00', b'L530G\x09\x00'])
+def test_rejects_bad_files(data):
+    with pytest.raises(GameLogError):
+        GameLog.parse(data)
+
+
+def _log_bytes(board_size=5, num_mines=3, records=(), mine_cells=None):
+    recorder = GameRecorder(board_size, num_mines, seed=1, timer_limit=0, hints=0, mine_cells=mine_cells)
+    for action, cell in records:
+        recorder.record(action, cell)
+    return recorder.to_bytes()
+
+
+def test_cell_outside_board_names_offset():
+    good = _log_bytes(records=[(LEFT, 12)])
+    bad = _log_bytes(records=[(LEFT, 12), (LEFT, 25)])
+    offset = len(good) + 1          # 두 번째 기록의 시간 차(1바이트) 다음
+    with pytest.raises(GameLogError, match=f"^{offset} 바이트: 칸 번호 25"):
+        GameLog.parse(bad)
+    assert isinstance(GameLogError(), ValueError)
+
+
+def test_mine_cell_outside_board_is_rejected():
+    with pytest.raises(GameLogError, match="칸 번호 30"):
+        GameLog.parse(_log_bytes(mine_cells=[1, 2, 30], records=[(LEFT, 12)]))
+
+
+def test_truncated_record_names_offset():
+    data = _log_bytes(records=[(LEFT, 12), (LEFT, 200)])
+    with pytest.raises(GameLogError, match=f"^{len(data) - 2} 바이트: 기록이 중간에 끊겼습니다"):
+        GameLog.parse(data[:-1])
+
+
+def test_impossible_header_is_rejected():
+    with pytest.raises(GameLogError, match="지뢰 25개"):
+        GameLog.parse(_log_bytes(num_mines=25))
+
+
+def test_replay_rejects_cells_outside_board():
+    log = GameLog(5, 3, 1, None, 0, 0, None, [(0, LEFT, 12), (5, LEFT, 99)])
+    with pytest.raises(GameLogError, match="1번째 기록"):
+        log.replay()
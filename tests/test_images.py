@@ -0,0 +1,89 @@
+import pytest
+from PIL import Image, ImageTk
+
+from line530.images import ImageRegistry
+
+
+class _FakePhoto:
+    """화면 없이 돌도록 ImageTk.PhotoImage 대신 쓰는 것 (크기만 기억)."""
+
+    def __init__(self, image=None, width=None, height=None):
+        self.size = image.size if image is not None else (width, height)
+
+
+@pytest.fixture(autouse=True)
+def no_tk(monkeypatch):
+    monkeypatch.setattr(ImageTk, 'PhotoImage', _FakePhoto)
+    monkeypatch.setattr(ImageRegistry, '_solid_photo',
+                        staticmethod(lambda color, size: _FakePhoto(width=size[0], height=size[1])))
+
+
+def _master(side=10):
+    return Image.new('RGBA', (side, side), (255, 0, 0, 255))
+
+
+def test_variants_are_cached_per_size():
+    registry = ImageRegistry()
+    registry.add_image('a', _master())
+    small = registry.photo('a', 4)
+    assert small.size == (4, 4)
+    assert registry.photo('a', (4, 4)) is small
+    assert registry.photo('a', (6, 3)).size == (6, 3)
+    assert registry.used_bytes == 10 * 10 * 4 + 4 * 4 * 4 + 6 * 3 * 4
+    assert registry.photo('missing', 4) is None
+
+
+def test_oldest_variant_is_evicted_first():
+    # 원본 둘 (400바이트씩) + 변형 (5x5 = 100바이트씩)
+    registry = ImageRegistry(budget_bytes=1000)
+    registry.add_image('a', _master())
+    registry.add_image('b', _master())
+    first = registry.photo('a', 5)
+    registry.photo('b', 5)
+    registry.photo('a', 5)              # a의 변형을 다시 썼으니 b의 변형이 더 오래됨
+    registry.photo('a', (5, 4))         # 1080바이트 -> 변형 하나를 지움
+    assert registry.used_bytes <= 1000
+    assert registry.has('a') and registry.has('b')
+    assert registry.photo('a', 5) is first
+    assert ('b', (5, 5)) not in registry._variants
+
+
+def test_masters_are_evicted_when_variants_are_not_enough():
+    registry = ImageRegistry(budget_bytes=900)
+    registry.add_image('a', _master())
+    registry.add_image('b', _master())
+    registry.photo('b', 5)
+    registry.add_image('c', _master())  # 1300바이트 -> b의 변형, 그다음 가장 오래된 원본 a
+    assert not registry.has('a')
+    assert registry.has('b') and registry.has('c')
+    assert not registry._variants
+    assert registry.used_bytes == 800
+
+
+def test_requested_variant_is_kept_even_over_budget():
+    registry = ImageRegistry(budget_bytes=500)
+    registry.add_image('a', _master())
+    photo = registry.photo('a', 20)     # 1600바이트짜리 변형 하나만으로도 예산 초과
+    assert photo.size == (20, 20)
+    assert list(registry._variants) == [('a', (20, 20))]
+    assert registry.has('a')            # 변형의 원본은 지우지 않는다
+
+
+def test_replacing_master_drops_its_variants():
+    registry = ImageRegistry()
+    registry.add_image('a', _master())
+    registry.photo('a', 4)
+    registry.add_image('a', _master(8))
+    assert not registry._variants
+    assert registry.used_bytes == 8 * 8 * 4
+    registry.discard('a')
+    assert registry.used_bytes == 0
+
+
+def test_solids_and_bad_bytes():
+    registry = ImageRegistry()
+    registry.add_solid('grass', (0, 128, 0, 255))
+    assert registry.has('grass')
+    assert registry.photo('grass', 3).size == (3, 3)
+    assert not registry.add_bytes('broken', b'not an image')
+    assert not registry.has('broken')
@@ -0,0 +1,76 @@
+import queue
+import random
+
+from line530.cache import SpriteCache
+from line530.fetch import AssetFetcher
+from line530.loader import AssetLoader
+
+
+def _run(api, count, **options):
+    results = queue.Queue()
+    options.setdefault('fetcher_options', {'api_base': api.api_base, 'sprite_base': api.sprite_base})
+    loader = AssetLoader(1, count, results, random.Random(0), **options)
+    loader.start()
+    loader.join(timeout=30)
+    assert not loader.is_alive()
+    messages = []
+    while not results.empty():
+        messages.append(results.get_nowait())
+    return loader, messages
+
+
+def test_network_load_sends_decoded_sprites(api, monkeypatch):
+    closed = []
+    monkeypatch.setattr(AssetFetcher, 'close', lambda self: closed.append(self))
+    loader, messages = _run(api, 5)
+    kinds = [message[1] for message in messages]
+    assert all(message[0] == 1 for message in messages)
+    assert kinds[0] == 'start' and kinds[-1] == 'done'
+    assert kinds.count('flag') == 1
+    pokemon = [message for message in messages if message[1] == 'pokemon']
+    assert len(pokemon) == 5
+    for _, _, key, name, image in pokemon:
+        poke_id = key.split('/')[1]
+        assert name == f"포켓몬{poke_id}"
+        assert image.size == (96, 96)
+    assert messages[-1] == (1, 'done', 5, 5)
+    assert closed == [loader.fetcher]       # 끝나면 연결 풀을 닫는다
+
+
+def test_exclude_and_no_flag(api):
+    exclude = range(1, 16)
+    _, messages = _run(api, 3, exclude=exclude, with_flag=False)
+    keys = [message[2] for message in messages if message[1] == 'pokemon']
+    assert len(keys) == 3
+    assert all(int(key.split('/')[1]) > 15 for key in keys)
+    assert 'flag' not in [message[1] for message in messages]
+
+
+def test_failed_load_still_sends_done(api, monkeypatch):
+    closed = []
+    monkeypatch.setattr(AssetFetcher, 'close', lambda self: closed.append(self))
+    api.failures['/api/v2/pokemon?limit=151'] = 10
+    loader, messages = _run(api, 5, fetcher_options={
+        'api_base': api.api_base, 'sprite_base': api.sprite_base, 'retries': 0,
+    })
+    assert messages[-1] == (1, 'done', 0, 0)
+    assert closed == [loader.fetcher]
+
+
+def test_cached_sprites_load_offline(api, tmp_path):
+    cache_root = str(tmp_path)
+    _run(api, 4, cache=SpriteCache(cache_root))
+    requests_before = api.requests
+    _, messages = _run(api, 4, cache=SpriteCache(cache_root), offline_first=True)
+    assert messages[-1] == (1, 'done', 4, 4)
+    assert api.requests == requests_before
+
+
+def test_cancelled_loader_sends_nothing(api):
+    results = queue.Queue()
+    loader = AssetLoader(1, 5, results, random.Random(0),
+                         fetcher_options={'api_base': api.api_base, 'sprite_base': api.sprite_base})
+    loader.cancel()
+    loader.start()
+    loader.join(timeout=30)
+    assert results.empty()
@@ -0,0 +1,128 @@
+import os
+import queue
+
+import pytest
+
+from line530 import names
+from line530.fetch import AssetFetcher
+from line530.names import NameIndex, NamesError, build, build_in_background, pack
+
+
+def test_pack_and_lookup(tmp_path):
+    path = tmp_path / 'names'
+    path.write_bytes(pack({
+        1: {'ko': "이상해씨", 'ja-Hrkt': "フシギダネ", 'en': "Bulbasaur"},
+        2: {'ko': "이상해풀", 'en': "Ivysaur"},
+    }))
+    index = NameIndex(str(path))
+    assert index.count == 2
+    assert index.lookup(1, 'en') == "Bulbasaur"
+    assert index.lookup('2', 'ko') == "이상해풀"
+    assert index.lookup(2, 'ja-Hrkt') is None
+    assert index.lookup(3, 'en') is None
+    assert index.display_name(1, 'ja') == "フシギダネ"
+    assert 2 in index and 3 not in index
+
+
+def test_pack_rejects_gaps():
+    with pytest.raises(NamesError):
+        pack({1: {'en': "a"}, 3: {'en': "c"}})
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'names'
+    path.write_bytes(b'not an index at all')
+    with pytest.raises(NamesError):
+        NameIndex(str(path))
+
+
+def test_build_from_api(api, tmp_path):
+    path = str(tmp_path / 'gen1.names')
+    build(path, fetcher=AssetFetcher(api.api_base, api.sprite_base, deadline=None), limit=api.count)
+    index = NameIndex(path)
+    assert index.count == api.count
+    assert index.display_name(7, 'ko') == "포켓몬7"
+    assert index.display_name(7, 'ja') == "ポケモン7"
+
+
+def test_index_replaces_species_requests(api, tmp_path):
+    path = str(tmp_path / 'gen1.names')
+    build(path, fetcher=AssetFetcher(api.api_base, api.sprite_base, deadline=None), limit=api.count)
+    fetcher = AssetFetcher(api.api_base, api.sprite_base, names=NameIndex(path), language='en')
+    _, roster, _ = fetcher.fetch_roster(5)
+    assert {name for _, name, _ in roster} <= {f"Pokemon{i}" for i in range(1, api.count + 1)}
+    assert fetcher.stats.requests == 1 + 1 + 5     # 목록, 깃발, 스프라이트만
+
+
+def _write_index(path, name):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(pack({1: {'en': name}}))
+    return str(path)
+
+
+def test_open_default_prefers_packaged_then_user_cache(tmp_path, monkeypatch, capsys):
+    packaged = tmp_path / 'package' / 'gen1.names'
+    user = tmp_path / 'cache' / 'gen1.names'
+    monkeypatch.setattr(names, 'NAMES_SEARCH_PATHS', (str(packaged), str(user)))
+    assert NameIndex.open_default() is None
+
+    _write_index(user, "User")
+    assert NameIndex.open_default().lookup(1, 'en') == "User"
+    _write_index(packaged, "Packaged")
+    assert NameIndex.open_default().lookup(1, 'en') == "Packaged"
+
+    packaged.write_bytes(b'broken')
+    assert NameIndex.open_default().lookup(1, 'en') == "User"
+    assert "Could not open name index" in capsys.readouterr().out
+
+
+def test_user_path_is_in_user_cache_dir(tmp_path, monkeypatch):
+    from line530.cache import user_cache_dir
+    assert names.USER_NAMES_PATH == os.path.join(user_cache_dir(), 'gen1.names')
+    assert not names.USER_NAMES_PATH.startswith(os.path.dirname(names.__file__))
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    assert user_cache_dir() == str(tmp_path / 'line530')
+
+
+def _build_in_background(api, path):
+    done = queue.Queue()
+    options = {'api_base': api.api_base, 'sprite_base': api.sprite_base}
+    build_in_background(done.put, path=path, limit=api.count, fetcher_options=options).join(timeout=30)
+    return done
+
+
+def test_build_in_background_hands_over_index(api, tmp_path):
+    path = str(tmp_path / 'cache' / 'gen1.names')
+    index = _build_in_background(api, path).get_nowait()
+    assert index.path == path
+    assert index.display_name(3, 'en') == "Pokemon3"
+
+
+def test_build_in_background_logs_write_failure(api, tmp_path, capsys):
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_text('')
+    assert _build_in_background(api, str(blocker / 'gen1.names')).empty()
+    assert f"Could not write name index to {blocker / 'gen1.names'}" in capsys.readouterr().out
+
+
+def test_game_applies_index_on_tk_thread(game_module, tmp_path):
+    gui = object.__new__(game_module.MinesweeperGUI)
+    gui.names = None
+    gui.asset_queue = queue.Queue()
+    gui.asset_generation = 3
+    gui.asset_poll_job = None
+    gui.assets_loading = False
+    gui.names_builder = None
+
+    class _Prefetcher:
+        busy = False
+
+        def poll(self, limit):
+            pass
+    gui.roster_prefetcher = _Prefetcher()
+    index = NameIndex(_write_index(tmp_path / 'gen1.names', "Bulbasaur"))
+    gui._on_names_built(index)          # 색인 스레드에서 부르는 것과 같음
+    assert gui.names is None            # 큐를 비울 때까지는 그대로
+    gui._poll_assets()
+    assert gui.names is index
+    assert gui.asset_poll_job is None
@@ -0,0 +1,125 @@
+import time
+
+import pytest
+
+from line530.engine import GameEngine
+from line530.noguess import BoardPool, cell_class, cell_classes, generate, is_solvable, map_board
+from line530.solver import MineSolver
+from line530.topology import TOPOLOGIES
+
+TOPOLOGY_NAMES = sorted(TOPOLOGIES)
+
+
+def _solves_without_guessing(board_size, mine_cells, r, c, topology):
+    """풀이기의 확실한 추론(확률 0)만으로 끝까지 열리는지 따로 둬 본다."""
+    engine = GameEngine(board_size, len(mine_cells), topology=topology)
+    engine.load_mines(mine_cells)
+    solver = MineSolver(engine)
+    engine.reveal(engine.index(r, c))
+    while not engine.over:
+        cell, risk = solver.hint()
+        if risk > 0:
+            return False
+        engine.reveal(cell)
+    return engine.won
+
+
+@pytest.mark.parametrize('topology', TOPOLOGY_NAMES)
+def test_generated_boards_need_no_guess(topology):
+    size, mines = 9, 14
+    for seed in range(3):
+        for r, c in ((4, 4), (0, 0), (1, 7)):
+            cells, attempts, _ = generate(size, mines, r, c, seed, topology=topology)
+            assert cells is not None, (topology, seed, r, c)
+            assert attempts >= 1
+            assert len(cells) == mines
+            safe = GameEngine(size, mines, topology=topology).table.safe_zone(r * size + c)
+            assert not safe & set(cells)
+            assert _solves_without_guessing(size, cells, r, c, topology)
+
+
+@pytest.mark.parametrize('topology', TOPOLOGY_NAMES)
+def test_symmetry_remap_stays_solvable(topology):
+    size, mines = 8, 10
+    boards = {}
+    for r in range(size):
+        for c in range(size):
+            cls = cell_class(size, r, c, topology)
+            if cls not in boards:
+                boards[cls], _, _ = generate(size, mines, *cls, seed=1, topology=topology)
+            mapped = map_board(size, boards[cls], cls, (r, c), topology)
+            assert sorted(set(mapped)) == sorted(mapped) and len(mapped) == mines
+            assert is_solvable(size, mapped, r, c, topology), (topology, cls, (r, c))
+
+
+def test_class_counts():
+    assert len(cell_classes(8, 'square')) == 10
+    assert len(cell_classes(8, 'knight')) == 10
+    assert cell_classes(8, 'torus') == [(0, 0)]
+    # 육각은 뒤집기 2가지뿐이라 칸의 약 절반
+    assert 32 <= len(cell_classes(8, 'hex')) < 64
+
+
+def test_map_board_rejects_other_class():
+    with pytest.raises(ValueError):
+        map_board(8, [0], (0, 0), (3, 3), 'square')
+
+
+def _wait(predicate, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_pool_prefill_take_and_refill():
+    pool = BoardPool(workers=2)
+    try:
+        pool.prefill(6, 5)
+        keys = [(6, 5, 'square', cls) for cls in cell_classes(6)]
+        assert pool._in_flight() <= pool.workers
+        assert _wait(lambda: all(pool._ready.get(key) for key in keys))
+
+        cells = pool.take(6, 5, 5, 0)
+        assert cells is not None
+        assert is_solvable(6, cells, 5, 0)
+        assert pool.stats.served == 1
+        # 꺼낸 종류는 다시 채운다
+        key = (6, 5, 'square', cell_class(6, 5, 0))
+        assert pool._pending[key] or pool._queued.count(key) or pool._ready[key]
+        assert _wait(lambda: pool._ready.get(key))
+    finally:
+        pool.shutdown()
+
+
+def test_pool_drops_boards_of_old_settings():
+    pool = BoardPool(workers=1)
+    try:
+        pool.prefill(10, 20)
+        assert pool._in_flight() == 1          # 나머지 종류는 풀 밖 대기열에서 기다린다
+        assert len(pool._queued) > 1
+        pool.prefill(5, 3)
+        assert all(key[:3] == (5, 3, 'square') for key in pool._queued)
+        keys = [(5, 3, 'square', cls) for cls in cell_classes(5)]
+        assert _wait(lambda: all(pool._ready.get(key) for key in keys))
+        assert all(key[:3] == (5, 3, 'square') for key in pool._ready if pool._ready[key])
+        assert pool._in_flight() <= pool.workers
+    finally:
+        pool.shutdown()
+
+
+def test_result_for_old_settings_is_dropped():
+    from concurrent.futures import Future
+    pool = BoardPool(workers=1)
+    pool.prefill(31, 40)      # 30보다 큰 보드라 미리 채우는 작업은 없다
+    old_key = (8, 10, 'square', (3, 3))
+    future = Future()
+    future.set_result(([0, 1], 3, 0.01))
+    pool._on_done(old_key, future)
+    assert pool.stats.stale == 1
+    assert not pool._ready.get(old_key)
+    current_key = (31, 40, 'square', (15, 15))
+    pool._on_done(current_key, future)
+    assert pool._ready[current_key] == [[0, 1]]
@@ -0,0 +1,111 @@
+import sqlite3
+import threading
+
+import pytest
+
+from line530 import results
+from line530.results import ResultStore, make_row, source_name
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultStore(str(tmp_path / 'results.sqlite3'))
+    yield store
+    store.close()
+
+
+def _wins(store, durations, board_size=10, num_mines=15, **options):
+    store.add_many(make_row(board_size, num_mines, True, duration_ms=ms, **options) for ms in durations)
+
+
+def test_add_returns_before_write_and_writer_is_background(tmp_path, monkeypatch):
+    store = ResultStore(str(tmp_path / 'results.sqlite3'))
+    writer_threads = []
+    original = ResultStore._commit
+
+    def commit(self, db, rows, waiters):
+        writer_threads.append(threading.current_thread())
+        original(self, db, rows, waiters)
+    monkeypatch.setattr(ResultStore, '_commit', commit)
+
+    store.add(make_row(10, 15, True, duration_ms=1000))
+    assert store.flush(timeout=5)
+    assert store.written == 1
+    assert writer_threads and all(t.name == "results-writer" for t in writer_threads)
+    assert threading.current_thread() not in writer_threads
+    store.close()
+
+
+def test_queued_rows_are_batched_into_transactions(store, monkeypatch):
+    monkeypatch.setattr(results, 'WRITE_BATCH', 50)
+    gate = threading.Event()
+    batches = []
+    original = store._commit
+
+    def commit(db, rows, waiters):
+        gate.wait(5)                # 첫 커밋을 붙잡아 두는 동안 대기열이 쌓인다
+        batches.append(len(rows))
+        original(db, rows, waiters)
+    store._commit = commit
+
+    store.add(make_row(8, 10, False))
+    for _ in range(3):
+        store.add_many(make_row(8, 10, False) for _ in range(40))
+    gate.set()
+    assert store.flush(timeout=5)
+    assert store.written == 121
+    # 쌓인 120줄은 한 줄씩이 아니라 WRITE_BATCH를 넘으면 끊기는 묶음 몇 개로 들어간다
+    assert len(batches) <= 4
+    assert all(n <= 50 + 40 for n in batches)
+
+
+def test_close_flushes_pending_rows(tmp_path):
+    path = str(tmp_path / 'results.sqlite3')
+    store = ResultStore(path)
+    _wins(store, range(1000, 1100))
+    store.close()
+    assert store.written == 100
+    with sqlite3.connect(path) as db:
+        assert db.execute("SELECT COUNT(*) FROM games").fetchone() == (100,)
+        assert db.execute("SELECT games, wins FROM config_totals").fetchall() == [(100, 100)]
+
+
+def test_summary_counts_games_and_wins(store):
+    _wins(store, [3000, 1000, 2000])
+    store.add(make_row(10, 15, False, reason='mine'))
+    store.add(make_row(10, 15, False, timer_limit=60, reason='timeout'))
+    store.add(make_row(10, 15, True, duration_ms=500, source='sim:solver'))
+    store.flush()
+    assert store.summary(10, 15) == (4, 3)
+    assert store.summary(10, 15, timer_limit=60) == (1, 0)
+    assert store.summary(10, 15, source='sim:solver') == (1, 1)
+    assert store.summary(9, 15) == (0, 0)
+
+
+def test_leaderboard_is_fastest_wins_first(store):
+    _wins(store, [3000, 1000, 2000, 500], hints_used=1)
+    store.add(make_row(10, 15, False, duration_ms=10))
+    store.flush()
+    board = store.leaderboard(10, 15, limit=3)
+    assert [row[0] for row in board] == [500, 1000, 2000]
+    assert all(row[2] == 1 for row in board)
+
+
+def test_percentiles_and_rank(store):
+    _wins(store, [i * 100 for i in range(1, 101)])   # 100ms .. 10000ms
+    store.flush()
+    assert store.duration_percentiles(10, 15, percents=(50, 90)) == {50: 5100, 90: 9100}
+    assert store.rank(10, 15, 50) == 0.0
+    assert store.rank(10, 15, 5050) == 0.5
+    assert store.rank(10, 15, 20000) == 1.0
+    assert store.duration_percentiles(8, 10) == {}
+    assert store.rank(8, 10, 100) is None
+
+
+def test_topologies_are_separate_sources(store):
+    _wins(store, [1000], source=source_name('game', 'hex'))
+    _wins(store, [2000], source=source_name('game', 'square'))
+    store.flush()
+    assert source_name('game', 'square') == 'game'
+    assert store.summary(10, 15, source='game:hex') == (1, 1)
+    assert [row[0] for row in store.leaderboard(10, 15)] == [2000]
@@ -0,0 +1,71 @@
+from line530.roster import DEFAULT_POOL_SIZE, RosterPrefetcher
+
+
+class _FakeLoader:
+    """AssetLoader처럼 결과 큐에 명단을 넣는다. 종 수(pool)보다 많이는 못 고른다."""
+
+    def __init__(self, generation, count, results, exclude, pool=DEFAULT_POOL_SIZE):
+        self.generation = generation
+        self.count = min(count, pool - len(exclude))
+        self.results = results
+        self.cancelled = False
+        self.started = False
+
+    def start(self):
+        self.started = True
+        for poke_id in range(1, self.count + 1):
+            self.results.put((self.generation, 'pokemon', f"pokemon/{poke_id}", f"포켓몬{poke_id}", None))
+        self.results.put((self.generation, 'done', self.count))
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def _prefetcher(**options):
+    loaders = []
+
+    def make_loader(generation, count, results, exclude):
+        loaders.append(_FakeLoader(generation, count, results, exclude))
+        return loaders[-1]
+    return RosterPrefetcher(make_loader, **options), loaders
+
+
+def test_prefetch_and_take():
+    prefetcher, loaders = _prefetcher()
+    assert prefetcher.prefetch(15)
+    assert not prefetcher.prefetch(15)      # 이미 받는 중
+    prefetcher.poll(100)
+    assert not prefetcher.busy
+    roster = prefetcher.take(15)
+    assert len(roster) == 15
+    assert prefetcher.take(15) is None
+
+
+def test_short_roster_is_dropped():
+    prefetcher, _ = _prefetcher()
+    prefetcher.prefetch(10)
+    prefetcher.poll(100)
+    assert prefetcher.take(20) is None
+    assert not prefetcher.ready
+
+
+def test_more_mines_than_species_still_rotates():
+    prefetcher, loaders = _prefetcher()
+    for _ in range(3):
+        assert prefetcher.prefetch(200)
+        assert loaders[-1].count == DEFAULT_POOL_SIZE
+        prefetcher.poll(1000)
+        roster = prefetcher.take(200)
+        assert roster is not None
+        assert len(roster) == DEFAULT_POOL_SIZE
+
+
+def test_growing_count_restarts_smaller_load():
+    prefetcher, loaders = _prefetcher()
+    prefetcher.results.put = lambda message: None      # 결과가 오지 않은 채로 받는 중
+    prefetcher.prefetch(10)
+    assert prefetcher.prefetch(20)
+    assert loaders[0].cancelled
+    # 종 수보다 많은 요청은 같은 크기(pool_size)라 다시 시작하지 않는다
+    assert prefetcher.prefetch(200)
+    assert not prefetcher.prefetch(300)
@@ -0,0 +1,104 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from line530 import server
+from line530.server import GameServer, GameSession, SpriteCatalog, load_test
+
+
+@pytest.fixture
+def game_server():
+    game_server = GameServer(SpriteCatalog(count=20))
+    yield game_server
+    game_server._hint_pool.shutdown()
+
+
+async def _serve(game_server):
+    listener = await asyncio.start_server(game_server.handle, '127.0.0.1', 0)
+    return listener, listener.sockets[0].getsockname()[1]
+
+
+async def _call(reader, writer, request):
+    writer.write(json.dumps(request).encode() + b'\n')
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+def test_session_plays_to_the_end():
+    session = GameSession(SpriteCatalog(count=20))
+    reply = session.new_game(8, 10, hints=0, seed=7)
+    assert (reply['board_size'], reply['num_mines'], reply['seed']) == (8, 10, 7)
+    assert reply['state'] == 'playing'
+    reply = session.reveal(0, 0)
+    assert reply['cells'] and 'exploded' not in reply
+    hidden = [i for i in range(64) if not session.engine.is_revealed(i) and not session.engine.is_mine(i)]
+    for i in hidden:
+        reply = session.reveal(*divmod(i, 8))
+    assert reply['state'] == 'won'
+    assert sorted(i for i, _ in reply['mines']) == sorted(session.engine.mine_cells())
+
+
+def test_bad_requests_get_errors(game_server):
+    session = GameSession(game_server.catalog)
+    assert 'error' in json.loads(game_server.dispatch(session, b'not json\n'))
+    assert 'error' in json.loads(game_server.dispatch(session, b'[1]\n'))
+    assert 'error' in json.loads(game_server.dispatch(session, b'{"op": "reveal", "r": 0, "c": 0}\n'))
+    assert 'error' in json.loads(game_server.dispatch(session, b'{"op": "fly"}\n'))
+    game_server.dispatch(session, b'{"op": "new", "size": 5, "mines": 3}\n')
+    assert 'error' in json.loads(game_server.dispatch(session, b'{"op": "reveal", "r": 9, "c": 0}\n'))
+    assert 'error' in json.loads(game_server.dispatch(session, b'{"op": "hint"}\n'))
+
+
+def test_new_and_hint_run_off_the_event_loop(game_server, monkeypatch):
+    threads = {}
+    for op in ('new_game', 'hint'):
+        original = getattr(GameSession, op)
+
+        def record(self, *args, _op=op, _original=original):
+            threads[_op] = threading.current_thread().name
+            return _original(self, *args)
+        monkeypatch.setattr(GameSession, op, record)
+
+    async def play():
+        listener, port = await _serve(game_server)
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        try:
+            reply = await _call(reader, writer, {'op': 'new', 'size': 12, 'mines': 20, 'seed': 3})
+            assert reply['board_size'] == 12
+            await _call(reader, writer, {'op': 'reveal', 'r': 6, 'c': 6})
+            await _call(reader, writer, {'op': 'hint', 'risky': True})
+        finally:
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+    asyncio.run(play())
+    assert threads['new_game'].startswith('hint')
+    assert threads['hint'].startswith('hint')
+
+
+def test_load_test_round_trip(game_server):
+    async def run():
+        listener, port = await _serve(game_server)
+        try:
+            return await load_test('127.0.0.1', port, sessions=4, games=2, size=8, mines=10, seed=1)
+        finally:
+            listener.close()
+            await listener.wait_closed()
+    result = asyncio.run(run())
+    assert result['sessions'] == 4
+    assert result['moves'] > 0
+    assert result['p50_ms'] <= result['max_ms']
+    assert game_server.sessions == 0
+    assert game_server.requests >= result['moves']
+
+
+def test_sprites_payload_is_shared(game_server):
+    first = GameSession(game_server.catalog)
+    second = GameSession(game_server.catalog)
+    payload = game_server.dispatch(first, b'{"op": "sprites"}\n')
+    assert payload is game_server.dispatch(second, b'{"op": "sprites"}\n')
+    sprites = json.loads(payload)['sprites']
+    assert [s['id'] for s in sprites] == list(range(1, 21))
+    assert sprites[0]['url'] == f"{server.SPRITE_BASE}/pokemon/1.png"
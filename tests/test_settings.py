@@ -0,0 +1,79 @@
+import pytest
+
+
+class _Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append(name)
+
+
+@pytest.fixture
+def gui(game_module):
+    """Tk 창 없이 설정 적용만 시험하도록, 화면을 건드리는 메서드는 호출만 기록한다."""
+    gui = object.__new__(game_module.MinesweeperGUI)
+    gui.board_size, gui.num_mines, gui.button_size = 10, 15, 24
+    gui.hints_per_game = gui.hints_left = 3
+    gui.ripple_reveal = True
+    gui.renderer_name, gui.no_guess, gui.topology_name = 'button', False, 'square'
+    gui.language = 'ko'
+    gui.names = object()
+    gui.game_over = False
+    gui.render_stats = False
+    gui.images_loaded_successfully = True
+    gui.calls = _Recorder()
+    gui.hint_button = _Recorder()
+    for name in ('load_more_pokemon', 'start_new_game', '_rescale_board', 'update_status_label',
+                 '_prefetch_next_roster'):
+        setattr(gui, name, getattr(gui.calls, name))
+    return gui
+
+
+def _apply(gui, **changes):
+    values = dict(new_board=gui.board_size, new_mines=gui.num_mines, new_tile=gui.button_size,
+                  new_hints=gui.hints_per_game, ripple=gui.ripple_reveal, new_renderer=gui.renderer_name,
+                  new_no_guess=gui.no_guess, new_topology=gui.topology_name, new_language=gui.language)
+    values.update(changes)
+    return gui.apply_settings(**values)
+
+
+@pytest.mark.parametrize('changes', [
+    {'new_board': 12}, {'new_mines': 20}, {'new_renderer': 'canvas'}, {'new_no_guess': True},
+    {'new_topology': 'hex'}, {'new_board': 12, 'new_tile': 30},
+])
+def test_board_changes_start_new_game(gui, changes):
+    assert _apply(gui, **changes) == "새 게임"
+    assert gui.calls.calls == ['load_more_pokemon', 'start_new_game']
+
+
+def test_tile_only_rescales_in_place(gui):
+    assert _apply(gui, new_tile=32) == "타일 크기"
+    assert gui.calls.calls == ['_rescale_board']
+    assert gui.button_size == 32
+    assert gui.large_img_size == 96
+
+
+@pytest.mark.parametrize('changes', [{'ripple': False}, {'new_language': 'en'}, {}])
+def test_value_only_changes_touch_nothing(gui, changes):
+    assert _apply(gui, **changes) == "값만"
+    assert gui.calls.calls == []
+    assert gui.hint_button.calls == []
+
+
+def test_hint_count_updates_current_game(gui):
+    gui.hints_left = 1
+    assert _apply(gui, new_hints=5) == "값만"
+    assert gui.hints_left == 3
+    assert gui.calls.calls == ['update_status_label']
+    assert gui.hint_button.calls == ['config']
+
+
+def test_language_without_index_refetches_next_roster(gui):
+    gui.names = None
+    gui.roster_prefetcher = _Recorder()
+    gui.roster_prefetcher.ready = set()
+    assert _apply(gui, new_language='ja') == "값만"
+    assert gui.roster_prefetcher.calls == ['cancel']
+    assert gui.calls.calls == ['_prefetch_next_roster']
+    assert gui.language == 'ja'
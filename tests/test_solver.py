@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from line530.engine import GameEngine
+from line530.solver import _MINE, MineSolver
+
+
+def _play(board_size, num_mines, seed, topology=None):
+    """풀이기 힌트만으로 한 판을 둔다. 힌트마다 (엔진, 풀이기, 칸, 확률)을 넘긴다."""
+    rng = random.Random(seed)
+    engine = GameEngine(board_size, num_mines, rng=rng, topology=topology)
+    solver = MineSolver(engine)
+    first = rng.randrange(board_size * board_size)
+    engine.start(*engine.coords(first))
+    engine.reveal(first)
+    while not engine.over:
+        cell, risk = solver.hint(rng)
+        yield engine, solver, cell, risk
+        engine.reveal(cell)
+
+
+@pytest.mark.parametrize('topology, board_size, num_mines, games', [
+    ('square', 8, 10, 60),
+    ('square', 16, 40, 20),
+    ('square', 30, 150, 3),
+    ('torus', 10, 16, 30),
+    ('hex', 10, 16, 30),
+    ('knight', 10, 16, 30),
+    ('knight', 20, 70, 5),
+])
+def test_safe_hints_are_never_mines(topology, board_size, num_mines, games):
+    for seed in range(games):
+        for engine, solver, cell, risk in _play(board_size, num_mines, seed, topology):
+            assert not engine.revealed[cell]
+            if risk == 0.0:
+                assert not engine.is_mine(cell), f"seed {seed}: 안전하다던 칸 {cell}이 지뢰"
+            for i in solver.safe:
+                assert not engine.is_mine(i)
+            for i, value in enumerate(solver.known):
+                if value == _MINE:
+                    assert engine.is_mine(i)
+
+
+def test_probabilities_are_valid():
+    for engine, solver, cell, risk in _play(16, 40, seed=3):
+        assert 0.0 <= risk <= 1.0
+        probs, interior_p = solver.probabilities()
+        assert 0.0 <= interior_p <= 1.0
+        for i, p in probs.items():
+            assert 0.0 <= p <= 1.0
+            assert not engine.revealed[i]
+
+
+def test_solved_board_without_guessing():
+    # 1 * 1
+    # 1 1 1
+    # 0 0 0   아래 0 칸 하나만 열어도 나머지가 모두 추론된다
+    engine = GameEngine(3, 1, rng=random.Random(0))
+    engine.load_mines([1])
+    solver = MineSolver(engine)
+    engine.reveal(6)
+    while not engine.over:
+        cell, risk = solver.hint()
+        assert risk == 0.0
+        engine.reveal(cell)
+    assert engine.won
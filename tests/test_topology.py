@@ -0,0 +1,71 @@
+import pytest
+
+from line530 import topology as topologies
+from line530.topology import TOPOLOGIES, neighbour_table
+
+
+def _brute_force(name, board_size, r, c):
+    """칸 (r, c)의 이웃 번호들을 방향 목록에서 하나씩 계산한다 (steps 순서)."""
+    topology = TOPOLOGIES[name]
+    n = board_size
+    out = []
+    for dr, dc in topology.steps[r & 1]:
+        nr, nc = r + dr, c + dc
+        if topology.wrap:
+            nr, nc = nr % n, nc % n
+        elif not (0 <= nr < n and 0 <= nc < n):
+            continue
+        k = nr * n + nc
+        if k != r * n + c and k not in out:
+            out.append(k)
+    return out
+
+
+@pytest.mark.parametrize('name', sorted(TOPOLOGIES))
+@pytest.mark.parametrize('board_size', [1, 2, 3, 4, 5, 8, 13])
+def test_table_matches_brute_force(name, board_size):
+    table = neighbour_table(name, board_size)
+    assert len(table.starts) == board_size * board_size + 1
+    for r in range(board_size):
+        for c in range(board_size):
+            i = r * board_size + c
+            assert list(table.neighbours(i)) == _brute_force(name, board_size, r, c), (name, board_size, r, c)
+
+
+@pytest.mark.parametrize('name', sorted(TOPOLOGIES))
+def test_neighbours_are_symmetric(name):
+    n = 9
+    table = neighbour_table(name, n)
+    for i in range(n * n):
+        for k in table.neighbours(i):
+            assert i in table.neighbours(k)
+
+
+def test_known_degrees():
+    n = 6
+    assert {len(neighbour_table('torus', n).neighbours(i)) for i in range(n * n)} == {8}
+    square = neighbour_table('square', n)
+    assert len(square.neighbours(0)) == 3
+    assert len(square.neighbours(1)) == 5
+    assert len(square.neighbours(7)) == 8
+    hex_table = neighbour_table('hex', n)
+    assert max(len(hex_table.neighbours(i)) for i in range(n * n)) == 6
+    # 홀수 행은 반 칸 오른쪽: (1, 1)의 위 이웃은 (0, 1), (0, 2)
+    assert sorted(hex_table.neighbours(n + 1)) == [1, 2, n, n + 2, 2 * n + 1, 2 * n + 2]
+    knight = neighbour_table('knight', n)
+    assert sorted(knight.neighbours(0)) == [n + 2, 2 * n + 1]
+
+
+def test_safe_zone():
+    table = neighbour_table('square', 5)
+    assert table.safe_zone(12) == {6, 7, 8, 11, 12, 13, 16, 17, 18}
+
+
+def test_tables_are_shared():
+    assert topologies.get(None).table(7) is neighbour_table('square', 7)
+    assert neighbour_table('hex', 7) is neighbour_table('hex', 7)
+
+
+def test_unknown_topology():
+    with pytest.raises(ValueError):
+        topologies.get('moebius')
@@ -1,9 +1,34 @@
+import time
+_STARTED_AT = time.perf_counter()
+
 import tkinter as tk
 from tkinter import messagebox, simpledialog
+import queue
 import random
-import requests
-from io import BytesIO
-from PIL import Image, ImageTk
+import sqlite3
+from collections import deque
+
+# requests/Pillow는 여기서 불러오지 않는다 (배경 로더나 첫 스프라이트 표시 때 불러옴)
+from line530 import board
+from line530.atlas import SpriteAtlas
+from line530.cache import SpriteCache
+from line530 import gamelog
+from line530.engine import GameEngine
+from line530.topology import DEFAULT_TOPOLOGY, TOPOLOGIES
+from line530.images import ImageRegistry
+from line530.loader import AssetLoader
+from line530.names import DEFAULT_LANGUAGE, DISPLAY_LANGUAGES, LANGUAGE_LABELS, NameIndex, build_in_background
+from line530.noguess import BoardPool
+from line530.profiling import StartupProfile
+from line530.render import (
+    BG_COLOR_LOSS, BG_COLOR_TRIGGERED, BG_COLOR_WIN, MAX_BOARD_SIZE, RENDERERS, measure_build,
+)
+from line530.results import SOURCE_GAME, ResultStore, make_row, source_name
+from line530.roster import RosterPrefetcher
+from line530.solver import MineSolver
+from line530.trace import TRACER
+
+_IMPORTED_AT = time.perf_counter()
 
 # --- 기본 상수 (초기값) ---
 DEFAULT_BOARD_SIZE = 10
@@ -12,17 +37,33 @@ DEFAULT_BUTTON_SIZE = 24
 DEFAULT_LARGE_IMG_SIZE = 96
 DEFAULT_HINTS = 3
 
-# --- 색상 설정 ---
-COLORS = {
-    1: '#0000FF', 2: '#008200', 3: '#FF0000', 4: '#000084',
-    5: '#840000', 6: '#008284', 7: '#840084', 8: '#000000',
-}
-BG_COLOR_REVEALED = '#D0D0D0'
+# --- 연쇄 열기 그리기 ---
+FRAME_BUDGET_S = 0.008   # 한 번에 위젯을 고치는 최대 시간 (입력이 한 프레임 이상 밀리지 않게)
+RIPPLE_MS = 15           # 물결 효과: 거리 한 층마다 기다리는 시간
+
+# --- 추적 (--trace) ---
+TRACED_METHODS = (
+    'on_left_click', 'on_right_click', 'reveal_cell', 'check_win', 'use_hint',
+    'load_all_assets', 'start_new_game', 'end_game', 'reveal_all_mines',
+    '_drain_draw_queue', '_poll_assets',
+)
+
+# --- 배경 로딩 ---
+ASSET_POLL_MS = 50       # 큐 확인 주기
+ASSET_POLL_BATCH = 20    # 한 번에 처리할 최대 메시지 수 (프레임이 밀리지 않게)
+ROSTER_POOL = 151        # 고를 수 있는 포켓몬 수 (1세대)
 
 
 class MinesweeperGUI:
-    def __init__(self, master):
+    def __init__(self, master, offline_first=False, profile=None, renderer='button', render_stats=False,
+                 no_guess=False, seed=None, record_dir=None, results_db=None, topology=None, language=None):
         self.master = master
+        self.profile = profile or StartupProfile()
+        if TRACER.enabled:
+            # 위젯과 콜백을 만들기 전에 Tcl 호출 세기와 메서드 감싸기를 해 둔다
+            TRACER.install_tcl_counter(master)
+            TRACER.wrap_methods(self, TRACED_METHODS)
+            TRACER.start_lag_probe(master)
         self.master.title("포켓몬 지뢰찾기 FINAL + 타이머")
         self.master.resizable(True, True)
 
@@ -32,6 +73,32 @@ class MinesweeperGUI:
         self.button_size = DEFAULT_BUTTON_SIZE
         self.large_img_size = DEFAULT_LARGE_IMG_SIZE
         self.hints_per_game = DEFAULT_HINTS
+        self.ripple_reveal = False   # 연쇄 열기를 물결처럼 한 층씩 보여줄지
+        self.renderer_name = renderer  # 'button', 'canvas' 또는 'viewport'
+        self.render_stats = render_stats
+        self.renderer = None
+        # 보드 모양 ('square', 'torus', 'hex', 'knight'): 어느 칸이 이웃인지
+        self.topology_name = topology or DEFAULT_TOPOLOGY
+        # 포켓몬 이름 언어 ('ko', 'ja', 'en'). 이름 색인이 있으면 보여 줄 때 바로 찾는다
+        self.language = language or DEFAULT_LANGUAGE
+        # 노게스: 추측 없이 풀리는 보드만 (배경 프로세스에서 미리 만들어 둔 것을 꺼내 씀)
+        self.no_guess = no_guess
+        self.board_pool = None
+        # 판마다 seed를 정해 엔진 난수로 쓴다 (seed가 같으면 같은 첫 클릭에 같은 지뢰 배치)
+        self.next_seed = seed
+        self.seed = None
+        # 동작 기록: record_dir가 있으면 판이 끝날 때 .l530g 파일로 저장
+        self.record_dir = record_dir
+        self.recorder = None
+        # 끝난 판 결과 DB (기록은 배경 스레드가 모아서 씀). False면 쓰지 않음
+        self.results = None
+        if results_db is not False:
+            try:
+                self.results = ResultStore(results_db)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: 게임 결과 DB를 열 수 없습니다: {e}")
+        self.game_started_at = None
+        self.moves = 0
 
         # 타이머 관련
         self.timer_limit = None      # 제한 시간(초), None이면 끔
@@ -40,79 +107,223 @@ class MinesweeperGUI:
         self.timer_running = False   # 타이머 동작 여부
 
         self.images = {}
+        self.image_registry = ImageRegistry()
         self.images_loaded_successfully = False
-        self.load_all_assets()
+        # 스프라이트 디스크 캐시 (offline_first면 캐시에 있는 것만으로 시작)
+        self.sprite_cache = SpriteCache()
+        self.offline_first = offline_first
+        # 미리 만든 스프라이트 아틀라스가 있으면 네트워크 대신 사용
+        self.atlas = SpriteAtlas.open_default()
+        # 묶어 둔 다국어 이름 색인이 있으면 이름을 받으려고 species 요청을 보내지 않는다
+        self.names = NameIndex.open_default()
+        # 색인이 아직 없으면 (설치 직후 첫 실행) 첫 스프라이트 로딩이 끝난 뒤 배경에서 만들어
+        # 두고 다음 명단부터 쓴다 (첫 화면의 요청과 연결을 나눠 쓰지 않게)
+        self.names_pending = self.names is None and not offline_first
+        self.names_builder = None
+
+        # 배경 로딩 관련 (결과는 큐로 받아 after()로 처리)
+        self.asset_queue = queue.Queue()
+        self.asset_loader = None
+        self.asset_generation = 0
+        self.asset_poll_job = None
+        self.assets_loading = False
+        self.assets_total = None
+        # 판마다 바꿀 다음 포켓몬 명단 (지금 판을 하는 동안 배경에서 받아 둠)
+        self.roster_prefetcher = RosterPrefetcher(self._make_roster_loader, pool_size=ROSTER_POOL)
+
+        # 연쇄 열기 그리기 대기열: [칸 목록, 다음 위치] (한 프레임씩 나눠서 그림)
+        self.draw_queue = deque()
+        self.draw_job = None
 
         self.create_widgets()
+        self.profile.mark("위젯 구성")
+        self.load_all_assets()
+        self.profile.mark("자원 로딩 시작")
         self.start_new_game()
+        self.profile.mark("보드 생성")
 
     # ---------------- 자원 로딩 -----------------
-    def _load_image_from_url(self, url, size):
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            img_data = response.content
-            img = Image.open(BytesIO(img_data)).resize(size, Image.Resampling.LANCZOS)
-            return ImageTk.PhotoImage(img)
-        except Exception as e:
-            print(f"Warning: Could not load image from {url}: {e}")
-            return None
+    def _refresh_tile_images(self):
+        """현재 타일 크기에 맞는 기본 이미지(수풀/빈칸/깃발)를 저장소에서 꺼낸다."""
+        self.image_registry.add_solid('bush', (34, 177, 76, 255))
+        self.image_registry.add_solid('blank', (0, 0, 0, 0))
+        # 마스터볼 아이콘이 오기 전까지는 빨간 칸으로 깃발 표시
+        self.image_registry.add_solid('flag-placeholder', (220, 40, 40, 255))
+        self.images['bush'] = self.image_registry.photo('bush', self.button_size)
+        self.images['blank'] = self.image_registry.photo('blank', self.button_size)
+        self.images['flag'] = (
+            self.image_registry.photo('flag', self.button_size)
+            or self.image_registry.photo('flag-placeholder', self.button_size)
+        )
 
     def load_all_assets(self):
-        """게임에 필요한 모든 이미지를 준비하고, 한글 이름을 가져옵니다."""
-        # 버튼 기본 이미지들
-        self.images['bush'] = ImageTk.PhotoImage(
-            Image.new('RGBA', (self.button_size, self.button_size), (34, 177, 76, 255))
+        """포켓몬 이미지/한글 이름 로딩을 배경 스레드에서 시작합니다.
+
+        결과는 _poll_assets가 Tk 루프에서 받아 보드에 붙입니다. 이전 로딩이
+        아직 진행 중이면 취소합니다.
+        """
+        # 포켓몬 목록은 (스프라이트 키, 한글 이름); 크기별 이미지는 필요할 때 만든다
+        self.images['pokemon'] = []
+        self.images_loaded_successfully = False
+        self._refresh_tile_images()
+        self._start_asset_loader(self.num_mines)
+
+    def load_more_pokemon(self):
+        """지뢰 수가 늘었을 때 모자란 포켓몬만 더 받는다 (이미 받은 포켓몬과 깃발은 다시 받지 않음)."""
+        if self.assets_loading and self.assets_total is not None and self.assets_total >= self.num_mines:
+            return  # 진행 중인 로딩이 이미 충분히 받는 중
+        have = self.images['pokemon']
+        missing = self.num_mines - len(have)
+        if missing <= 0:
+            return
+        self._start_asset_loader(
+            missing,
+            exclude=[key.split('/')[-1] for key, _ in have],
+            with_flag=not self.image_registry.has('flag'),
         )
-        self.images['blank'] = ImageTk.PhotoImage(
-            Image.new('RGBA', (self.button_size, self.button_size), (0, 0, 0, 0))
+
+    def _start_asset_loader(self, count, exclude=(), with_flag=True):
+        if self.asset_loader is not None:
+            self.asset_loader.cancel()
+        self.asset_generation += 1
+        self.assets_loading = True
+        self.assets_total = None
+
+        self.asset_loader = AssetLoader(
+            self.asset_generation,
+            count,
+            self.asset_queue,
+            random.Random(),
+            atlas=self.atlas,
+            cache=self.sprite_cache,
+            offline_first=self.offline_first,
+            exclude=exclude,
+            with_flag=with_flag,
+            names=self.names,
+            language=self.language,
         )
-        self.images['flag'] = self._load_image_from_url(
-            "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/items/master-ball.png",
-            (self.button_size, self.button_size)
+        self.asset_load_started = time.perf_counter()
+        self.asset_loader.start()
+        self.update_progress_label()
+        self._schedule_asset_poll()
+
+    def _on_names_built(self, names):
+        # 색인 스레드에서 불린다. 큐로 넘겨 Tk 메인 스레드의 _poll_assets에서 바꾼다
+        # (로드 번호와 상관없이 적용하므로 번호 자리는 None)
+        self.asset_queue.put((None, 'names', names))
+
+    def _build_names_if_missing(self):
+        if self.names_pending:
+            self.names_pending = False
+            self.names_builder = build_in_background(self._on_names_built)
+            self._schedule_asset_poll()
+
+    def _schedule_asset_poll(self):
+        if self.asset_poll_job is None:
+            self.asset_poll_job = self.master.after(ASSET_POLL_MS, self._poll_assets)
+
+    def _make_roster_loader(self, generation, count, results, exclude):
+        return AssetLoader(
+            generation, count, results, random.Random(),
+            atlas=self.atlas, cache=self.sprite_cache, offline_first=self.offline_first,
+            exclude=exclude, with_flag=False, names=self.names, language=self.language,
         )
 
-        # 포켓몬 이미지/이름
-        self.images['pokemon'] = []
-        try:
-            response = requests.get("https://pokeapi.co/api/v2/pokemon?limit=151")
-            response.raise_for_status()
-            pokemon_list = response.json()['results']
-
-            count = min(self.num_mines, len(pokemon_list))
-            selected_pokemon = random.sample(pokemon_list, count)
-
-            for pokemon in selected_pokemon:
-                poke_id = pokemon['url'].split('/')[-2]
-
-                # 한글 이름 가져오기
-                kor_name = pokemon['name'].capitalize()
-                try:
-                    species_res = requests.get(f"https://pokeapi.co/api/v2/pokemon-species/{poke_id}")
-                    species_res.raise_for_status()
-                    species_data = species_res.json()
-                    for name_entry in species_data['names']:
-                        if name_entry['language']['name'] == 'ko':
-                            kor_name = name_entry['name']
-                            break
-                except requests.exceptions.RequestException as e:
-                    print(f"Could not fetch Korean name for {poke_id}: {e}")
-
-                # 이미지 가져오기
-                url = f"https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/{poke_id}.png"
-                small_img = self._load_image_from_url(url, (self.button_size, self.button_size))
-                large_img = self._load_image_from_url(url, (self.large_img_size, self.large_img_size))
-
-                if small_img and large_img:
-                    self.images['pokemon'].append((small_img, large_img, kor_name))
-
-            if len(self.images['pokemon']) == count:
-                self.images_loaded_successfully = True
-            else:
-                self.images_loaded_successfully = False
+    def _prefetch_next_roster(self):
+        """다음 판 명단을 배경에서 받기 시작한다 (남은 포켓몬이 충분하면 지금 명단과 겹치지 않게)."""
+        current = [key.split('/')[-1] for key, _ in self.images['pokemon']]
+        exclude = current if ROSTER_POOL - len(current) >= self.num_mines else ()
+        if self.roster_prefetcher.prefetch(self.num_mines, exclude):
+            self._schedule_asset_poll()
+
+    def _rotate_roster(self):
+        """미리 받아 둔 명단이 있으면 이번 판 명단으로 바꾼다. 없으면 지난 명단을 그대로 쓴다."""
+        if self.assets_loading or not self.images_loaded_successfully:
+            return
+        roster = self.roster_prefetcher.take(self.num_mines)
+        if roster is not None:
+            # 지난 명단의 원본은 버려 메모리에 명단이 쌓이지 않게 한다
+            keep = {key for key, _, _ in roster}
+            for key, _ in self.images['pokemon']:
+                if key not in keep:
+                    self.image_registry.discard(key)
+            for key, _, img in roster:
+                self.image_registry.add_image(key, img)
+            self.images['pokemon'] = [(key, name) for key, name, _ in roster]
+        self._prefetch_next_roster()
+
+    def _poll_assets(self):
+        """배경 로더가 큐에 넣은 결과를 꺼내 처리 (Tk 메인 스레드)."""
+        self.asset_poll_job = None
+        for _ in range(ASSET_POLL_BATCH):
+            try:
+                generation, kind, *payload = self.asset_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'names':
+                # 이후 만드는 로더와 이름 표시가 색인을 쓴다
+                self.names = payload[0]
+                continue
+            if generation != self.asset_generation:
+                continue  # 설정이 바뀌기 전의 로딩 결과
+            if kind == 'start':
+                # 추가로 받는 경우 이미 가진 포켓몬까지 합친 수
+                self.assets_total = len(self.images['pokemon']) + payload[0]
+            elif kind == 'flag':
+                self._on_flag_loaded(payload[0])
+            elif kind == 'pokemon':
+                self._on_pokemon_loaded(*payload)
+            elif kind == 'done':
+                self._on_assets_done(*payload)
+            self.update_progress_label()
+        self.roster_prefetcher.poll(ASSET_POLL_BATCH)
+
+        names_building = self.names_builder is not None and self.names_builder.is_alive()
+        if self.assets_loading or not self.asset_queue.empty() or self.roster_prefetcher.busy or names_building:
+            self.asset_poll_job = self.master.after(ASSET_POLL_MS, self._poll_assets)
+
+    def _on_flag_loaded(self, img):
+        self.image_registry.add_image('flag', img)
+        self._refresh_tile_images()
+        # 이미 꽂아 둔 깃발도 새 아이콘으로 바꾼다
+        for i, flagged in enumerate(self.engine.flagged):
+            if flagged:
+                self.renderer.draw_flag(*self.engine.coords(i), True)
+
+    def _on_pokemon_loaded(self, key, kor_name, img):
+        if not self.image_registry.has(key):
+            self.image_registry.add_image(key, img)
+        mine = (key, kor_name)
+        self.images['pokemon'].append(mine)
+
+        # 게임이 이미 시작됐다면 아직 'P'인 지뢰 칸에 붙인다
+        if self.engine.started:
+            self.engine.attach_pokemon(mine)
+
+    def _on_assets_done(self, loaded, total):
+        self.assets_loading = False
+        self.assets_total = total
+        self.images_loaded_successfully = loaded == total and bool(self.images['pokemon'])
+        self.profile.assets_loaded(time.perf_counter() - self.asset_load_started, loaded, total)
+        if self.images_loaded_successfully:
+            self._prefetch_next_roster()
+            self._build_names_if_missing()
+        else:
+            messagebox.showwarning(
+                "네트워크 오류",
+                "포켓몬 이미지를 불러오지 못했습니다. 지뢰는 텍스트('P')로 표시됩니다."
+            )
 
-        except requests.exceptions.RequestException:
-            self.images_loaded_successfully = False
+    def update_progress_label(self):
+        if self.assets_loading:
+            loaded = len(self.images.get('pokemon', []))
+            total = self.assets_total if self.assets_total is not None else '?'
+            text = f"포켓몬 불러오는 중: {loaded}/{total}"
+        elif not self.images_loaded_successfully:
+            text = "포켓몬: 'P' 모드"
+        else:
+            text = ""
+        self.progress_label.config(text=text)
 
     # ---------------- 위젯 구성 -----------------
     def create_widgets(self):
@@ -129,10 +340,17 @@ class MinesweeperGUI:
         self.hint_button = tk.Button(self.top_frame, text="힌트 사용", command=self.use_hint)
         self.hint_button.pack(side=tk.LEFT, padx=5)
 
+        # 포켓몬 로딩 진행 표시
+        self.progress_label = tk.Label(self.top_frame, text="", font=('Helvetica', 10), fg='#555555')
+        self.progress_label.pack(side=tk.LEFT, padx=10)
+
         # 오른쪽 버튼들
         self.settings_button = tk.Button(self.top_frame, text="설정", command=self.open_settings_window)
         self.settings_button.pack(side=tk.RIGHT, padx=5)
 
+        self.results_button = tk.Button(self.top_frame, text="기록", command=self.open_results_window)
+        self.results_button.pack(side=tk.RIGHT, padx=5)
+
         self.timer_button = tk.Button(self.top_frame, text="타이머 설정", command=self.set_timer_limit)
         self.timer_button.pack(side=tk.RIGHT, padx=5)
 
@@ -144,9 +362,11 @@ class MinesweeperGUI:
 
     # ---------------- 게임 로직 -----------------
     def start_new_game(self):
-        # 기존 보드 정리
-        for widget in self.board_frame.winfo_children():
-            widget.destroy()
+        # 아직 못 그린 연쇄 열기는 버린다
+        if self.draw_job is not None:
+            self.master.after_cancel(self.draw_job)
+            self.draw_job = None
+        self.draw_queue.clear()
 
         # 타이머 리셋
         if self.timer_job is not None:
@@ -156,108 +376,118 @@ class MinesweeperGUI:
         self.remaining_time = self.timer_limit
         self.update_timer_label()
 
+        # 게임 상태는 엔진이 들고, 화면은 엔진 이벤트로 다시 그린다
+        self._save_record()
+        self._rotate_roster()
+        self.seed = self.next_seed if self.next_seed is not None else gamelog.new_seed()
+        self.next_seed = None
+        self.engine = GameEngine(self.board_size, self.num_mines, rng=random.Random(self.seed),
+                                 topology=self.topology_name)
+        self.engine.subscribe(self._on_engine_event)
+        # 스마트 힌트: 열린 숫자만 보고 추론 (엔진 이벤트로 제약을 조금씩 갱신)
+        self.solver = MineSolver(self.engine)
+
         self.game_over = False
         self.first_click = True
-        self.flags_placed = 0
+        self.mines_shown = None
+        self.game_started_at = None
+        self.moves = 0
         self.hints_left = self.hints_per_game
         self.hint_button.config(state=tk.NORMAL if self.hints_left > 0 else tk.DISABLED)
 
         self.update_status_label()
+        if self.record_dir is not None:
+            self.recorder = gamelog.GameRecorder(
+                self.board_size, self.num_mines, self.seed, self.timer_limit, self.hints_per_game,
+                topology=self.topology_name,
+            )
 
-        # 버튼(타일) 생성
-        self.buttons = []
-        for r in range(self.board_size):
-            row_buttons = []
-            for c in range(self.board_size):
-                button = tk.Button(
-                    self.board_frame,
-                    width=self.button_size,
-                    height=self.button_size,
-                    image=self.images.get('bush'),
-                    relief=tk.RAISED,
-                    bd=1
-                )
-                button.bind('<Button-1>', lambda e, r=r, c=c: self.on_left_click(r, c))
-                button.bind('<Button-3>', lambda e, r=r, c=c: self.on_right_click(r, c))
-                button.grid(row=r, column=c)
-                row_buttons.append(button)
-            self.buttons.append(row_buttons)
+        if self.no_guess:
+            if self.board_pool is None:
+                self.board_pool = BoardPool()
+            self.board_pool.prefill(self.board_size, self.num_mines, self.topology_name)
+
+        # 보드 그리기 (버튼 또는 캔버스 렌더러)
+        if self.renderer is None or self.renderer.name != self.renderer_name:
+            if self.renderer is not None:
+                self.renderer.destroy()
+            self.renderer = RENDERERS[self.renderer_name](
+                self.board_frame, self.images, self.image_registry,
+                self.on_left_click, self.on_right_click,
+            )
+        elapsed, mem_bytes = measure_build(self.renderer, self.board_size, self.button_size,
+                                           self.engine.topology.shift_odd_rows)
+        if self.render_stats:
+            mem_text = f", 파이썬 메모리 +{mem_bytes / 1024:.1f} KiB" if mem_bytes is not None else ""
+            print(
+                f"[보드] {self.renderer.name} 렌더러: {self.board_size}x{self.board_size}, "
+                f"Tk 객체 {self.renderer.object_count()}개, 재시작 {elapsed * 1000:.1f} ms{mem_text}"
+            )
 
     def _initialize_board(self, safe_row, safe_col):
-        self.mine_board = [[0 for _ in range(self.board_size)] for _ in range(self.board_size)]
-
-        # 첫 클릭 주변(3x3)은 지뢰 금지
-        possible_mine_locations = [
-            (r, c)
-            for r in range(self.board_size)
-            for c in range(self.board_size)
-            if abs(r - safe_row) > 1 or abs(c - safe_col) > 1
-        ]
-
-        max_mines = len(possible_mine_locations)
-        actual_mines = min(self.num_mines, max_mines)
+        # 첫 클릭 칸과 그 이웃(보통 보드는 3x3)은 지뢰 금지; 지금까지 받은 포켓몬을 나눠 주고 모자란 칸은 'P'
+        roster = self.images.get('pokemon', [])
+        mine_cells = None
+        if self.no_guess:
+            mine_cells = self.board_pool.take(self.board_size, self.num_mines, safe_row, safe_col,
+                                              self.topology_name)
+            print(f"[노게스] {self.board_pool.stats.summary()}")
+        if mine_cells is not None:
+            self.engine.load_mines(mine_cells, roster)
+            if self.recorder is not None:
+                # 미리 만든 보드는 seed로 다시 만들 수 없으므로 배치를 직접 기록
+                self.recorder.set_mines(mine_cells)
+        else:
+            if self.no_guess:
+                messagebox.showinfo(
+                    "노게스",
+                    "추측 없이 풀리는 보드가 아직 준비되지 않아 이번 판은 일반 보드로 시작합니다."
+                )
+            self.engine.start(safe_row, safe_col, roster=roster)
+        actual_mines = self.engine.mine_count
         if actual_mines < self.num_mines:
             messagebox.showwarning(
                 "설정 조정",
                 f"현재 보드 크기에서는 지뢰를 최대 {actual_mines}개까지만 놓을 수 있어요.\n"
                 f"지뢰 수를 {actual_mines}개로 조정합니다."
             )
-        self.mines_this_game = actual_mines
-
-        mine_locations = random.sample(possible_mine_locations, actual_mines)
-
-        # 포켓몬 또는 'P'로 지뢰 채우기
-        if self.images_loaded_successfully and len(self.images.get('pokemon', [])) >= actual_mines:
-            mines_to_place = self.images['pokemon'][:actual_mines]
-        else:
-            mines_to_place = ['P'] * actual_mines
-            if not self.images_loaded_successfully:
-                messagebox.showwarning(
-                    "네트워크 오류",
-                    "포켓몬 이미지를 불러오지 못했습니다. 지뢰는 텍스트('P')로 표시됩니다."
-                )
-
-        random.shuffle(mines_to_place)
-
-        for (r, c), mine in zip(mine_locations, mines_to_place):
-            self.mine_board[r][c] = mine
-
-        # 숫자 칸 계산
-        for r in range(self.board_size):
-            for c in range(self.board_size):
-                if isinstance(self.mine_board[r][c], (tuple, str)):
-                    continue
-                count = 0
-                for i in range(-1, 2):
-                    for j in range(-1, 2):
-                        nr, nc = r + i, c + j
-                        if 0 <= nr < self.board_size and 0 <= nc < self.board_size:
-                            cell = self.mine_board[nr][nc]
-                            if isinstance(cell, (tuple, str)):
-                                count += 1
-                self.mine_board[r][c] = count
-
         self.update_status_label()
 
+    def _on_engine_event(self, event, *args):
+        """엔진 상태 변화 -> 바뀐 칸만 다시 그리기."""
+        if event == 'reveal':
+            self._queue_reveal_draw(*args)
+        elif event == 'flag':
+            i, flagged = args
+            self.renderer.draw_flag(*self.engine.coords(i), flagged)
+            self.update_status_label()
+
     # ---------------- 입력 처리 -----------------
     def on_left_click(self, r, c):
+        self._open(r, c, gamelog.LEFT)
+
+    def _open(self, r, c, action):
+        """칸 열기 (클릭과 힌트 공통). action은 기록에 남길 동작."""
         if self.game_over:
             return
-        button = self.buttons[r][c]
-        if button.cget('image') == str(self.images.get('flag')):
+        i = self.engine.index(r, c)
+        if self.engine.is_flagged(i):
             return
+        if self.recorder is not None:
+            self.recorder.record(action, i)
+        self.moves += 1
 
         if self.first_click:
             self._initialize_board(r, c)
             self.first_click = False
+            self.game_started_at = time.perf_counter()
             self.start_timer_if_needed()
 
-        cell_value = self.mine_board[r][c]
-
-        if isinstance(cell_value, (tuple, str)):
+        if self.engine.is_mine(i):
             # 지뢰 클릭 -> 게임 오버
+            self.engine.reveal(i)
             self.reveal_all_mines(loss=True, triggered_cell=(r, c))
-            self.end_game(won=False, mine_data=cell_value)
+            self.end_game(won=False, mine_data=self.engine.pokemon[i])
             return
 
         self.reveal_cell(r, c)
@@ -268,77 +498,100 @@ class MinesweeperGUI:
             self.end_game(won=True)
 
     def on_right_click(self, r, c):
-        if self.game_over or self.buttons[r][c]['state'] == 'disabled':
+        if self.game_over:
             return
-        button = self.buttons[r][c]
-        current_image = button.cget('image')
-
-        if current_image == str(self.images.get('bush')):
-            button.config(image=self.images.get('flag', self.images['blank']))
-            self.flags_placed += 1
-        elif current_image == str(self.images.get('flag')):
-            button.config(image=self.images['bush'])
-            self.flags_placed -= 1
-
-        self.update_status_label()
+        i = self.engine.index(r, c)
+        if self.recorder is not None and not self.engine.is_revealed(i):
+            self.recorder.record(gamelog.FLAG, i)
+        self.engine.toggle_flag(i)
+
+    def _rescale_board(self):
+        """타일 크기만 바뀌었을 때: 위젯/아이템은 그대로 두고 크기를 바꾼 뒤 지금 판을 다시 그린다."""
+        self._refresh_tile_images()
+        self.renderer.rescale(self.button_size)
+        # 못 그린 연쇄 열기도 아래에서 한꺼번에 그린다
+        if self.draw_job is not None:
+            self.master.after_cancel(self.draw_job)
+            self.draw_job = None
+        self.draw_queue.clear()
+        engine = self.engine
+        for i in range(len(engine.mines)):
+            if engine.revealed[i]:
+                self._draw_revealed(*engine.coords(i))
+            elif engine.flagged[i]:
+                self.renderer.draw_flag(*engine.coords(i), True)
+        if self.mines_shown is not None:
+            self.reveal_all_mines(*self.mines_shown)
 
     # ---------------- 셀 공개/체크 -----------------
     def reveal_cell(self, r, c):
-        if not (0 <= r < self.board_size and 0 <= c < self.board_size):
-            return
-        button = self.buttons[r][c]
-        if button['state'] == 'disabled':
-            return
-
-        cell_value = self.mine_board[r][c]
+        """엔진에서 칸을 연다 (0이면 주변까지). 화면은 'reveal' 이벤트로 갱신."""
+        self.engine.reveal(self.engine.index(r, c))
+
+    def _queue_reveal_draw(self, cells, layer_ends):
+        """열린 칸들을 그리기 대기열에 넣는다. 물결 효과면 거리 층마다 따로."""
+        if self.ripple_reveal and len(layer_ends) > 1:
+            start = 0
+            for end in layer_ends:
+                self.draw_queue.append([cells[start:end], 0])
+                start = end
+        else:
+            self.draw_queue.append([cells, 0])
+        if self.draw_job is None:
+            # 첫 프레임 분량은 바로 그려서 클릭 반응이 늦지 않게
+            self._drain_draw_queue()
+
+    def _drain_draw_queue(self):
+        """대기열에서 한 프레임 분량(FRAME_BUDGET_S)만 그리고 나머지는 다음 차례로."""
+        self.draw_job = None
+        deadline = time.perf_counter() + FRAME_BUDGET_S
+        while self.draw_queue:
+            batch = self.draw_queue[0]
+            cells, pos = batch
+            while pos < len(cells):
+                self._draw_revealed(*self.engine.coords(cells[pos]))
+                pos += 1
+                if pos % 16 == 0 and time.perf_counter() > deadline:
+                    break
+            batch[1] = pos
+            if pos < len(cells):
+                self.draw_job = self.master.after(0, self._drain_draw_queue)
+                return
+            self.draw_queue.popleft()
+            if self.ripple_reveal and self.draw_queue:
+                self.draw_job = self.master.after(RIPPLE_MS, self._drain_draw_queue)
+                return
 
-        button.config(state='disabled', relief=tk.SUNKEN, bg=BG_COLOR_REVEALED)
-        if isinstance(cell_value, int) and cell_value > 0:
-            button.config(
-                image=self.images['blank'],
-                text=str(cell_value),
-                font=('Helvetica', 10, 'bold'),
-                fg=COLORS.get(cell_value),
-                compound='center'
-            )
-        elif isinstance(cell_value, int) and cell_value == 0:
-            button.config(image=self.images['blank'], text='')
-            for i in range(-1, 2):
-                for j in range(-1, 2):
-                    self.reveal_cell(r + i, c + j)
+    def _draw_revealed(self, r, c):
+        self.renderer.draw_revealed(r, c, self.engine.counts[self.engine.index(r, c)])
 
     def reveal_all_mines(self, loss=True, triggered_cell=None):
         """게임 종료 시 모든 지뢰를 보여준다.
         loss=True면 패배 연출(분홍색), False면 승리 연출(황금색)을 사용."""
-        if not hasattr(self, 'mine_board'):
-            return
-        for r in range(self.board_size):
-            for c in range(self.board_size):
-                cell_value = self.mine_board[r][c]
-                if isinstance(cell_value, (tuple, str)):
-                    button = self.buttons[r][c]
-                    if isinstance(cell_value, str):  # Fallback 'P'
-                        button.config(
-                            text='P',
-                            image=self.images['blank'],
-                            compound='center',
-                            bg='#FFB6C1' if loss else '#FFFACD'
-                        )
-                    else:  # Pokemon Image Tuple
-                        button.config(
-                            image=cell_value[0],
-                            bg='#FFB6C1' if loss else '#FFFACD'
-                        )
+        self.mines_shown = (loss, triggered_cell)   # 타일 크기를 바꿔 다시 그릴 때 씀
+        bg = BG_COLOR_LOSS if loss else BG_COLOR_WIN
+        for i in self.engine.mine_cells():
+            r, c = self.engine.coords(i)
+            self.renderer.draw_mine(r, c, self.engine.pokemon[i], bg)
 
         # 지뢰를 밟은 칸은 붉게 표시
         if loss and triggered_cell:
             tr, tc = triggered_cell
-            self.buttons[tr][tc].config(bg='red')
+            mine = self.engine.pokemon[self.engine.index(tr, tc)]
+            self.renderer.draw_mine(tr, tc, mine, BG_COLOR_TRIGGERED)
 
     # ---------------- 게임 종료/상태 -----------------
     def end_game(self, won, mine_data=None, reason=None):
         self.game_over = True
         self.hint_button.config(state=tk.DISABLED)
+        self._save_record()
+        if self.results is not None and self.game_started_at is not None:
+            self.results.add(make_row(
+                self.board_size, self.num_mines, won, self.timer_limit, reason,
+                duration_ms=(time.perf_counter() - self.game_started_at) * 1000,
+                moves=self.moves, hints_used=self.hints_per_game - self.hints_left,
+                pokemon=mine_data, seed=self.seed, source=self._results_source(),
+            ))
 
         # 타이머 정지
         self.timer_running = False
@@ -358,9 +611,13 @@ class MinesweeperGUI:
         frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         # 상단 이미지 (패배 + 지뢰 클릭일 때만)
+        # 큰 이미지는 실제로 패배했을 때 처음 만든다
+        large_img = None
         if not won and reason != "timeout" and isinstance(mine_data, tuple):
-            img_label = tk.Label(frame, image=mine_data[1], bg="white")
-            img_label.image = mine_data[1]
+            large_img = self.image_registry.photo(mine_data[0], self.large_img_size)
+        if large_img is not None:
+            img_label = tk.Label(frame, image=large_img, bg="white")
+            img_label.image = large_img
             img_label.pack(pady=(0, 10))
 
         # 메시지 구성
@@ -370,7 +627,7 @@ class MinesweeperGUI:
             if won:
                 message = "축하합니다! 모든 포켓몬을 피했습니다!"
             else:
-                pokemon_name = mine_data[2] if isinstance(mine_data, tuple) else "포켓몬"
+                pokemon_name = self._pokemon_name(mine_data)
                 message = f"이런! 야생의 {pokemon_name}와(과) 마주쳤습니다!"
 
         msg_label = tk.Label(frame, text=message, bg="white", font=("Helvetica", 12))
@@ -390,26 +647,43 @@ class MinesweeperGUI:
         close_btn = tk.Button(btn_frame, text="닫기", command=popup.destroy)
         close_btn.pack(side=tk.LEFT, padx=5)
 
+    def _pokemon_name(self, mine):
+        """지뢰 칸 포켓몬의 이름 (이름 색인이 있으면 지금 고른 언어로, 없으면 받을 때의 이름)."""
+        if not isinstance(mine, tuple):
+            return "포켓몬"
+        if self.names is not None:
+            name = self.names.display_name(mine[0].rsplit('/', 1)[1], self.language)
+            if name:
+                return name
+        return mine[1]
+
+    def _save_record(self):
+        """이번 판 기록을 파일로 저장 (기록 중이고 동작이 하나라도 있을 때만)."""
+        recorder, self.recorder = self.recorder, None
+        if recorder is None or recorder.count == 0:
+            return
+        try:
+            path = recorder.save(self.record_dir)
+        except OSError as e:
+            print(f"Warning: 게임 기록 저장 실패: {e}")
+            return
+        print(f"[기록] {path} (seed {recorder.seed})")
+
     def check_win(self):
-        revealed_count = sum(
-            1
-            for r in range(self.board_size)
-            for c in range(self.board_size)
-            if self.buttons[r][c]['state'] == 'disabled'
-        )
-        total_cells = self.board_size * self.board_size
-        return revealed_count == total_cells - getattr(self, "mines_this_game", self.num_mines)
+        return self.engine.has_won()
 
     def update_status_label(self):
-        remaining_mines = getattr(self, "mines_this_game", self.num_mines) - self.flags_placed
-        remaining_mines = max(remaining_mines, 0)
+        remaining_mines = self.engine.remaining_mines() if hasattr(self, 'engine') else self.num_mines
         self.status_label.config(
             text=f"포켓몬(지뢰): {remaining_mines} / 힌트: {self.hints_left if hasattr(self, 'hints_left') else self.hints_per_game}"
         )
 
     # ---------------- 트위스트: 힌트 기능 -----------------
     def use_hint(self):
-        """아직 열리지 않은 안전한 칸을 하나 자동으로 열어주는 힌트."""
+        """열린 숫자로 안전하다고 증명되는 칸(경계 옆)을 하나 열어주는 힌트.
+
+        그런 칸이 없으면 포켓몬이 있을 확률이 가장 낮은 칸을 권하고, 열기 전에 묻습니다.
+        """
         if self.game_over:
             return
         if self.first_click:
@@ -418,28 +692,68 @@ class MinesweeperGUI:
         if self.hints_left <= 0:
             return
 
-        # 아직 안 열린 안전한 칸 목록
-        safe_cells = []
-        for r in range(self.board_size):
-            for c in range(self.board_size):
-                if self.buttons[r][c]['state'] != 'disabled':
-                    cell_value = self.mine_board[r][c]
-                    if isinstance(cell_value, int):  # 숫자 or 0 이면 안전
-                        safe_cells.append((r, c))
-
-        if not safe_cells:
+        i, risk = self.solver.hint()
+        if i is None:
+            return
+        if risk > 0 and not messagebox.askyesno(
+            "힌트",
+            "지금은 확실히 안전한 칸이 없어요.\n"
+            f"가장 안전한 칸도 포켓몬이 있을 확률이 {risk:.0%}예요. 열어 볼까요?"
+        ):
             return
 
-        r, c = random.choice(safe_cells)
-        self.reveal_cell(r, c)
+        if self.engine.is_flagged(i):
+            if self.recorder is not None:
+                self.recorder.record(gamelog.FLAG, i)
+            self.engine.toggle_flag(i)
         self.hints_left -= 1
         if self.hints_left <= 0:
             self.hint_button.config(state=tk.DISABLED)
         self.update_status_label()
+        # 지뢰/승리 처리는 보통 클릭과 같다
+        self._open(*self.engine.coords(i), gamelog.HINT)
 
-        if self.check_win():
-            self.reveal_all_mines(loss=False)
-            self.end_game(won=True)
+    # ---------------- 최고 기록 -----------------
+    def _results_source(self):
+        return source_name(SOURCE_GAME, self.topology_name)
+
+    def open_results_window(self):
+        """지금 설정(보드 크기, 지뢰 수, 제한 시간, 보드 모양)의 최고 기록과 통계."""
+        win = tk.Toplevel(self.master)
+        win.title("최고 기록")
+        win.transient(self.master)
+
+        timer_text = f"{self.timer_limit}초" if self.timer_limit else "없음"
+        shape_text = "" if self.topology_name == DEFAULT_TOPOLOGY else f" ({TOPOLOGIES[self.topology_name].label})"
+        tk.Label(
+            win, text=f"{self.board_size}x{self.board_size}{shape_text}, 포켓몬 {self.num_mines}, "
+                      f"제한 시간 {timer_text}",
+            font=('Helvetica', 12, 'bold'),
+        ).pack(padx=20, pady=(15, 5))
+
+        if self.results is None:
+            tk.Label(win, text="게임 결과 DB를 쓰지 않는 중입니다.").pack(padx=20, pady=10)
+        else:
+            source = self._results_source()
+            games, wins = self.results.summary(self.board_size, self.num_mines, self.timer_limit, source)
+            best = self.results.leaderboard(self.board_size, self.num_mines, self.timer_limit,
+                                            source=source)
+            win_rate = f" (승률 {wins / games:.0%})" if games else ""
+            tk.Label(win, text=f"{games}판 {wins}승{win_rate}").pack(padx=20)
+
+            table = tk.Frame(win)
+            table.pack(padx=20, pady=10)
+            for col, title in enumerate(("순위", "시간", "힌트", "날짜")):
+                tk.Label(table, text=title, font=('Helvetica', 10, 'bold')).grid(row=0, column=col, padx=8)
+            for n, (duration_ms, played_at, hints_used) in enumerate(best, 1):
+                cells = (n, f"{duration_ms / 1000:.1f}초", hints_used if hints_used is not None else "-",
+                         time.strftime('%Y-%m-%d %H:%M', time.localtime(played_at)))
+                for col, text in enumerate(cells):
+                    tk.Label(table, text=text).grid(row=n, column=col, padx=8)
+            if not best:
+                tk.Label(table, text="아직 이긴 판이 없어요.").grid(row=1, column=0, columnspan=4, pady=5)
+
+        tk.Button(win, text="닫기", command=win.destroy).pack(pady=(0, 15))
 
     # ---------------- 설정창 -----------------
     def open_settings_window(self):
@@ -451,13 +765,13 @@ class MinesweeperGUI:
 
         tk.Label(win, text="보드 크기 (NxN)").grid(row=0, column=0, sticky="w", padx=10, pady=5)
         board_size_var = tk.IntVar(value=self.board_size)
-        tk.Spinbox(win, from_=5, to=20, textvariable=board_size_var, width=5).grid(
+        tk.Spinbox(win, from_=5, to=max(MAX_BOARD_SIZE.values()), textvariable=board_size_var, width=5).grid(
             row=0, column=1, padx=10, pady=5
         )
 
         tk.Label(win, text="포켓몬(지뢰) 수").grid(row=1, column=0, sticky="w", padx=10, pady=5)
         mine_var = tk.IntVar(value=self.num_mines)
-        tk.Spinbox(win, from_=1, to=300, textvariable=mine_var, width=5).grid(
+        tk.Spinbox(win, from_=1, to=board.max_mines(max(MAX_BOARD_SIZE.values())), textvariable=mine_var, width=6).grid(
             row=1, column=1, padx=10, pady=5
         )
 
@@ -473,7 +787,40 @@ class MinesweeperGUI:
             row=3, column=1, padx=10, pady=5
         )
 
-        def apply_settings():
+        ripple_var = tk.BooleanVar(value=self.ripple_reveal)
+        tk.Checkbutton(win, text="연쇄 열기 물결 효과", variable=ripple_var).grid(
+            row=4, column=0, columnspan=2, sticky="w", padx=10, pady=5
+        )
+        no_guess_var = tk.BooleanVar(value=self.no_guess)
+        tk.Checkbutton(win, text="추측 없이 풀리는 보드만 (노게스)", variable=no_guess_var).grid(
+            row=6, column=0, columnspan=2, sticky="w", padx=10, pady=5
+        )
+
+        tk.Label(win, text="보드 그리기").grid(row=5, column=0, sticky="w", padx=10, pady=5)
+        renderer_var = tk.StringVar(value=self.renderer_name)
+        renderer_frame = tk.Frame(win)
+        renderer_frame.grid(row=5, column=1, padx=10, pady=5)
+        tk.Radiobutton(renderer_frame, text="버튼", variable=renderer_var, value='button').pack(side=tk.LEFT)
+        tk.Radiobutton(renderer_frame, text="캔버스", variable=renderer_var, value='canvas').pack(side=tk.LEFT)
+        tk.Radiobutton(renderer_frame, text="스크롤(대형)", variable=renderer_var, value='viewport').pack(side=tk.LEFT)
+
+        tk.Label(win, text="보드 모양").grid(row=7, column=0, sticky="w", padx=10, pady=5)
+        topology_var = tk.StringVar(value=self.topology_name)
+        topology_frame = tk.Frame(win)
+        topology_frame.grid(row=7, column=1, padx=10, pady=5)
+        for topology in TOPOLOGIES.values():
+            tk.Radiobutton(topology_frame, text=topology.label, variable=topology_var,
+                           value=topology.name).pack(side=tk.LEFT)
+
+        tk.Label(win, text="포켓몬 이름").grid(row=8, column=0, sticky="w", padx=10, pady=5)
+        language_var = tk.StringVar(value=self.language)
+        language_frame = tk.Frame(win)
+        language_frame.grid(row=8, column=1, padx=10, pady=5)
+        for code in DISPLAY_LANGUAGES:
+            tk.Radiobutton(language_frame, text=LANGUAGE_LABELS[code], variable=language_var,
+                           value=code).pack(side=tk.LEFT)
+
+        def on_apply():
             try:
                 new_board = int(board_size_var.get())
                 new_mines = int(mine_var.get())
@@ -483,13 +830,16 @@ class MinesweeperGUI:
                 messagebox.showerror("설정 오류", "모든 값은 정수여야 합니다.")
                 return
 
+            # 버튼 렌더러는 위젯 수 때문에 20x20까지, 캔버스는 40x40, 스크롤 뷰포트는 300x300
+            new_renderer = renderer_var.get()
+            max_board = MAX_BOARD_SIZE[new_renderer]
             if new_board < 5:
                 new_board = 5
-            if new_board > 20:
-                new_board = 20
+            if new_board > max_board:
+                new_board = max_board
 
             # 보드 크기에 맞는 최대 지뢰 수 (첫 클릭 주변 3x3 제외)
-            max_mines = max(new_board * new_board - 9, 1)
+            max_mines = board.max_mines(new_board)
             if new_mines > max_mines:
                 messagebox.showwarning(
                     "설정 조정",
@@ -510,23 +860,65 @@ class MinesweeperGUI:
             if new_hints > 10:
                 new_hints = 10
 
-            self.board_size = new_board
-            self.num_mines = new_mines
-            self.button_size = new_tile
-            self.large_img_size = max(new_tile * 3, 72)
-            self.hints_per_game = new_hints
-
-            # 이미지 다시 로딩 후 새 게임 시작
-            self.load_all_assets()
-            self.start_new_game()
+            self.apply_settings(new_board, new_mines, new_tile, new_hints, bool(ripple_var.get()), new_renderer,
+                                bool(no_guess_var.get()), topology_var.get(), language_var.get())
             win.destroy()
 
         btn_frame = tk.Frame(win)
-        btn_frame.grid(row=4, column=0, columnspan=2, pady=10)
+        btn_frame.grid(row=9, column=0, columnspan=2, pady=10)
 
-        tk.Button(btn_frame, text="적용", command=apply_settings).pack(side=tk.LEFT, padx=5)
+        tk.Button(btn_frame, text="적용", command=on_apply).pack(side=tk.LEFT, padx=5)
         tk.Button(btn_frame, text="취소", command=win.destroy).pack(side=tk.LEFT, padx=5)
 
+    def apply_settings(self, new_board, new_mines, new_tile, new_hints, ripple, new_renderer, new_no_guess,
+                       new_topology, new_language):
+        """설정창에서 고른 값(범위는 이미 맞춘 값)을 적용하고 처리한 단계를 돌려준다."""
+        board_changed = (new_board, new_mines, new_renderer, new_no_guess, new_topology) != (
+            self.board_size, self.num_mines, self.renderer_name, self.no_guess, self.topology_name)
+        tile_changed = new_tile != self.button_size
+        hints_delta = new_hints - self.hints_per_game
+        language_changed = new_language != self.language
+
+        self.board_size = new_board
+        self.num_mines = new_mines
+        self.button_size = new_tile
+        self.large_img_size = max(new_tile * 3, 72)
+        self.hints_per_game = new_hints
+        self.ripple_reveal = ripple
+        self.renderer_name = new_renderer
+        self.no_guess = new_no_guess
+        self.topology_name = new_topology
+        self.language = new_language
+
+        # 바뀐 것만큼만 처리한다 (받아 둔 스프라이트는 다시 받지 않음)
+        #   보드 크기/지뢰 수/렌더러/노게스/보드 모양 -> 새 게임 (지뢰가 늘면 모자란 포켓몬만 더 받음)
+        #   타일 크기만 -> 지금 보드를 제자리에서 크기만 바꿔 다시 그림
+        #   힌트/물결 효과/이름 언어만 -> 값만 바꿈 (이름은 보여 줄 때 색인에서 찾음)
+        started = time.perf_counter()
+        if language_changed and self.names is None:
+            # 색인이 없으면 이름이 받을 때 정해지므로, 미리 받아 둔 다음 명단을 새 언어로 다시 받는다
+            self.roster_prefetcher.cancel()
+            self.roster_prefetcher.ready.clear()
+            if self.images_loaded_successfully:
+                self._prefetch_next_roster()
+        if board_changed:
+            self.load_more_pokemon()
+            self.start_new_game()
+            tier = "새 게임"
+        elif tile_changed:
+            self._rescale_board()
+            tier = "타일 크기"
+        else:
+            tier = "값만"
+        if hints_delta and not board_changed:
+            self.hints_left = max(self.hints_left + hints_delta, 0)
+            if not self.game_over:
+                self.hint_button.config(state=tk.NORMAL if self.hints_left > 0 else tk.DISABLED)
+            self.update_status_label()
+        if self.render_stats:
+            print(f"[설정] {tier} 적용 {(time.perf_counter() - started) * 1000:.1f} ms")
+        return tier
+
     # ---------------- 타이머 설정/동작 -----------------
     def set_timer_limit(self):
         """타이머 제한 시간을 초 단위로 설정. 0 또는 취소 시 타이머 끔."""
@@ -543,7 +935,14 @@ class MinesweeperGUI:
         else:
             self.timer_limit = value
 
-        # 새 설정으로 새 게임 시작
+        if self.first_click:
+            # 아직 시작 전인 판이면 보드는 그대로 두고 타이머만 바꾼다
+            self.remaining_time = self.timer_limit
+            self.update_timer_label()
+            if self.recorder is not None:
+                self.recorder.timer_limit = self.timer_limit
+            return
+        # 진행 중인 판은 새 설정으로 새 게임 시작
         self.start_new_game()
 
     def update_timer_label(self):
@@ -578,6 +977,8 @@ class MinesweeperGUI:
         if self.remaining_time <= 0:
             # 시간 초과
             self.timer_running = False
+            if self.recorder is not None:
+                self.recorder.record(gamelog.TIMEOUT)
             self.update_timer_label()
             # 남은 지뢰 표시 후 시간 초과 패배 처리
             self.reveal_all_mines(loss=True)
@@ -589,11 +990,90 @@ class MinesweeperGUI:
 
 
 if __name__ == "__main__":
-    try:
-        from PIL import Image, ImageTk  # noqa: F401
-    except ImportError:
-        messagebox.showerror("라이브러리 필요", "Pillow 라이브러리가 필요합니다: pip install Pillow")
-        exit()
+    import argparse
+    parser = argparse.ArgumentParser(description="포켓몬 지뢰찾기")
+    parser.add_argument(
+        "--offline-first", action="store_true",
+        help="캐시에 있는 스프라이트로 먼저 시작하고, 없는 것만 네트워크에서 받기",
+    )
+    parser.add_argument(
+        "--startup-profile", action="store_true",
+        help="시작 단계별 시간(import, 자원 로딩, 위젯 구성, 첫 화면)을 출력",
+    )
+    parser.add_argument(
+        "--renderer", choices=sorted(RENDERERS), default='button',
+        help="보드 그리기 방식: button(칸마다 버튼), canvas(캔버스 하나), viewport(스크롤, 보이는 칸만)",
+    )
+    parser.add_argument(
+        "--no-guess", action="store_true",
+        help="추측 없이 풀리는 보드만 사용 (배경 프로세스에서 미리 생성)",
+    )
+    parser.add_argument(
+        "--topology", choices=list(TOPOLOGIES), default=DEFAULT_TOPOLOGY,
+        help="보드 모양: square(주변 8칸), torus(가장자리가 이어짐), hex(육각, 6칸), knight(나이트 이동 8칸)",
+    )
+    parser.add_argument(
+        "--language", choices=list(DISPLAY_LANGUAGES), default=DEFAULT_LANGUAGE,
+        help="포켓몬 이름 언어: ko(한국어), ja(일본어), en(영어)",
+    )
+    parser.add_argument(
+        "--trace", metavar="PATH",
+        help="클릭, 연쇄 열기, 자원 로딩(HTTP/크기 조절) 등의 시간을 Chrome trace 파일로 저장하고 요약 출력",
+    )
+    parser.add_argument(
+        "--render-stats", action="store_true",
+        help="새 게임마다 보드 생성 시간과 Tk 객체 수, 파이썬 메모리 증가량을 출력",
+    )
+    parser.add_argument(
+        "--results-db", metavar="PATH",
+        help="끝난 판 결과를 쌓을 SQLite 파일 (기본 ~/.local/share/line530/results.sqlite3)",
+    )
+    parser.add_argument(
+        "--no-results", action="store_true",
+        help="끝난 판 결과를 저장하지 않음",
+    )
+    parser.add_argument(
+        "--seed", type=int,
+        help="첫 판의 지뢰 배치 seed (같은 seed와 같은 첫 클릭이면 같은 보드)",
+    )
+    parser.add_argument(
+        "--record", metavar="DIR", nargs="?", const="",
+        help="판마다 동작을 .l530g 파일로 기록 (DIR 생략 시 ~/.local/state/line530/games). "
+             "재생: python -m line530.gamelog 파일",
+    )
+    args = parser.parse_args()
+    if args.render_stats:
+        import tracemalloc
+        tracemalloc.start()
+
+    if args.trace:
+        TRACER.enable()
+
+    profile = StartupProfile(_STARTED_AT, enabled=args.startup_profile)
+    profile.mark("import", at=_IMPORTED_AT)
     root = tk.Tk()
-    game = MinesweeperGUI(root)
+    profile.mark("Tk 초기화")
+    game = MinesweeperGUI(
+        root,
+        offline_first=args.offline_first,
+        profile=profile,
+        renderer=args.renderer,
+        render_stats=args.render_stats,
+        no_guess=args.no_guess,
+        seed=args.seed,
+        topology=args.topology,
+        language=args.language,
+        record_dir=None if args.record is None else (args.record or gamelog.default_log_dir()),
+        results_db=False if args.no_results else args.results_db,
+    )
+    root.after_idle(profile.first_paint)
     root.mainloop()
+    game._save_record()
+    if game.results is not None:
+        game.results.close()
+    if game.board_pool is not None:
+        game.board_pool.shutdown()
+    if args.trace:
+        TRACER.write(args.trace)
+        TRACER.print_summary()
+        print(f"[추적] {args.trace} 저장 (chrome://tracing 또는 ui.perfetto.dev에서 열기)")